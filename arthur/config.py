@@ -5,9 +5,63 @@ Central configuration for all infrastructure endpoints and settings
 
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Literal
+from functools import lru_cache
+from typing import Literal, Optional
 import os
 
+# ============================================================================
+# Secrets (ARTHUR/.env)
+# ============================================================================
+
+ENV_FILE = Path("/Users/arthurdell/ARTHUR/.env")
+
+@lru_cache(maxsize=1)
+def env_file_values() -> dict:
+  """ARTHUR/.env parsed once: python-dotenv when installed, else a minimal reader"""
+  if not ENV_FILE.exists():
+    return {}
+  try:
+    from dotenv import dotenv_values
+  except ImportError:
+    pass
+  else:
+    return dotenv_values(ENV_FILE)
+
+  values = {}
+  for line in ENV_FILE.read_text().splitlines():
+    line = line.strip()
+    if not line or line.startswith("#"):
+      continue
+    key, sep, value = line.removeprefix("export ").partition("=")
+    if not sep:
+      continue
+    value = value.strip()
+    if value[:1] in ("'", '"') and value.endswith(value[0]) and len(value) > 1:
+      value = value[1:-1]
+    elif " #" in value:
+      value = value.split(" #", 1)[0].rstrip()
+    values[key.strip()] = value
+  return values
+
+def env_value(name: str, file_key: Optional[str] = None) -> Optional[str]:
+  """
+  A secret from the environment, else from ARTHUR/.env
+
+  Args:
+    name: Environment variable to check first
+    file_key: Key to look up in ARTHUR/.env (default: name)
+  """
+  return os.environ.get(name) or env_file_values().get(file_key or name)
+
+def gemini_api_key() -> str:
+  """GEMINI_API_KEY from the environment or ARTHUR/.env; raises if unset"""
+  key = env_value("GEMINI_API_KEY")
+  if not key:
+    raise ValueError(
+      f"Gemini API key required. Set GEMINI_API_KEY or add it to {ENV_FILE}"
+    )
+  return key
+
 # ============================================================================
 # Infrastructure Endpoints
 # ============================================================================
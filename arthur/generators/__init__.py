@@ -3,7 +3,7 @@
 from .image import ImageGenerator, ImageBackend
 from .video import VideoGenerator, VideoBackend, VideoResult
 from .comfyui import ComfyUIClient, ComfyUIResult
-from .wan26_api import Wan26APIClient, Wan26Result
+from .wan26_api import Wan26APIClient, Wan26PollManager, Wan26Result
 
 __all__ = [
   "ImageGenerator",
@@ -14,5 +14,6 @@ __all__ = [
   "ComfyUIClient",
   "ComfyUIResult",
   "Wan26APIClient",
+  "Wan26PollManager",
   "Wan26Result",
 ]
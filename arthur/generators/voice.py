@@ -7,7 +7,9 @@ Uses SSH to execute F5-TTS on BETA and SCP to retrieve audio files.
 
 import subprocess
 import time
+import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
@@ -79,6 +81,41 @@ class VoiceGenerator:
       logger.error(f"BETA connection check failed: {e}")
       return False
 
+  def _synthesize(self, text: str, timeout: int) -> tuple[str, Optional[str]]:
+    """Run F5-TTS on BETA; returns (remote WAV path, error or None)."""
+    # Generate unique filename on BETA
+    # (uuid suffix keeps concurrent segment requests from colliding)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    remote_filename = f"voice_{timestamp}_{uuid.uuid4().hex[:8]}.wav"
+    remote_path = f"{self.remote_output_dir}/{remote_filename}"
+
+    logger.info(f"Generating voice on BETA: \"{text[:50]}...\"")
+
+    # Execute F5-TTS on BETA
+    # Escape single quotes in text and wrap in single quotes for shell
+    escaped_text = text.replace("'", "'\"'\"'")
+    remote_cmd = f"{self.python_env} {self.tts_script} --no-play --output {remote_path} '{escaped_text}'"
+
+    result = subprocess.run(
+      ["ssh", self.beta_host, remote_cmd],
+      capture_output=True,
+      text=True,
+      timeout=timeout
+    )
+
+    if result.returncode != 0:
+      logger.error(f"F5-TTS failed: {result.stderr}")
+      return remote_path, result.stderr or "Generation failed"
+    return remote_path, None
+
+  def _remove_remote(self, remote_path: str):
+    """Delete a generated file on BETA."""
+    subprocess.run(
+      ["ssh", self.beta_host, "rm", "-f", remote_path],
+      capture_output=True,
+      timeout=10
+    )
+
   def generate(
     self,
     text: str,
@@ -107,36 +144,15 @@ class VoiceGenerator:
         error="Text too short (min 3 characters)"
       )
 
-    # Generate unique filename on BETA
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    remote_filename = f"voice_{timestamp}.wav"
-    remote_path = f"{self.remote_output_dir}/{remote_filename}"
-
-    logger.info(f"Generating voice on BETA: \"{text[:50]}...\"")
-
-    # Execute F5-TTS on BETA
-    # Escape single quotes in text and wrap in single quotes for shell
-    escaped_text = text.replace("'", "'\"'\"'")
-    remote_cmd = f"{self.python_env} {self.tts_script} --no-play --output {remote_path} '{escaped_text}'"
-
-    ssh_cmd = ["ssh", self.beta_host, remote_cmd]
-
     try:
-      result = subprocess.run(
-        ssh_cmd,
-        capture_output=True,
-        text=True,
-        timeout=timeout
-      )
-
-      if result.returncode != 0:
-        logger.error(f"F5-TTS failed: {result.stderr}")
+      remote_path, error = self._synthesize(text, timeout)
+      if error:
         return VoiceResult(
           success=False,
           path=None,
           text=text,
           generation_time=time.time() - start_time,
-          error=result.stderr or "Generation failed"
+          error=error
         )
 
       # Transfer file back to ALPHA using cat over SSH (more reliable than scp)
@@ -171,12 +187,7 @@ class VoiceGenerator:
           error=f"File transfer error: {e}"
         )
 
-      # Cleanup remote file
-      subprocess.run(
-        ["ssh", self.beta_host, "rm", "-f", remote_path],
-        capture_output=True,
-        timeout=10
-      )
+      self._remove_remote(remote_path)
 
       generation_time = time.time() - start_time
       file_size = output_path.stat().st_size if output_path.exists() else 0
@@ -210,35 +221,156 @@ class VoiceGenerator:
         error=str(e)
       )
 
+  def generate_muxed(
+    self,
+    text: str,
+    video_path: Path,
+    output_path: Path,
+    timeout: int = 90,
+    audio_offset: float = 0.0
+  ) -> VoiceResult:
+    """
+    Generate speech and mux it straight onto a video, with no local WAV.
+
+    The WAV produced on BETA is streamed over SSH into ffmpeg's stdin,
+    skipping the local write + re-read that generate() followed by
+    mux_audio() costs.
+
+    Args:
+      text: Text to convert to speech
+      video_path: Video to add the narration to
+      output_path: Path for output video with audio
+      timeout: Timeout in seconds for generation
+      audio_offset: Delay audio start in seconds (default 0)
+
+    Returns:
+      VoiceResult whose path is the muxed video
+    """
+    start_time = time.time()
+
+    if not text or len(text.strip()) < 3:
+      return VoiceResult(
+        success=False,
+        path=None,
+        text=text,
+        error="Text too short (min 3 characters)"
+      )
+
+    try:
+      remote_path, error = self._synthesize(text, timeout)
+      if error:
+        return VoiceResult(
+          success=False,
+          path=None,
+          text=text,
+          generation_time=time.time() - start_time,
+          error=error
+        )
+
+      # The WAV on BETA is removed whether or not the mux succeeds
+      try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        cat_proc = subprocess.Popen(
+          ["ssh", self.beta_host, "cat", remote_path],
+          stdout=subprocess.PIPE,
+          stderr=subprocess.PIPE
+        )
+        mux_result = None
+        try:
+          mux_result = subprocess.run(
+            _mux_command(video_path, "pipe:0", output_path, audio_offset),
+            stdin=cat_proc.stdout,
+            capture_output=True,
+            timeout=timeout
+          )
+        finally:
+          cat_proc.stdout.close()
+          # ffmpeg timed out or raised: don't leave ssh streaming
+          if mux_result is None:
+            cat_proc.kill()
+          cat_proc.wait(timeout=60)
+      finally:
+        self._remove_remote(remote_path)
+
+      if cat_proc.returncode != 0 or mux_result.returncode != 0:
+        stderr = (cat_proc.stderr.read() if cat_proc.returncode != 0 else mux_result.stderr).decode()
+        logger.error(f"Streaming mux failed: {stderr}")
+        return VoiceResult(
+          success=False,
+          path=None,
+          text=text,
+          generation_time=time.time() - start_time,
+          error=f"Streaming mux failed: {stderr}"
+        )
+
+      generation_time = time.time() - start_time
+      file_size = output_path.stat().st_size if output_path.exists() else 0
+      logger.info(f"Voice muxed: {output_path} ({file_size} bytes, {generation_time:.1f}s)")
+
+      return VoiceResult(
+        success=True,
+        path=output_path,
+        text=text,
+        generation_time=generation_time,
+        file_size=file_size
+      )
+
+    except subprocess.TimeoutExpired:
+      logger.error(f"Voice generation timed out after {timeout}s")
+      return VoiceResult(
+        success=False,
+        path=None,
+        text=text,
+        generation_time=time.time() - start_time,
+        error=f"Timeout after {timeout}s"
+      )
+    except Exception as e:
+      logger.error(f"Voice generation error: {e}")
+      return VoiceResult(
+        success=False,
+        path=None,
+        text=text,
+        generation_time=time.time() - start_time,
+        error=str(e)
+      )
+
   def generate_narration(
     self,
     segments: list[str],
     output_dir: Path,
-    prefix: str = "narration"
+    prefix: str = "narration",
+    concurrency: int = 1
   ) -> list[VoiceResult]:
     """
     Generate multiple narration segments.
 
+    Each segment is an independent SSH round-trip to BETA, so with
+    concurrency > 1 several are in flight at once. Results keep segment
+    order regardless of completion order.
+
     Args:
       segments: List of text segments to convert to speech
       output_dir: Directory to save WAV files
       prefix: Filename prefix for segments
+      concurrency: Maximum simultaneous generations on BETA
 
     Returns:
       List of VoiceResult for each segment
     """
-    results = []
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for i, text in enumerate(segments, 1):
+    def generate_segment(indexed: tuple[int, str]) -> VoiceResult:
+      i, text = indexed
       output_path = output_dir / f"{prefix}_{i:03d}.wav"
       logger.info(f"Generating segment {i}/{len(segments)}")
 
       result = self.generate(text, output_path)
-      results.append(result)
-
       if not result.success:
         logger.warning(f"Segment {i} failed: {result.error}")
+      return result
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+      results = list(pool.map(generate_segment, enumerate(segments, 1)))
 
     successful = sum(1 for r in results if r.success)
     logger.info(f"Narration complete: {successful}/{len(segments)} segments")
@@ -246,6 +378,32 @@ class VoiceGenerator:
     return results
 
 
+def _mux_command(
+  video_path: Path,
+  audio_input: str,
+  output_path: Path,
+  audio_offset: float = 0.0
+) -> list[str]:
+  """ffmpeg command copying video and encoding audio_input (a path or pipe:0) to AAC."""
+  cmd = [
+    "ffmpeg", "-y",
+    "-i", str(video_path),
+    "-i", audio_input,
+    "-c:v", "copy",
+    "-c:a", "aac",
+    "-b:a", "192k",
+    "-map", "0:v",
+    "-map", "1:a",
+  ]
+
+  # Add audio delay if specified
+  if audio_offset > 0:
+    cmd.extend(["-af", f"adelay={int(audio_offset * 1000)}|{int(audio_offset * 1000)}"])
+
+  cmd.append(str(output_path))
+  return cmd
+
+
 def mux_audio(
   video_path: Path,
   audio_path: Path,
@@ -269,22 +427,7 @@ def mux_audio(
   """
   output_path.parent.mkdir(parents=True, exist_ok=True)
 
-  cmd = [
-    "ffmpeg", "-y",
-    "-i", str(video_path),
-    "-i", str(audio_path),
-    "-c:v", "copy",
-    "-c:a", "aac",
-    "-b:a", "192k",
-    "-map", "0:v",
-    "-map", "1:a",
-  ]
-
-  # Add audio delay if specified
-  if audio_offset > 0:
-    cmd.extend(["-af", f"adelay={int(audio_offset * 1000)}|{int(audio_offset * 1000)}"])
-
-  cmd.append(str(output_path))
+  cmd = _mux_command(video_path, str(audio_path), output_path, audio_offset)
 
   logger.info(f"Muxing video + audio: {output_path}")
   subprocess.run(cmd, check=True, capture_output=True)
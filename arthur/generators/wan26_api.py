@@ -14,6 +14,8 @@ Pricing (as of 2025):
 
 import os
 import time
+import asyncio
+import random
 import logging
 import httpx
 from pathlib import Path
@@ -273,7 +275,8 @@ class Wan26APIClient:
     multi_shot: bool = False,
     negative_prompt: Optional[str] = None,
     seed: Optional[int] = None,
-    prompt_extend: bool = True
+    prompt_extend: bool = True,
+    webhook_url: Optional[str] = None
   ) -> Wan26Result:
     """
     Generate video from text prompt
@@ -288,6 +291,7 @@ class Wan26APIClient:
       negative_prompt: What to avoid in generation
       seed: Reproducibility seed (0-2147483647)
       prompt_extend: Auto-extend short prompts
+      webhook_url: Endpoint PiAPI notifies on completion (skips polling)
 
     Returns:
       Wan26Result with task_id for status checking
@@ -308,7 +312,25 @@ class Wan26APIClient:
     if seed is not None:
       input_params["seed"] = seed
 
-    return self._submit_task(Wan26TaskType.TEXT_TO_VIDEO, input_params)
+    return self._submit_task(
+      Wan26TaskType.TEXT_TO_VIDEO, input_params, webhook_url=webhook_url
+    )
+
+  def text_to_video_batch(self, requests: list[dict]) -> list[Wan26Result]:
+    """
+    Submit several text-to-video tasks up front
+
+    PiAPI has no multi-task submit endpoint, so this issues one POST per
+    request, but all of them reuse this client's keep-alive connection
+    and none waits on a previous task's generation.
+
+    Args:
+      requests: text_to_video keyword arguments, one dict per task
+
+    Returns:
+      Wan26Result per request, in the same order
+    """
+    return [self.text_to_video(**params) for params in requests]
 
   def image_to_video(
     self,
@@ -429,23 +451,31 @@ class Wan26APIClient:
     self,
     task_id: str,
     timeout: int = 300,
-    poll_interval: int = 5
+    poll_interval: float = 2.0,
+    max_poll_interval: float = 60.0
   ) -> Optional[str]:
     """
     Wait for task completion and return video URL
 
+    Polls with exponential backoff: the interval starts at poll_interval,
+    doubles after each check up to max_poll_interval, and is jittered by
+    ±20% so concurrent waiters don't hit the status endpoint in lockstep.
+
     Args:
       task_id: Task ID to monitor
       timeout: Max wait time in seconds
-      poll_interval: Seconds between status checks
+      poll_interval: Initial seconds between status checks
+      max_poll_interval: Upper bound on seconds between status checks
 
     Returns:
       Video URL if successful, None if failed/timeout
     """
     start_time = time.time()
+    deadline = start_time + timeout
+    interval = poll_interval
     logger.info(f"Waiting for task {task_id} (timeout: {timeout}s)")
 
-    while time.time() - start_time < timeout:
+    while time.time() < deadline:
       status = self.get_task_status(task_id)
       elapsed = int(time.time() - start_time)
 
@@ -457,11 +487,51 @@ class Wan26APIClient:
         logger.error(f"Task {task_id} failed: {status.get('error', 'unknown')}")
         return None
 
-      time.sleep(poll_interval)
+      remaining = deadline - time.time()
+      if remaining <= 0:
+        break
+      time.sleep(min(interval * random.uniform(0.8, 1.2), remaining))
+      interval = min(max_poll_interval, interval * 2)
 
     logger.warning(f"Task {task_id} timed out after {timeout}s")
     return None
 
+  DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+  def _stream_to_file(self, url: str, output_path: Path, timeout: float) -> int:
+    """
+    Stream a URL to disk in fixed-size chunks
+
+    Writes to a .part file and renames on success so a partial download
+    never masquerades as a finished video. Raises IOError if the byte
+    count disagrees with Content-Length (skipped for encoded responses,
+    where the header counts compressed bytes).
+
+    Returns:
+      Number of bytes written
+    """
+    part_path = output_path.with_name(output_path.name + ".part")
+    written = 0
+    try:
+      with httpx.stream("GET", url, timeout=timeout) as response:
+        response.raise_for_status()
+        expected = response.headers.get("Content-Length")
+        # iter_bytes() yields decoded bytes; Content-Length is the wire size
+        if response.headers.get("Content-Encoding"):
+          expected = None
+        with open(part_path, "wb") as f:
+          for chunk in response.iter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            written += len(chunk)
+
+      if expected is not None and int(expected) != written:
+        raise IOError(f"Incomplete download: {written}/{expected} bytes")
+
+      part_path.replace(output_path)
+      return written
+    finally:
+      part_path.unlink(missing_ok=True)
+
   def download_video(
     self,
     task_id: str,
@@ -491,20 +561,15 @@ class Wan26APIClient:
     try:
       # Download video
       logger.info(f"Downloading video from task {task_id}")
-      response = httpx.get(video_url, timeout=120.0)
-      response.raise_for_status()
-
       output_path.parent.mkdir(parents=True, exist_ok=True)
-      output_path.write_bytes(response.content)
-      logger.info(f"Video saved to {output_path} ({len(response.content) / 1e6:.1f}MB)")
+      size = self._stream_to_file(video_url, output_path, timeout=120.0)
+      logger.info(f"Video saved to {output_path} ({size / 1e6:.1f}MB)")
 
       # Download audio if available and requested
       audio_url = status.get("audio_url")
       if include_audio and audio_url:
         audio_path = output_path.with_suffix(".audio.mp3")
-        audio_response = httpx.get(audio_url, timeout=60.0)
-        audio_response.raise_for_status()
-        audio_path.write_bytes(audio_response.content)
+        self._stream_to_file(audio_url, audio_path, timeout=60.0)
         logger.info(f"Audio saved to {audio_path}")
 
       return True
@@ -531,3 +596,101 @@ class Wan26APIClient:
 
   def __exit__(self, exc_type, exc_val, exc_tb):
     self.close()
+
+
+class Wan26PollManager:
+  """
+  One background poller shared by every outstanding Wan 2.6 task
+
+  PiAPI has no multi-task status endpoint, so each sweep still checks
+  every pending task, but a single task does it serially on the client's
+  keep-alive connection. N concurrent waiters no longer run N independent
+  polling loops with their own timers, and duplicate waits on the same
+  task share one status check.
+
+  Usage:
+    poller = Wan26PollManager(client)
+    status = await poller.wait(task_id, timeout=300)
+  """
+
+  TERMINAL_STATUSES = ("Completed", "completed", "Failed", "failed")
+
+  def __init__(self, client: Wan26APIClient, interval: float = 5.0):
+    self.client = client
+    self.interval = interval
+    # Both keyed by task_id and kept until the task's last waiter leaves
+    self.pending: dict[str, asyncio.Event] = {}
+    self.waiters: dict[str, int] = {}
+    self.results: dict[str, dict] = {}
+    self._task: Optional[asyncio.Task] = None
+
+  def register(self, task_id: str) -> asyncio.Event:
+    """Event set once task_id reaches a terminal status; pair with release()"""
+    event = self.pending.setdefault(task_id, asyncio.Event())
+    self.waiters[task_id] = self.waiters.get(task_id, 0) + 1
+    if not event.is_set() and (self._task is None or self._task.done()):
+      self._task = asyncio.create_task(self._loop())
+    return event
+
+  def release(self, task_id: str) -> Optional[dict]:
+    """
+    Drop one waiter on task_id
+
+    The task stops being polled, and its result is forgotten, only when
+    the last waiter leaves.
+
+    Returns:
+      Final status dict, or None if the task hasn't finished
+    """
+    self.waiters[task_id] -= 1
+    if self.waiters[task_id] > 0:
+      return self.results.get(task_id)
+    del self.waiters[task_id]
+    self.pending.pop(task_id, None)
+    return self.results.pop(task_id, None)
+
+  async def wait(self, task_id: str, timeout: int = 300) -> dict:
+    """
+    Wait for a task through the shared poller
+
+    Returns:
+      Final status dict, or {"status": "timeout"} if the deadline passed
+    """
+    event = self.register(task_id)
+    try:
+      await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:
+      pass
+    finally:
+      result = self.release(task_id)
+
+    if result is None:
+      logger.warning(f"Task {task_id} timed out after {timeout}s")
+      return {"status": "timeout", "error": f"Timeout after {timeout}s"}
+    return result
+
+  def _sweep(self, task_ids: list[str]) -> dict[str, dict]:
+    return {task_id: self.client.get_task_status(task_id) for task_id in task_ids}
+
+  def _unfinished(self) -> list[str]:
+    return [task_id for task_id, event in self.pending.items() if not event.is_set()]
+
+  async def _loop(self):
+    task_ids = self._unfinished()
+    while task_ids:
+      statuses = await asyncio.to_thread(self._sweep, task_ids)
+      for task_id, status in statuses.items():
+        # Waiters that timed out meanwhile have already dropped the task
+        event = self.pending.get(task_id)
+        if status.get("status") in self.TERMINAL_STATUSES and event is not None:
+          self.results[task_id] = status
+          event.set()
+      task_ids = self._unfinished()
+      if task_ids:
+        await asyncio.sleep(self.interval)
+        task_ids = self._unfinished()
+
+  def close(self):
+    """Stop the background poller"""
+    if self._task is not None:
+      self._task.cancel()
@@ -95,6 +95,11 @@ class LinkedInProject(LanceModel):
 class MediaDatabase:
   """LanceDB-powered multi-modal media asset database."""
 
+  # Rows per table write for bulk imports (each write is one Lance fragment)
+  INSERT_BATCH_SIZE = 256
+  # Rows carry the file's bytes, so also flush once a batch holds this much
+  INSERT_BATCH_BYTES = 512 * 1024 * 1024
+
   def __init__(self, db_path: str = DEFAULT_DB_PATH):
     """Initialize database connection.
 
@@ -276,6 +281,29 @@ class MediaDatabase:
     Returns:
         Asset ID (UUID)
     """
+    asset_data = self._build_image_record(
+      image_path, source, generation_prompt, generation_model, content_type,
+      subjects, style_tags, quality_rating, episode_assignments, **kwargs
+    )
+    self.assets_table.add([asset_data])
+    logger.info(f"Added image: {asset_data['filename']} (id={asset_data['id'][:8]}...)")
+
+    return asset_data["id"]
+
+  def _build_image_record(
+    self,
+    image_path: str,
+    source: str,
+    generation_prompt: str = None,
+    generation_model: str = None,
+    content_type: str = None,
+    subjects: List[str] = None,
+    style_tags: List[str] = None,
+    quality_rating: int = None,
+    episode_assignments: List[int] = None,
+    **kwargs
+  ) -> dict:
+    """Read an image and build its asset row (bytes, CLIP embedding, metadata)."""
     path = Path(image_path)
     if not path.exists():
       raise FileNotFoundError(f"Image not found: {image_path}")
@@ -328,10 +356,7 @@ class MediaDatabase:
       "last_used_at": None,
     }
 
-    self.assets_table.add([asset_data])
-    logger.info(f"Added image: {path.name} (id={asset_id[:8]}...)")
-
-    return asset_id
+    return asset_data
 
   def add_video(
     self,
@@ -362,6 +387,33 @@ class MediaDatabase:
     Returns:
         Asset ID (UUID)
     """
+    asset_data = self._build_video_record(
+      video_path, source, generation_prompt, generation_model, content_type,
+      subjects, style_tags, quality_rating, episode_assignments, **kwargs
+    )
+    self.assets_table.add([asset_data])
+    duration = asset_data["duration_seconds"]
+    dur_str = f"{duration:.1f}s" if duration else "unknown"
+    logger.info(
+      f"Added video: {asset_data['filename']} (id={asset_data['id'][:8]}..., duration={dur_str})"
+    )
+
+    return asset_data["id"]
+
+  def _build_video_record(
+    self,
+    video_path: str,
+    source: str,
+    generation_prompt: str = None,
+    generation_model: str = None,
+    content_type: str = None,
+    subjects: List[str] = None,
+    style_tags: List[str] = None,
+    quality_rating: int = None,
+    episode_assignments: List[int] = None,
+    **kwargs
+  ) -> dict:
+    """Read a video and build its asset row (bytes, thumbnail embedding, duration)."""
     path = Path(video_path)
     if not path.exists():
       raise FileNotFoundError(f"Video not found: {video_path}")
@@ -428,11 +480,37 @@ class MediaDatabase:
       "last_used_at": None,
     }
 
-    self.assets_table.add([asset_data])
-    dur_str = f"{duration:.1f}s" if duration else "unknown"
-    logger.info(f"Added video: {path.name} (id={asset_id[:8]}..., duration={dur_str})")
+    return asset_data
+
+  def add_assets(self, records: List[dict]) -> int:
+    """Append prebuilt asset rows in a single table write.
+
+    One write per batch creates one Lance fragment instead of one per file.
+    If the batch write is rejected, the rows are retried one at a time so
+    a single bad record only costs itself.
+
+    Args:
+        records: Rows from _build_image_record / _build_video_record
 
-    return asset_id
+    Returns:
+        Number of rows written
+    """
+    if not records:
+      return 0
+    try:
+      self.assets_table.add(records)
+    except Exception as e:
+      logger.error(f"Batch write of {len(records)} assets failed, retrying one at a time: {e}")
+      written = 0
+      for record in records:
+        try:
+          self.assets_table.add([record])
+          written += 1
+        except Exception as e:
+          logger.error(f"Failed to import {record['filename']}: {e}")
+      return written
+    logger.info(f"Added {len(records)} assets in one batch")
+    return len(records)
 
   def find_similar(self, reference_image: bytes, limit: int = 10, media_type: str = None):
     """Find visually similar assets to a reference image.
@@ -593,6 +671,23 @@ class MediaDatabase:
 
     logger.info(f"Exported {asset['filename']} to {output_path}")
 
+  def filenames(self) -> set:
+    """All stored filenames, reading only the filename column.
+
+    Returns:
+        Set of filenames across every asset (no row limit)
+    """
+    total = self.assets_table.count_rows()
+    if total == 0:
+      return set()
+    try:
+      column = self.assets_table.to_lance().to_table(columns=["filename"]).column("filename")
+    except ImportError:  # pylance not installed; use a projected query instead
+      column = (
+        self.assets_table.search().select(["filename"]).limit(total).to_arrow().column("filename")
+      )
+    return set(column.to_pylist())
+
   def import_directory(
     self,
     dir_path: str,
@@ -625,6 +720,8 @@ class MediaDatabase:
     video_extensions = {'.mp4', '.mov', '.webm', '.avi'}
 
     count = 0
+    batch = []
+    batch_bytes = 0
     for file in path.glob(pattern):
       if not file.is_file():
         continue
@@ -633,26 +730,34 @@ class MediaDatabase:
 
       try:
         if suffix in image_extensions:
-          self.add_image(
+          batch.append(self._build_image_record(
             str(file),
             source=source,
             content_type=content_type,
             subjects=subjects,
             style_tags=style_tags
-          )
-          count += 1
+          ))
         elif suffix in video_extensions:
-          self.add_video(
+          batch.append(self._build_video_record(
             str(file),
             source=source,
             content_type=content_type,
             subjects=subjects,
             style_tags=style_tags
-          )
-          count += 1
+          ))
+        else:
+          continue
+        batch_bytes += batch[-1]["file_size_bytes"]
       except Exception as e:
         logger.error(f"Failed to import {file}: {e}")
 
+      if len(batch) >= self.INSERT_BATCH_SIZE or batch_bytes >= self.INSERT_BATCH_BYTES:
+        count += self.add_assets(batch)
+        batch = []
+        batch_bytes = 0
+
+    count += self.add_assets(batch)
+
     logger.info(f"Imported {count} assets from {dir_path}")
     return count
 
@@ -1,5 +1,21 @@
 """DaVinci Resolve Studio integration"""
 
 from .controller import ResolveController, ResolveError
+from .connect import get_resolve, save_project
+from .manifest import load_manifest, timeline_manifest, write_manifest
+from .render import check_disk_space, remux_passthrough, timeline_is_passthrough, wait_for_render, wait_for_renders
 
-__all__ = ["ResolveController", "ResolveError"]
+__all__ = [
+  "ResolveController",
+  "ResolveError",
+  "get_resolve",
+  "save_project",
+  "load_manifest",
+  "timeline_manifest",
+  "write_manifest",
+  "check_disk_space",
+  "remux_passthrough",
+  "timeline_is_passthrough",
+  "wait_for_render",
+  "wait_for_renders",
+]
@@ -0,0 +1,56 @@
+"""
+Process-wide DaVinci Resolve connection
+
+Importing DaVinciResolveScript and calling scriptapp() costs a module load
+plus an RPC handshake; get_resolve() does both once per process so scripts
+driven back to back (or ResolveController instances) share one handle.
+save_project() is the matching single exit point for the project DB write.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+from .controller import RESOLVE_SCRIPT_PATH, ResolveError
+
+@lru_cache(maxsize=1)
+def get_resolve():
+  """
+  Get the running DaVinci Resolve instance, connecting on first use
+
+  Raises:
+    ResolveError if the scripting module is missing or Resolve isn't running
+    (failures aren't cached, so a later call retries)
+  """
+  if RESOLVE_SCRIPT_PATH not in sys.path:
+    sys.path.append(RESOLVE_SCRIPT_PATH)
+
+  try:
+    import DaVinciResolveScript as dvr
+  except ImportError as e:
+    raise ResolveError(
+      f"Could not import DaVinci Resolve scripting module: {e}. "
+      f"Ensure Resolve Studio is installed and scripting is enabled."
+    )
+
+  resolve = dvr.scriptapp("Resolve")
+  if resolve is None:
+    raise ResolveError(
+      "Could not connect to DaVinci Resolve. "
+      "Ensure Resolve Studio is running."
+    )
+  return resolve
+
+def save_project(project) -> bool:
+  """
+  Save project (one full project-DB write), unless RESOLVE_DEFER_SAVE=1
+
+  With the env var set, a driver such as scripts/resolve_finish_ep1.py runs
+  several scripts and saves once after the last. Returns True if saved.
+  """
+  if os.environ.get("RESOLVE_DEFER_SAVE") == "1":
+    return False
+  try:
+    return bool(project.SaveProject())
+  except Exception:
+    return False
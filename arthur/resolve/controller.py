@@ -128,15 +128,10 @@ class ResolveController:
     Raises:
       ResolveError if Resolve is not running or Studio not available
     """
-    try:
-      import DaVinciResolveScript as dvr
-      self._resolve = dvr.scriptapp("Resolve")
+    from .connect import get_resolve
 
-      if self._resolve is None:
-        raise ResolveError(
-          "Could not connect to DaVinci Resolve. "
-          "Ensure Resolve Studio is running."
-        )
+    try:
+      self._resolve = get_resolve()
 
       self._project_manager = self._resolve.GetProjectManager()
       if self._project_manager is None:
@@ -145,11 +140,8 @@ class ResolveController:
       self._connected = True
       return True
 
-    except ImportError as e:
-      raise ResolveError(
-        f"Could not import DaVinci Resolve scripting module: {e}. "
-        f"Ensure Resolve Studio is installed and scripting is enabled."
-      )
+    except ResolveError:
+      raise
     except Exception as e:
       raise ResolveError(f"Failed to connect to Resolve: {e}")
 
@@ -221,8 +213,10 @@ class ResolveController:
     return self._project_manager.GetProjectListInCurrentFolder()
 
   def save_project(self) -> bool:
-    """Save current project"""
+    """Save current project (skipped when RESOLVE_DEFER_SAVE=1)"""
     self._ensure_project()
+    if os.environ.get("RESOLVE_DEFER_SAVE") == "1":
+      return False
     try:
       result = self._project.SaveProject()
       return result if result is not None else True
@@ -0,0 +1,86 @@
+"""
+Timeline manifests for headless ffmpeg renders
+
+A manifest is a JSON snapshot of a Resolve timeline: every clip's source
+file, source in/out and record position per track. scripts/
+render_from_manifest.py replays it with ffmpeg alone, so CI and headless runs
+don't need Resolve open once the edit exists.
+
+  {
+    "timeline": "EP01_Hardware", "fps": 30.0, "width": 1080, "height": 1920,
+    "duration": 1800,
+    "video_tracks": [{"track": 1, "items": [
+      {"name": "...", "src": "/path/clip.mp4", "in": 0, "out": 300, "record": 0}
+    ]}],
+    "audio_tracks": [...]
+  }
+
+Frames are timeline frames; "record" is relative to the timeline start.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+MANIFEST_PATH = Path(__file__).parent.parent.parent / "build" / "timeline.json"
+
+def _track_items(timeline, track_type: str, start: int) -> List[Dict[str, Any]]:
+  tracks = []
+  for index in range(1, timeline.GetTrackCount(track_type) + 1):
+    items = []
+    for item in timeline.GetItemListInTrack(track_type, index) or []:
+      media_item = item.GetMediaPoolItem()
+      left = item.GetLeftOffset()
+      items.append({
+        "name": item.GetName(),
+        # Generators and titles have no source file; ffmpeg can't replay them
+        "src": media_item.GetClipProperty("File Path") if media_item else None,
+        "in": left,
+        "out": left + item.GetDuration(),
+        "record": item.GetStart() - start,
+      })
+    tracks.append({"track": index, "items": items})
+  return tracks
+
+def timeline_manifest(timeline, project=None) -> Dict[str, Any]:
+  """
+  Snapshot a Resolve timeline as a manifest dict
+
+  Args:
+    timeline: Resolve Timeline to describe
+    project: Project for the output resolution (falls back to the
+      timeline's own settings)
+  """
+  settings = project or timeline
+  start = timeline.GetStartFrame()
+  return {
+    "timeline": timeline.GetName(),
+    "fps": float(timeline.GetSetting("timelineFrameRate") or 30),
+    "width": int(settings.GetSetting("timelineResolutionWidth") or 1080),
+    "height": int(settings.GetSetting("timelineResolutionHeight") or 1920),
+    "duration": timeline.GetEndFrame() - start,
+    "video_tracks": _track_items(timeline, "video", start),
+    "audio_tracks": _track_items(timeline, "audio", start),
+  }
+
+def load_manifest(timeline, path: Path = MANIFEST_PATH, project=None) -> Dict[str, Any]:
+  """
+  Manifest to build on: the one at path if it describes this timeline,
+  so several --dump-only steps accumulate their edits, else a fresh snapshot
+  """
+  try:
+    manifest = json.loads(Path(path).read_text())
+    if manifest.get("timeline") == timeline.GetName():
+      return manifest
+  except (OSError, ValueError):
+    pass
+  return timeline_manifest(timeline, project)
+
+def write_manifest(manifest: Dict[str, Any], path: Path = MANIFEST_PATH) -> Path:
+  """Write a manifest as JSON (atomically) and return its path"""
+  path = Path(path)
+  path.parent.mkdir(parents=True, exist_ok=True)
+  tmp = path.with_suffix(".tmp")
+  tmp.write_text(json.dumps(manifest, indent=2))
+  tmp.replace(path)
+  return path
@@ -0,0 +1,266 @@
+"""
+Render-job waiting for DaVinci Resolve
+
+Where the scripting bridge offers SetRenderJobStatusCallback (newer
+Resolve builds) and it actually fires, wait_for_renders() is event-driven:
+progress arrives only when it changes. Otherwise finishing a render means
+polling, on an adaptive interval: fast while progress is moving (so short
+clips return promptly after they finish), backing off to a few seconds
+while it stalls (so long renders cost few RPCs).
+
+When a timeline is one untouched source clip, remux_passthrough() skips the
+render altogether and stream-copies the source with ffmpeg.
+"""
+
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+FFMPEG = shutil.which("ffmpeg") or "/opt/homebrew/bin/ffmpeg"
+
+# Safety margin on estimated export size (container overhead, VBR overshoot)
+DISK_HEADROOM = 1.2
+
+# Source codecs an .mp4 export can carry without re-encoding
+PASSTHROUGH_CODECS = ("H.264", "H.265", "HEVC")
+
+MIN_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 5.0
+POLL_BACKOFF = 1.5
+
+# With status callbacks, the longest wait between checks that Resolve is
+# still rendering (covers a callback that never reports the final state)
+CALLBACK_SAFETY_INTERVAL = 5.0
+# Fall back to polling if no status callback arrives within this long
+CALLBACK_GRACE = 1.0
+
+# JobStatus values after which a job won't change again
+FINAL_JOB_STATUSES = frozenset({"Complete", "Failed", "Cancelled"})
+
+def wait_for_renders(
+  project,
+  job_ids: List[str],
+  on_progress: Optional[Callable[[int], None]] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+  """
+  Block until Resolve finishes a batch of render jobs
+
+  Args:
+    project: Resolve Project the jobs were started on
+    job_ids: Render job ids passed together to StartRendering()
+    on_progress: Called with the batch's mean CompletionPercentage each
+      time it changes
+
+  Returns:
+    job id -> final GetRenderJobStatus() dict (None if Resolve returns nothing)
+  """
+  if hasattr(project, "SetRenderJobStatusCallback") and _wait_for_callbacks(
+    project, job_ids, on_progress
+  ):
+    return {job_id: project.GetRenderJobStatus(job_id) for job_id in job_ids}
+
+  interval = MIN_POLL_INTERVAL
+  last_progress = None
+
+  while project.IsRenderingInProgress():
+    progress = sum(
+      (project.GetRenderJobStatus(job_id) or {}).get("CompletionPercentage", 0)
+      for job_id in job_ids
+    ) // max(len(job_ids), 1)
+    if progress != last_progress:
+      last_progress = progress
+      interval = MIN_POLL_INTERVAL
+      if on_progress:
+        on_progress(progress)
+
+    time.sleep(interval)
+    interval = min(interval * POLL_BACKOFF, MAX_POLL_INTERVAL)
+
+  return {job_id: project.GetRenderJobStatus(job_id) for job_id in job_ids}
+
+def _wait_for_callbacks(
+  project,
+  job_ids: List[str],
+  on_progress: Optional[Callable[[int], None]] = None
+) -> bool:
+  """
+  Block on Resolve's render status callback until every job is final
+
+  Checks IsRenderingInProgress() on the same adaptive interval as polling
+  (capped at CALLBACK_SAFETY_INTERVAL), so short renders still return
+  promptly. Returns False, without waiting further, if no callback has
+  arrived after CALLBACK_GRACE: the caller then polls instead.
+  """
+  percentages = dict.fromkeys(job_ids, 0)
+  pending = set(job_ids)
+  last_progress = None
+  lock = threading.Lock()
+  done = threading.Event()
+  received = threading.Event()
+
+  def on_status(job_id, status):
+    nonlocal last_progress
+    received.set()
+    if job_id not in percentages:
+      return
+    status = status or {}
+    with lock:
+      percentages[job_id] = status.get("CompletionPercentage", percentages[job_id])
+      if status.get("JobStatus") in FINAL_JOB_STATUSES:
+        pending.discard(job_id)
+      progress = sum(percentages.values()) // len(percentages)
+      changed, last_progress = progress != last_progress, progress
+    if changed and on_progress:
+      on_progress(progress)
+    if not pending:
+      done.set()
+
+  project.SetRenderJobStatusCallback(on_status)
+  try:
+    interval = MIN_POLL_INTERVAL
+    grace_ends = time.monotonic() + CALLBACK_GRACE
+    while not done.wait(interval):
+      if not project.IsRenderingInProgress():
+        break
+      if not received.is_set() and time.monotonic() >= grace_ends:
+        return False
+      interval = min(interval * POLL_BACKOFF, CALLBACK_SAFETY_INTERVAL)
+    return True
+  finally:
+    project.SetRenderJobStatusCallback(None)
+
+def wait_for_render(
+  project,
+  job_id: str,
+  on_progress: Optional[Callable[[int], None]] = None
+) -> Optional[Dict[str, Any]]:
+  """
+  Block until Resolve stops rendering, then return the job's final status
+
+  Args:
+    project: Resolve Project the job was started on
+    job_id: Render job id from AddRenderJob()
+    on_progress: Called with CompletionPercentage each time it changes
+
+  Returns:
+    GetRenderJobStatus() dict for the job (None if Resolve returns nothing)
+  """
+  return wait_for_renders(project, [job_id], on_progress)[job_id]
+
+def check_disk_space(
+  export_dir: Path | str,
+  duration_seconds: float,
+  bitrate_kbps: int,
+  headroom: float = DISK_HEADROOM
+) -> Optional[str]:
+  """
+  Check the export volume can hold a render before starting it
+
+  Returns:
+    None if there's room, else a message saying how much is needed vs free
+    (also when the volume isn't mounted)
+  """
+  try:
+    free = shutil.disk_usage(export_dir).free
+  except OSError as e:
+    return f"Export directory unavailable: {e}"
+  needed = bitrate_kbps * 1000 * duration_seconds / 8 * headroom
+  if free < needed:
+    return f"Insufficient space: need {needed / 1e9:.1f} GB, have {free / 1e9:.1f} GB"
+  return None
+
+def _single_clip(timeline):
+  """The timeline's only video item, or None if there isn't exactly one"""
+  if timeline.GetTrackCount("video") != 1:
+    return None
+  items = timeline.GetItemListInTrack("video", 1) or []
+  return items[0] if len(items) == 1 else None
+
+def timeline_is_passthrough(timeline, width: int, height: int, fps: float) -> bool:
+  """
+  Check whether a timeline is one source clip that can be remuxed as-is
+
+  True iff there is a single video track holding a single clip that spans the
+  whole timeline, has no Fusion comp or extra grade nodes, any audio comes
+  from the same source, and the source already matches the export
+  resolution, frame rate and an mp4-compatible codec. Resolve doesn't expose
+  whether a lone node is graded, so callers should only ask when they know
+  the clip is ungraded (the export scripts gate this behind --passthrough).
+  """
+  item = _single_clip(timeline)
+  if item is None:
+    return False
+
+  media_item = item.GetMediaPoolItem()
+  if media_item is None:  # generator / title
+    return False
+  if item.GetStart() != timeline.GetStartFrame() or item.GetEnd() != timeline.GetEndFrame():
+    return False
+  if item.GetFusionCompCount():
+    return False
+  if hasattr(item, "GetNumNodes") and (item.GetNumNodes() or 0) > 1:
+    return False
+
+  for index in range(1, timeline.GetTrackCount("audio") + 1):
+    for audio_item in timeline.GetItemListInTrack("audio", index) or []:
+      audio_source = audio_item.GetMediaPoolItem()
+      if audio_source is None or audio_source.GetMediaId() != media_item.GetMediaId():
+        return False
+
+  props = media_item.GetClipProperty() or {}
+  try:
+    source_fps = float(props.get("FPS") or 0)
+  except ValueError:
+    return False
+  return (
+    props.get("Resolution") == f"{width}x{height}"
+    and abs(source_fps - float(fps)) < 0.01
+    and any(codec in props.get("Video Codec", "") for codec in PASSTHROUGH_CODECS)
+  )
+
+def remux_passthrough(
+  timeline,
+  output_path: Path | str,
+  audio: bool = True,
+  timeout: int = 600
+) -> bool:
+  """
+  Export a passthrough timeline by stream-copying its source clip
+
+  Trims the source to the clip's in/out points with ffmpeg -c copy; no frame
+  is decoded. With stream copy the start snaps to the nearest keyframe at or
+  before the in-point.
+
+  Returns:
+    True if ffmpeg wrote output_path; False means render the normal way
+  """
+  item = _single_clip(timeline)
+  source = item.GetMediaPoolItem().GetClipProperty("File Path")
+  fps = float(item.GetMediaPoolItem().GetClipProperty("FPS"))
+
+  cmd = [
+    FFMPEG, "-y",
+    "-ss", f"{item.GetLeftOffset() / fps:.3f}",
+    "-i", source,
+    "-t", f"{item.GetDuration() / fps:.3f}",
+    "-c", "copy",
+    "-map", "0:v:0",
+  ]
+  if audio:
+    cmd += ["-map", "0:a?"]
+  cmd += ["-movflags", "+faststart", str(output_path)]
+
+  print("Passthrough remux (no re-encode)")
+  try:
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+  except (OSError, subprocess.TimeoutExpired) as e:
+    print(f"  ffmpeg failed: {e}")
+    return False
+  if result.returncode != 0:
+    error = result.stderr.strip().splitlines()
+    print(f"  ffmpeg failed: {error[-1] if error else result.returncode}")
+    return False
+  return Path(output_path).exists()
@@ -141,6 +141,9 @@ CAREER_TIMELINE = [
 # Media Discovery
 # ============================================================================
 
+VIDEO_EXT = frozenset({".mp4", ".mov", ".avi", ".mkv"})
+IMAGE_EXT = frozenset({".png", ".jpg", ".jpeg", ".tiff"})
+
 def discover_media(studio_path: Path) -> dict[str, list[Path]]:
   """
   Discover media files on STUDIO volume organized by type
@@ -157,16 +160,16 @@ def discover_media(studio_path: Path) -> dict[str, list[Path]]:
   }
 
   if video_dir.exists():
-    media["video"] = sorted([
+    media["video"] = sorted(
       f for f in video_dir.iterdir()
-      if f.suffix.lower() in [".mp4", ".mov", ".avi", ".mkv"]
-    ])
+      if f.suffix.lower() in VIDEO_EXT
+    )
 
   if image_dir.exists():
-    media["image"] = sorted([
+    media["image"] = sorted(
       f for f in image_dir.iterdir()
-      if f.suffix.lower() in [".png", ".jpg", ".jpeg", ".tiff"]
-    ])
+      if f.suffix.lower() in IMAGE_EXT
+    )
 
   return media
 
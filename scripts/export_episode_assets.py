@@ -14,6 +14,8 @@ import sys
 
 API_BASE = "http://localhost:8422"
 DEFAULT_OUTPUT = Path("/Users/arthurdell/ARTHUR/resolve_projects")
+IMAGE_EXT = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+VIDEO_EXT = frozenset({".mp4", ".mov", ".webm"})
 
 
 def export_episode_assets(episode: int, output_dir: Path) -> list[Path]:
@@ -86,8 +88,8 @@ def export_episode_assets(episode: int, output_dir: Path) -> list[Path]:
 
   # List exported files
   print("\nExported files:")
-  images = [p for p in exported_paths if p.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']]
-  videos = [p for p in exported_paths if p.suffix.lower() in ['.mp4', '.mov', '.webm']]
+  images = [p for p in exported_paths if p.suffix.lower() in IMAGE_EXT]
+  videos = [p for p in exported_paths if p.suffix.lower() in VIDEO_EXT]
 
   print(f"\n  Images ({len(images)}):")
   for p in sorted(images):
@@ -9,137 +9,182 @@ Storyboard-aligned shots for 120-second LinkedIn video:
 Cost estimate: ~$6-8 for 80 seconds of additional footage
 """
 
+import os
 import sys
+import json
 import time
+import random
+import shutil
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from arthur.generators.wan26_api import Wan26APIClient
 
 OUTPUT_DIR = Path("/Users/arthurdell/ARTHUR/resolve_projects/ep1_hardware")
+CACHE_DIR = OUTPUT_DIR / ".cache"
+FAILED_SHOTS_FILE = OUTPUT_DIR / "failed_shots.json"
+
+WAIT_ATTEMPTS = 3
+DOWNLOAD_WORKERS = 2
+
+RESOLUTION = "720P"
+ASPECT_RATIO = "16:9"
 
 # Episode 1 Shot List - Storyboard Aligned
-# Each shot maps to a specific narrative beat
-EP1_SHOTS = [
-  # ═══════════════════════════════════════════════════════════════════
-  # ACT 1: THE SETUP (0:00 - 0:30) - Establishing credibility
-  # ═══════════════════════════════════════════════════════════════════
-  {
-    "id": "ep1_01_workspace_establish",
-    "prompt": "Cinematic establishing shot of premium home office workspace, morning light streaming through windows, sleek desk setup with multiple monitors, executive chair, dark wood and metal aesthetic, professional tech environment, shallow depth of field, 4K quality",
-    "duration": 10,
-    "narrative": "Opening - Establish the professional context"
-  },
-  {
-    "id": "ep1_02_mac_studio_reveal",
-    "prompt": "Dramatic product reveal of Apple Mac Studio computer, silver aluminum box emerging from darkness, premium studio lighting, particles of light floating around device, cinematic camera orbit, ultra-premium product photography style, 4K",
-    "duration": 10,
-    "narrative": "Mac Studio hero introduction"
-  },
-  {
-    "id": "ep1_03_mac_studio_ports",
-    "prompt": "Close-up detail shot of high-end computer ports and connectivity, Thunderbolt cables being connected, professional equipment integration, shallow depth of field, premium tech aesthetic, cable management perfection",
-    "duration": 5,
-    "narrative": "Mac Studio connectivity and capability"
-  },
-
-  # ═══════════════════════════════════════════════════════════════════
-  # ACT 2: THE REVEAL (0:30 - 1:00) - DGX Spark introduction
-  # ═══════════════════════════════════════════════════════════════════
-  {
-    "id": "ep1_04_dgx_spark_unbox",
-    "prompt": "Premium product unboxing sequence, champagne gold compact computer emerging from sleek black packaging, NVIDIA branding visible, hands carefully lifting device, premium materials, luxury tech aesthetic, cinematic lighting",
-    "duration": 10,
-    "narrative": "DGX Spark dramatic reveal"
-  },
-  {
-    "id": "ep1_05_dgx_spark_detail",
-    "prompt": "Extreme close-up of champagne gold desktop AI computer, intricate cooling vents, premium metallic finish catching light, subtle reflections, macro lens detail shot, futuristic technology aesthetic",
-    "duration": 5,
-    "narrative": "DGX Spark craftsmanship details"
-  },
-  {
-    "id": "ep1_06_side_by_side",
-    "prompt": "Two premium desktop computers side by side on executive desk, silver aluminum cube and champagne gold compact unit, coffee mug for scale reference, symmetrical composition, premium office environment, professional product photography",
-    "duration": 10,
-    "narrative": "Direct comparison - the power duo"
-  },
-
-  # ═══════════════════════════════════════════════════════════════════
-  # ACT 3: THE CAPABILITY (1:00 - 1:40) - What they can do
-  # ═══════════════════════════════════════════════════════════════════
-  {
-    "id": "ep1_07_neural_flow",
-    "prompt": "Abstract visualization of neural network data processing, flowing streams of light particles representing AI computation, deep blue and amber color palette, futuristic data center aesthetic, smooth camera movement through data streams",
-    "duration": 10,
-    "narrative": "AI processing visualization"
-  },
-  {
-    "id": "ep1_08_unified_memory",
-    "prompt": "Cinematic visualization of unified memory architecture, glowing data pathways connecting components, abstract representation of 512GB memory bandwidth, cool blue and white light trails, tech diagram coming to life",
-    "duration": 10,
-    "narrative": "Unified memory advantage"
-  },
-  {
-    "id": "ep1_09_petaflop_viz",
-    "prompt": "Dynamic visualization of one petaflop computing power, explosion of calculated data points, mathematical formulas floating in space, gold and orange particle effects, abstract representation of massive parallel processing",
-    "duration": 10,
-    "narrative": "PFLOP power visualization"
-  },
-
-  # ═══════════════════════════════════════════════════════════════════
-  # ACT 4: THE INTEGRATION (1:40 - 2:00) - Working together
-  # ═══════════════════════════════════════════════════════════════════
-  {
-    "id": "ep1_10_dual_workflow",
-    "prompt": "Split screen professional workflow visualization, AI model training on one side, creative content generation on other, data flowing between systems, modern dashboard interfaces, professional productivity aesthetic",
-    "duration": 10,
-    "narrative": "Dual system workflow"
-  },
-  {
-    "id": "ep1_11_hero_closing",
-    "prompt": "Cinematic hero shot of complete dual-computer workstation setup, dramatic lighting, camera slowly pulling back to reveal full professional environment, golden hour lighting, aspirational tech workspace, premium executive aesthetic",
-    "duration": 10,
-    "narrative": "Closing hero shot - the complete foundation"
-  },
-]
-
-def generate_episode_1_videos():
-  """Generate all Episode 1 videos via Wan 2.6 API"""
+# Each shot maps to a specific narrative beat (see prompts/ep1_shots.json)
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+EP1_SHOTS_FILE = PROMPTS_DIR / "ep1_shots.json"
+
+
+@lru_cache(maxsize=1)
+def load_ep1_shots() -> tuple:
+  """Load the Episode 1 shot list on first use"""
+  return tuple(json.loads(EP1_SHOTS_FILE.read_text()))
+
+
+def shot_cache_key(shot: dict) -> str:
+  """Content hash of the generation parameters for a shot"""
+  params = {
+    "prompt": shot["prompt"],
+    "duration": shot["duration"],
+    "resolution": RESOLUTION,
+    "aspect_ratio": ASPECT_RATIO,
+    "model": "wan26",
+  }
+  payload = json.dumps(params, sort_keys=True).encode()
+  return hashlib.blake2b(payload).hexdigest()[:16]
+
+
+def store_in_cache(shot: dict, video_path: Path) -> None:
+  """Copy a generated video into the content-addressed cache"""
+  key = shot_cache_key(shot)
+  CACHE_DIR.mkdir(parents=True, exist_ok=True)
+  shutil.copy(video_path, CACHE_DIR / f"{key}.mp4")
+  (CACHE_DIR / f"{key}.json").write_text(json.dumps({
+    "shot": shot["id"],
+    "prompt": shot["prompt"],
+    "duration": shot["duration"],
+    "created": datetime.now().isoformat(),
+  }, indent=2))
+
+
+def mp4_stems(directory: Path) -> set:
+  """Names (without .mp4) of the videos in a directory, from one scandir"""
+  try:
+    with os.scandir(directory) as entries:
+      return {e.name[:-4] for e in entries if e.name.endswith(".mp4")}
+  except FileNotFoundError:
+    return set()
+
+
+def shot_timeout(shot: dict) -> int:
+  """Completion timeout scaled to clip length (longer clips render longer)"""
+  return max(60, shot["duration"] * 30)
+
+
+def wait_with_retry(client: Wan26APIClient, shot: dict, task_id: str) -> Optional[str]:
+  """
+  Wait for a shot, re-waiting with jittered backoff while it is still running
+
+  A timeout only means the task is slow, not lost, so the already-paid-for
+  generation is given WAIT_ATTEMPTS windows before the shot is abandoned.
+  """
+  for attempt in range(1, WAIT_ATTEMPTS + 1):
+    video_url = client.wait_for_completion(
+      task_id,
+      timeout=shot_timeout(shot),
+      poll_interval=2,
+      max_poll_interval=60
+    )
+    if video_url:
+      return video_url
+
+    status = client.get_task_status(task_id).get("status", "")
+    if status.lower() in ("failed", "completed", "error") or attempt == WAIT_ATTEMPTS:
+      return None
+
+    delay = min(30, 2 ** attempt) * random.uniform(0.8, 1.2)
+    print(f"⏳ Still {status or 'pending'} - retrying wait in {delay:.0f}s "
+          f"(attempt {attempt + 1}/{WAIT_ATTEMPTS})")
+    time.sleep(delay)
+
+  return None
+
+
+def load_failed_shots() -> dict:
+  """Shots left unfinished by the previous run, keyed by shot id"""
+  if FAILED_SHOTS_FILE.exists():
+    return json.loads(FAILED_SHOTS_FILE.read_text())
+  return {}
+
+
+def record_failed_shots(failed: dict) -> None:
+  """Persist unfinished shots (with task ids) so the next run can resume them"""
+  if failed:
+    FAILED_SHOTS_FILE.write_text(json.dumps(failed, indent=2))
+  else:
+    FAILED_SHOTS_FILE.unlink(missing_ok=True)
+
+
+def generate_episode_1_videos(force: bool = False):
+  """Generate all Episode 1 videos via Wan 2.6 API
+
+  Args:
+    force: Ignore the prompt cache and regenerate every missing shot
+  """
 
   print("=" * 70)
   print("EPISODE 1: HARDWARE FOUNDATION - VIDEO GENERATION")
   print("=" * 70)
 
-  # Calculate totals
-  total_duration = sum(s["duration"] for s in EP1_SHOTS)
-  total_cost = total_duration * 0.08  # 720P pricing
+  shots = load_ep1_shots()
 
-  print(f"\nPlanned shots: {len(EP1_SHOTS)}")
-  print(f"Total duration: {total_duration} seconds")
-  print(f"Estimated cost: ${total_cost:.2f} (720P)")
+  # One directory listing each for outputs and cache instead of a stat per shot
+  existing_ids = mp4_stems(OUTPUT_DIR)
+  cached_keys = set() if force else mp4_stems(CACHE_DIR)
 
-  # Check which shots already exist
+  # Single pass: totals plus existing / cached / to-generate split
   existing = []
   to_generate = []
+  cache_hits = 0
+  total_duration = 0
+  gen_duration = 0
+
+  for shot in shots:
+    total_duration += shot["duration"]
+    if shot["id"] in existing_ids:
+      existing.append(shot)
+      continue
 
-  for shot in EP1_SHOTS:
-    expected_file = OUTPUT_DIR / f"{shot['id']}.mp4"
-    if expected_file.exists():
+    cache_key = shot_cache_key(shot)
+    if cache_key in cached_keys:
+      shutil.copy(CACHE_DIR / f"{cache_key}.mp4", OUTPUT_DIR / f"{shot['id']}.mp4")
+      print(f"♻️  Cache hit: {shot['id']} ({cache_key}.mp4)")
       existing.append(shot)
+      cache_hits += 1
     else:
       to_generate.append(shot)
+      gen_duration += shot["duration"]
+
+  total_cost = total_duration * 0.08  # 720P pricing
 
-  print(f"\nAlready generated: {len(existing)}")
+  print(f"\nPlanned shots: {len(shots)}")
+  print(f"Total duration: {total_duration} seconds")
+  print(f"Estimated cost: ${total_cost:.2f} (720P)")
+
+  print(f"\nAlready generated: {len(existing)} ({cache_hits} from cache)")
   print(f"To generate: {len(to_generate)}")
 
   if not to_generate:
     print("\n✅ All shots already generated!")
     return
 
-  gen_duration = sum(s["duration"] for s in to_generate)
   gen_cost = gen_duration * 0.08
   print(f"\nThis run: {gen_duration}s, ~${gen_cost:.2f}")
 
@@ -161,70 +206,107 @@ def generate_episode_1_videos():
 
   OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-  # Generate each shot
-  results = []
-  for i, shot in enumerate(to_generate, 1):
-    print(f"\n{'─' * 70}")
-    print(f"Shot {i}/{len(to_generate)}: {shot['id']}")
-    print(f"Narrative: {shot['narrative']}")
-    print(f"Duration: {shot['duration']}s")
-    print(f"{'─' * 70}")
-
-    # Submit generation
-    print(f"Submitting: {shot['prompt'][:80]}...")
-    result = client.text_to_video(
-      prompt=shot["prompt"],
-      duration=shot["duration"],
-      resolution="720P",
-      aspect_ratio="16:9",
-      with_audio=False,  # We'll add music in DaVinci
-      prompt_extend=True
-    )
-
-    if not result.success:
-      print(f"❌ Failed to submit: {result.error}")
+  # Reclaim shots whose tasks were still rendering when the last run gave up
+  previous = load_failed_shots()
+  resumed = set()
+  for shot in to_generate:
+    entry = previous.get(shot["id"], {})
+    # A task rendered from an older prompt/duration must not be resumed (or
+    # cached under the edited shot's key)
+    if entry.get("cache_key") != shot_cache_key(shot):
       continue
-
-    print(f"Task ID: {result.task_id}")
-    print(f"Waiting for completion...")
-
-    # Wait for completion
-    video_url = client.wait_for_completion(
-      result.task_id,
-      timeout=300,
-      poll_interval=10
-    )
-
-    if not video_url:
-      print(f"❌ Generation failed or timed out")
-      continue
-
-    # Download video
+    task_id = entry.get("task_id")
     output_path = OUTPUT_DIR / f"{shot['id']}.mp4"
-    print(f"Downloading to {output_path}...")
-
-    if client.download_video(result.task_id, output_path):
-      size_mb = output_path.stat().st_size / (1024 * 1024)
-      print(f"✅ Saved: {output_path.name} ({size_mb:.2f} MB)")
-      results.append({
-        "shot": shot["id"],
-        "path": str(output_path),
-        "duration": shot["duration"],
-        "narrative": shot["narrative"]
-      })
-    else:
-      print(f"❌ Download failed")
-
-    # Brief pause between generations
-    if i < len(to_generate):
-      print("Waiting 5s before next generation...")
-      time.sleep(5)
+    if task_id and client.download_video(task_id, output_path):
+      print(f"♻️  Resumed {shot['id']} from task {task_id}")
+      store_in_cache(shot, output_path)
+      resumed.add(shot["id"])
+  to_generate = [s for s in to_generate if s["id"] not in resumed]
+
+  # Submit every shot before waiting on any of them
+  print(f"\nSubmitting {len(to_generate)} shots...")
+  submissions = client.text_to_video_batch([
+    {
+      "prompt": shot["prompt"],
+      "duration": shot["duration"],
+      "resolution": RESOLUTION,
+      "aspect_ratio": ASPECT_RATIO,
+      "with_audio": False,  # We'll add music in DaVinci
+      "prompt_extend": True
+    }
+    for shot in to_generate
+  ])
+
+  # Poll shots in order; each finished shot is handed to a download worker
+  # so its transfer overlaps with waiting on the next one
+  results = []
+  failed = {}
+  downloads = {}
+  with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as downloader:
+    for i, (shot, result) in enumerate(zip(to_generate, submissions), 1):
+      print(f"\n{'─' * 70}")
+      print(f"Shot {i}/{len(to_generate)}: {shot['id']}")
+      print(f"Narrative: {shot['narrative']}")
+      print(f"Duration: {shot['duration']}s")
+      print(f"{'─' * 70}")
+
+      if not result.success:
+        print(f"❌ Failed to submit: {result.error}")
+        failed[shot["id"]] = {"stage": "submit", "error": result.error}
+        continue
+
+      print(f"Task ID: {result.task_id}")
+      print(f"Waiting for completion...")
+
+      # Wait for completion
+      video_url = wait_with_retry(client, shot, result.task_id)
+
+      if not video_url:
+        print(f"❌ Generation failed or timed out")
+        failed[shot["id"]] = {
+          "stage": "generation",
+          "task_id": result.task_id,
+          "cache_key": shot_cache_key(shot),
+        }
+        continue
+
+      # Download video in the background
+      output_path = OUTPUT_DIR / f"{shot['id']}.mp4"
+      print(f"Downloading to {output_path}...")
+      future = downloader.submit(client.download_video, result.task_id, output_path)
+      downloads[future] = (shot, result.task_id, output_path)
+
+    for future in as_completed(downloads):
+      shot, task_id, output_path = downloads[future]
+      if future.result():
+        size_mb = output_path.stat().st_size / (1024 * 1024)
+        print(f"✅ Saved: {output_path.name} ({size_mb:.2f} MB)")
+        store_in_cache(shot, output_path)
+        results.append({
+          "shot": shot["id"],
+          "path": str(output_path),
+          "duration": shot["duration"],
+          "narrative": shot["narrative"]
+        })
+      else:
+        print(f"❌ Download failed: {shot['id']}")
+        failed[shot["id"]] = {
+          "stage": "download",
+          "task_id": task_id,
+          "cache_key": shot_cache_key(shot),
+        }
+
+  record_failed_shots(failed)
 
   # Summary
   print("\n" + "=" * 70)
   print("GENERATION COMPLETE")
   print("=" * 70)
   print(f"\nSuccessfully generated: {len(results)}/{len(to_generate)}")
+  if failed:
+    print(f"Failed shots recorded in {FAILED_SHOTS_FILE}:")
+    for shot_id, info in failed.items():
+      print(f"  ✗ {shot_id} ({info['stage']})")
 
   if results:
     print("\nGenerated shots:")
@@ -239,4 +321,4 @@ def generate_episode_1_videos():
 
 
 if __name__ == "__main__":
-  generate_episode_1_videos()
+  generate_episode_1_videos(force="--force" in sys.argv[1:])
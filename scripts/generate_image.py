@@ -9,14 +9,26 @@ Usage:
 """
 
 import argparse
+import inspect
+import json
+import socket
 import subprocess
 import sys
+import time
+import uuid
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import os
+import platform
+from types import MappingProxyType
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.config import env_value
 
 # Preset resolutions (FLUX-optimized, divisible by 64)
-PRESETS = {
+PRESETS = MappingProxyType({
     "1:1": (1024, 1024),      # Square
     "4:3": (1152, 896),       # Standard
     "3:2": (1216, 832),       # Photo
@@ -26,7 +38,7 @@ PRESETS = {
     "21:9-large": (2176, 960),  # Ultra-ultrawide
     "9:16": (768, 1344),      # Vertical/mobile
     "4:5": (1024, 1280),      # Portrait
-}
+})
 
 # Available models
 MODELS = {
@@ -47,6 +59,484 @@ MODELS = {
     }
 }
 
+def _load_hf_token():
+    """Hugging Face token from the environment, else HF_TOKEN in ARTHUR/.env"""
+    return env_value("HUGGING_FACE_HUB_TOKEN", "HF_TOKEN")
+
+def default_output(model, width, height):
+    """Timestamped output path under ARTHUR/generated_images
+
+    A short random suffix keeps names unique when several images are
+    generated within the same second in one warm-pipeline session.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_dir = Path("/Users/arthurdell/ARTHUR/generated_images")
+    output_dir.mkdir(exist_ok=True)
+    return output_dir / f"{model}_{width}x{height}_{timestamp}_{uuid.uuid4().hex[:6]}.png"
+
+@lru_cache(maxsize=2)
+def _get_pipe(model, quantize):
+    """Load an mflux FLUX pipeline once and keep it warm for later prompts"""
+    from mflux import Flux1, ModelConfig
+
+    return Flux1(model_config=ModelConfig.from_name(model), quantize=quantize)
+
+# Diffusers checkpoints and quantization schemes for --quant-backend
+DIFFUSERS_MODEL_IDS = {
+    "dev": "black-forest-labs/FLUX.1-dev",
+    "schnell": "black-forest-labs/FLUX.1-schnell",
+    "z-image-turbo": "Tongyi-MAI/Z-Image-Turbo",
+}
+# Distilled models that run without classifier-free guidance
+GUIDANCE_FREE_MODELS = ("schnell", "z-image-turbo")
+TORCHAO_QUANT_TYPES = {
+    "torchao-int8": "int8_weight_only",
+    "torchao-fp8": "float8_weight_only",
+}
+QUANT_BACKENDS = ["mflux", *TORCHAO_QUANT_TYPES, "bnb-nf4"]
+
+def _quantization_config(quant_backend, components):
+    """PipelineQuantizationConfig for the given pipeline components, or None"""
+    import torch
+    from diffusers import PipelineQuantizationConfig
+
+    if quant_backend == "mflux" or not components:
+        return None
+
+    if quant_backend in TORCHAO_QUANT_TYPES:
+        from diffusers import TorchAoConfig as DiffusersTorchAoConfig
+        from transformers import TorchAoConfig as TransformersTorchAoConfig
+
+        quant_type = TORCHAO_QUANT_TYPES[quant_backend]
+        configs = {
+            "transformer": DiffusersTorchAoConfig(quant_type),
+            "text_encoder_2": TransformersTorchAoConfig(quant_type),
+        }
+        return PipelineQuantizationConfig(
+            quant_mapping={name: configs[name] for name in components}
+        )
+
+    return PipelineQuantizationConfig(
+        quant_backend="bitsandbytes_4bit",
+        quant_kwargs={
+            "load_in_4bit": True,
+            "bnb_4bit_quant_type": "nf4",
+            "bnb_4bit_compute_dtype": torch.bfloat16,
+        },
+        components_to_quantize=list(components),
+    )
+
+@lru_cache(maxsize=2)
+def _get_diffusers_pipe(model, quant_backend, gguf_path=None):
+    """
+    Load FluxPipeline with a quantized transformer and T5 encoder, once
+
+    With gguf_path the transformer comes from a GGUF checkpoint instead.
+    Mixed-precision files (e.g. Q8_0 attention with Q4_1/Q5_1 MLPs and
+    full-precision norms) keep their per-tensor types; each layer's
+    weights are dequantized on the fly at compute time. quant_backend
+    then applies only to the T5 encoder.
+
+    z-image-turbo loads ZImagePipeline and quantizes only its DiT, the
+    weight-bound hot path of a few-step turbo model (e.g. torchao-fp8
+    halves the bytes each linear layer streams).
+    """
+    import torch
+
+    if model == "z-image-turbo":
+        from diffusers import ZImagePipeline as pipeline_cls
+        components = ["transformer"]
+    else:
+        from diffusers import FluxPipeline as pipeline_cls
+        components = ["transformer", "text_encoder_2"]
+
+    extra = {}
+    if gguf_path and model != "z-image-turbo":
+        from diffusers import FluxTransformer2DModel, GGUFQuantizationConfig
+
+        extra["transformer"] = FluxTransformer2DModel.from_single_file(
+            gguf_path,
+            quantization_config=GGUFQuantizationConfig(compute_dtype=torch.bfloat16),
+            config=DIFFUSERS_MODEL_IDS[model],
+            subfolder="transformer",
+            torch_dtype=torch.bfloat16,
+        )
+        components.remove("transformer")
+
+    pipe = pipeline_cls.from_pretrained(
+        DIFFUSERS_MODEL_IDS[model],
+        quantization_config=_quantization_config(quant_backend, tuple(components)),
+        torch_dtype=torch.bfloat16,
+        **extra,
+    )
+    if torch.cuda.is_available():
+        pipe.to("cuda")
+    elif torch.backends.mps.is_available():
+        pipe.to("mps")
+    return pipe
+
+def compute_backend(diffusers=False):
+    """
+    Name the matmul backend a run will hit, so silent CPU fallbacks show up
+
+    mflux runs on MLX, whose GPU kernels use Metal and whose CPU stream goes
+    through Accelerate (AMX on Apple Silicon). The diffusers path runs on
+    CUDA, MPS (MPSGraph), or CPU BLAS, which is Accelerate on arm64 macOS.
+    """
+    apple_silicon = sys.platform == "darwin" and platform.machine() == "arm64"
+    cpu = "CPU (Accelerate/AMX)" if apple_silicon else "CPU"
+    if diffusers:
+        try:
+            import torch
+        except ImportError:
+            return "unavailable (torch not installed)"
+        if torch.cuda.is_available():
+            return "CUDA"
+        if torch.backends.mps.is_available():
+            return "MPS (MPSGraph, bf16)"
+        return cpu
+
+    try:
+        import mlx.core as mx
+    except ImportError:
+        return "unavailable (mlx not installed)"
+    if mx.default_device() == mx.gpu:
+        return "MLX (Metal GPU)"
+    return f"MLX {cpu}"
+
+CACHE_MODES = ["none", "fora", "teacache"]
+
+class BlockResidualCache:
+    """
+    Let FLUX DiT blocks return input + the residual of their last evaluation
+
+    Wraps each of the first `depth` transformer blocks (all of them when
+    depth is None). A full evaluation records the residual the block added
+    (its attention and MLP contributions); while `reuse` is set a block
+    skips its QKV projections, attention and MLP and applies that residual
+    instead. Subclasses decide `reuse` once per transformer call in
+    _update_gate, which the first block calls with its bound arguments.
+    """
+
+    def __init__(self, transformer, depth=None):
+        blocks = list(transformer.transformer_blocks)
+        blocks += list(getattr(transformer, "single_transformer_blocks", []))
+        self._originals = []
+        for index, block in enumerate(blocks[:depth]):
+            self._wrap(block, index)
+        self.reset()
+
+    def reset(self):
+        """Clear state before a new image (called per pipeline run)"""
+        self.steps = 0
+        self.skipped = 0
+        self.reuse = False
+        self.residuals = {}
+
+    def remove(self):
+        """Restore the original block forwards"""
+        for block, forward in self._originals:
+            block.forward = forward
+        self._originals = []
+
+    def _update_gate(self, bound):
+        raise NotImplementedError
+
+    def _wrap(self, block, depth):
+        forward = block.forward
+        signature = inspect.signature(forward)
+        self._originals.append((block, forward))
+
+        def cached_forward(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs).arguments
+            hidden_states = bound["hidden_states"]
+            encoder_hidden_states = bound.get("encoder_hidden_states")
+            if depth == 0:
+                self.steps += 1
+                self._update_gate(bound)
+
+            cached = self.residuals.get(depth)
+            if self.reuse and cached is not None:
+                self.skipped += 1
+                hidden_residual, encoder_residual = cached
+                if encoder_residual is None:
+                    return hidden_states + hidden_residual
+                return encoder_hidden_states + encoder_residual, hidden_states + hidden_residual
+
+            output = forward(*args, **kwargs)
+            if isinstance(output, tuple):
+                encoder_out, hidden_out = output
+                self.residuals[depth] = (hidden_out - hidden_states,
+                                         encoder_out - encoder_hidden_states)
+            else:
+                self.residuals[depth] = (output - hidden_states, None)
+            return output
+
+        block.forward = cached_forward
+
+class StepFeatureCache(BlockResidualCache):
+    """
+    Reuse every DiT block's attention/MLP residual on scheduled steps
+
+    - fora: static schedule, recompute every `interval` steps
+    - teacache: accumulate the relative L1 change of the timestep embedding
+      (the `temb` each block is modulated by) and recompute only once it
+      exceeds `threshold`
+
+    Skipped steps still run the embedders, final norm and projection with
+    the current timestep; only the block stack is replayed from cache.
+    """
+
+    def __init__(self, transformer, mode, interval=2, threshold=0.1):
+        self.mode = mode
+        self.interval = interval
+        self.threshold = threshold
+        super().__init__(transformer)
+
+    def reset(self):
+        super().reset()
+        self.reused_steps = 0
+        self.accumulated = 0.0
+        self.prev_temb = None
+
+    def _update_gate(self, bound):
+        temb = bound.get("temb")
+        prev = self.prev_temb
+        self.prev_temb = temb
+        if not self.residuals:
+            self.reuse = False
+        elif self.mode == "fora":
+            self.reuse = (self.steps - 1) % self.interval != 0
+        elif temb is None or prev is None:
+            self.reuse = False
+        else:
+            self.accumulated += ((temb - prev).float().abs().mean()
+                                 / prev.float().abs().mean()).item()
+            self.reuse = self.accumulated < self.threshold
+
+        if self.reuse:
+            self.reused_steps += 1
+        else:
+            self.accumulated = 0.0
+
+ELASTIC_DEFAULTS = {"tau": 0.02, "min_depth": 10}
+
+def parse_elastic_cache(items):
+    """Turn `--elastic-cache tau=0.02 min_depth=10` into a settings dict"""
+    settings = dict(ELASTIC_DEFAULTS)
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or key not in settings:
+            raise ValueError(f"expected tau=<float> or min_depth=<int>, got {item!r}")
+        settings[key] = type(ELASTIC_DEFAULTS[key])(value)
+    return settings
+
+class ElasticBlockCache(BlockResidualCache):
+    """
+    Reuse shallow FLUX DiT blocks across denoising steps while they are stable
+
+    Each of the first `min_depth` transformer blocks remembers the residual it
+    added on its last full evaluation. At the start of every step the drift of
+    the stack input (relative L1 against the previous step) is measured; below
+    `tau` the shallow blocks return input + cached residual and skip their
+    QKV projections, attention and MLP entirely. Deeper blocks always
+    recompute, and step 0 of every image runs in full.
+    """
+
+    def __init__(self, transformer, tau=0.02, min_depth=10):
+        self.tau = tau
+        self.min_depth = min_depth
+        super().__init__(transformer, min_depth)
+
+    def reset(self):
+        super().reset()
+        self.prev_input = None
+
+    def _update_gate(self, bound):
+        hidden_states = bound["hidden_states"]
+        prev = self.prev_input
+        self.prev_input = hidden_states.detach()
+        if prev is None or prev.shape != hidden_states.shape:
+            self.reuse = False
+            return
+        drift = (hidden_states - prev).float().abs().mean() / prev.float().abs().mean()
+        self.reuse = drift.item() < self.tau
+
+def _generate_diffusers(prompt, model, width, height, steps, quant_backend, seed,
+                        output_file, gguf_path=None, cache_mode="none", elastic=None):
+    """Generate one image through a quantized diffusers FluxPipeline"""
+    import torch
+
+    pipe = _get_diffusers_pipe(model, quant_backend, gguf_path)
+    # Both caches wrap the same block forwards, so at most one is installed
+    cache_key = (cache_mode, elastic and (elastic["tau"], elastic["min_depth"]))
+    block_cache = getattr(pipe, "_block_cache", None)
+    if block_cache is not None and pipe._block_cache_key != cache_key:
+        block_cache.remove()
+        block_cache = pipe._block_cache = None
+    if block_cache is None:
+        if cache_mode != "none":
+            block_cache = StepFeatureCache(pipe.transformer, cache_mode)
+        elif elastic is not None:
+            block_cache = ElasticBlockCache(pipe.transformer, elastic["tau"],
+                                            elastic["min_depth"])
+        pipe._block_cache, pipe._block_cache_key = block_cache, cache_key
+    if block_cache is not None:
+        block_cache.reset()
+
+    generator = torch.Generator("cpu").manual_seed(seed) if seed is not None else None
+    image = pipe(
+        prompt=prompt,
+        height=height,
+        width=width,
+        num_inference_steps=steps,
+        guidance_scale=0.0 if model in GUIDANCE_FREE_MODELS else 3.5,
+        generator=generator,
+    ).images[0]
+    if isinstance(block_cache, StepFeatureCache):
+        print(f"   Feature cache ({cache_mode}): reused block residuals on "
+              f"{block_cache.reused_steps}/{block_cache.steps} steps")
+    elif block_cache is not None:
+        print(f"   Elastic cache: skipped {block_cache.skipped} shallow block evaluations "
+              f"over {block_cache.steps} transformer calls")
+    image.save(output_file)
+    return output_file.exists()
+
+def uses_diffusers(args):
+    """Whether the requested run goes through diffusers instead of mflux"""
+    if args.model == "z-image-turbo":
+        return args.quant_backend != "mflux"
+    return args.model in ("dev", "schnell") and (
+        args.quant_backend != "mflux"
+        or args.gguf is not None
+        or args.cache_mode != "none"
+        or args.elastic_cache is not None
+    )
+
+def generate(prompt, model, width, height, steps, quantize, seed, output_file,
+             quant_backend="mflux", gguf_path=None, cache_mode="none", elastic=None):
+    """
+    Generate one image in-process with a cached pipeline
+
+    FLUX models load through mflux by default, or through diffusers with
+    torchao int8/fp8 or bitsandbytes NF4 weights when quant_backend says so,
+    or from a (mixed-precision) GGUF transformer when gguf_path is given.
+    cache_mode enables step-level feature caching on the diffusers path, and
+    elastic ({"tau", "min_depth"}) drift-gated reuse of shallow DiT blocks.
+    z-image-turbo has no stable Python entry point in mflux, so it goes
+    through its CLI unless a diffusers quant_backend (e.g. fp8) is chosen.
+
+    Returns:
+        True if the image was written
+    """
+    if model == "z-image-turbo" and quant_backend != "mflux":
+        return _generate_diffusers(prompt, model, width, height, steps,
+                                   quant_backend, seed, output_file, None,
+                                   cache_mode, elastic)
+    if model not in ("dev", "schnell"):
+        cmd = build_command(prompt, model, width, height, steps, quantize, seed, output_file)
+        return subprocess.run(cmd).returncode == 0
+
+    if quant_backend != "mflux" or gguf_path or cache_mode != "none" or elastic:
+        return _generate_diffusers(prompt, model, width, height, steps,
+                                   quant_backend, seed, output_file, gguf_path,
+                                   cache_mode, elastic)
+
+    from mflux import Config
+
+    pipe = _get_pipe(model, quantize)
+    image = pipe.generate_image(
+        seed=seed if seed is not None else int(datetime.now().timestamp()),
+        prompt=prompt,
+        config=Config(num_inference_steps=steps, height=height, width=width),
+    )
+    image.save(path=str(output_file))
+    return output_file.exists()
+
+def serve(args, width, height, steps):
+    """Read prompts from stdin, one per line, reusing the loaded pipeline"""
+    print(f"🟢 Serving {MODELS[args.model]['name']} at {width}x{height}, {steps} steps")
+    print(f"   Backend: {compute_backend(uses_diffusers(args))}")
+    print("   Enter one prompt per line (Ctrl-D to quit)\n")
+    for line in sys.stdin:
+        prompt = line.strip()
+        if not prompt:
+            continue
+        output_file = default_output(args.model, width, height)
+        if generate(prompt, args.model, width, height, steps,
+                    args.quantize, args.seed, output_file,
+                    args.quant_backend, args.gguf, args.cache_mode,
+                    args.elastic_cache):
+            print(f"✅ {output_file}")
+        else:
+            print(f"❌ Generation failed: {prompt[:60]}")
+
+DAEMON_SOCKET = Path.home() / ".arthur" / "mflux.sock"
+DAEMON_STARTUP_TIMEOUT = 30
+
+def _connect_daemon():
+    """Connect to the warm-pipeline daemon, starting it if it isn't running"""
+    def connect():
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(DAEMON_SOCKET))
+        return sock
+
+    try:
+        return connect()
+    except OSError:
+        pass
+
+    print("🚀 Starting mflux daemon...")
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).parent / "mflux_daemon.py")],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + DAEMON_STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            return connect()
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"mflux daemon did not come up on {DAEMON_SOCKET}")
+
+def generate_via_daemon(request):
+    """Send one generation request to the daemon and return its JSON reply"""
+    with _connect_daemon() as sock:
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        reply = sock.makefile("rb").readline()
+    if not reply:
+        return {"status": "error", "error": "daemon closed the connection"}
+    return json.loads(reply)
+
+def build_command(prompt, model, width, height, steps, quantize, seed, output_file):
+    """mflux CLI invocation for a single image"""
+    if model in ["dev", "schnell"]:
+        cmd = [
+            "/opt/homebrew/bin/mflux-generate",
+            "--model", model,
+            "--prompt", prompt,
+            "--steps", str(steps),
+            "--height", str(height),
+            "--width", str(width),
+            "--quantize", str(quantize),
+            "--output", str(output_file)
+        ]
+    elif model == "z-image-turbo":
+        cmd = [
+            "/opt/homebrew/bin/mflux-generate-z-image-turbo",
+            "--prompt", prompt,
+            "--steps", str(steps),
+            "--height", str(height),
+            "--width", str(width),
+            "--output", str(output_file)
+        ]
+
+    if seed:
+        cmd.extend(["--seed", str(seed)])
+    return cmd
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate images with FLUX models",
@@ -64,9 +554,24 @@ Examples:
 
   # Maximum quality
   python3 scripts/generate_image.py "landscape" --model dev --steps 30 --quantize 8
+
+  # int8 weight-only FLUX through diffusers + torchao
+  python3 scripts/generate_image.py "landscape" --model dev --quant-backend torchao-int8
+
+  # FP8 weight-only Z-Image Turbo
+  python3 scripts/generate_image.py "portrait" --model z-image-turbo --quant-backend torchao-fp8
+
+  # Skip stable shallow DiT blocks on a 30-step FLUX-dev run
+  python3 scripts/generate_image.py "landscape" --model dev --steps 30 --elastic-cache tau=0.02 min_depth=10
+
+  # Keep the model loaded and generate one image per stdin line
+  python3 scripts/generate_image.py --serve --model schnell --preset 16:9
+
+  # Reuse weights across separate CLI runs via the background daemon
+  python3 scripts/generate_image.py "red apple on table" --daemon
         """
     )
-    parser.add_argument("prompt", help="Text prompt for image generation")
+    parser.add_argument("prompt", nargs="?", help="Text prompt for image generation")
     parser.add_argument("--preset", choices=list(PRESETS.keys()),
                        help="Resolution preset")
     parser.add_argument("--width", type=int, help="Custom width (must be divisible by 64)")
@@ -81,8 +586,48 @@ Examples:
     parser.add_argument("--quantize", "-q", type=int, default=4,
                        choices=[3, 4, 5, 6, 8],
                        help="Quantization bits (default: 4)")
+    parser.add_argument("--quant-backend", choices=QUANT_BACKENDS, default="mflux",
+                       help="Weight quantization: mflux bits (default), torchao "
+                            "int8/fp8 or bitsandbytes NF4 via diffusers")
+    parser.add_argument("--gguf", metavar="PATH",
+                       help="Load the FLUX transformer from a GGUF checkpoint "
+                            "(uniform or mixed per-layer quantization)")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default="none",
+                       help="Reuse DiT block residuals across denoising steps: "
+                            "fora (every other step) or teacache (drift-gated)")
+    parser.add_argument("--elastic-cache", nargs="*", metavar="KEY=VALUE",
+                       help="Reuse stable shallow DiT blocks across steps, e.g. "
+                            "--elastic-cache tau=0.02 min_depth=10")
+    parser.add_argument("--daemon", action="store_true",
+                       help="Generate through the warm mflux daemon (started on demand)")
+    parser.add_argument("--serve", action="store_true",
+                       help="Load the model once and read prompts from stdin")
 
     args = parser.parse_args()
+    if not args.prompt and not args.serve:
+        parser.error("prompt is required unless --serve is given")
+    if args.elastic_cache is not None:
+        try:
+            args.elastic_cache = parse_elastic_cache(args.elastic_cache)
+        except ValueError as e:
+            parser.error(f"--elastic-cache: {e}")
+        if args.model == "z-image-turbo":
+            # ElasticBlockCache wraps FLUX's transformer_blocks; Z-Image's DiT
+            # has a different block layout
+            parser.error("--elastic-cache supports the FLUX models (dev, schnell) only")
+    if args.gguf and args.model == "z-image-turbo":
+        # the GGUF loader builds a FluxTransformer2DModel
+        parser.error("--gguf supports the FLUX models (dev, schnell) only")
+    if args.cache_mode != "none":
+        if args.model == "z-image-turbo":
+            parser.error("--cache-mode supports the FLUX models (dev, schnell) only")
+        if args.quant_backend == "mflux" and not args.gguf:
+            # mflux has no cache hook; without these the diffusers path would
+            # load the transformer and T5 unquantized in bf16
+            parser.error("--cache-mode runs through diffusers: pick a non-mflux "
+                         "--quant-backend (e.g. torchao-int8) or --gguf")
+        if args.elastic_cache is not None:
+            parser.error("--cache-mode and --elastic-cache cannot be combined")
 
     # Get model info
     model_info = MODELS[args.model]
@@ -93,10 +638,10 @@ Examples:
     elif args.width and args.height:
         width, height = args.width, args.height
         # Validate divisible by 64
-        if width % 64 != 0 or height % 64 != 0:
+        if (width | height) & 63:
             print(f"❌ Error: Width and height must be divisible by 64")
             print(f"   Current: {width}x{height}")
-            print(f"   Nearest valid: {(width//64)*64}x{(height//64)*64}")
+            print(f"   Nearest valid: {width & ~63}x{height & ~63}")
             sys.exit(1)
     else:
         width, height = 1024, 1024  # Default square
@@ -107,49 +652,23 @@ Examples:
     else:
         steps = model_info["default_steps"]
 
+    # Set Hugging Face token (skips the .env read when already exported)
+    token = _load_hf_token()
+    if token and "HUGGING_FACE_HUB_TOKEN" not in os.environ:
+        os.environ["HUGGING_FACE_HUB_TOKEN"] = token
+
+    if args.serve:
+        serve(args, width, height, steps)
+        return
+
     # Generate output filename
     if args.output:
         output_file = Path(args.output)
     else:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = Path("/Users/arthurdell/ARTHUR/generated_images")
-        output_dir.mkdir(exist_ok=True)
-        output_file = output_dir / f"{args.model}_{width}x{height}_{timestamp}.png"
-
-    # Set Hugging Face token from .env
-    env_file = Path("/Users/arthurdell/ARTHUR/.env")
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                if line.startswith("HF_TOKEN="):
-                    token = line.strip().split("=", 1)[1]
-                    os.environ["HUGGING_FACE_HUB_TOKEN"] = token
-                    break
-
-    # Build command based on model
-    if args.model in ["dev", "schnell"]:
-        cmd = [
-            "/opt/homebrew/bin/mflux-generate",
-            "--model", args.model,
-            "--prompt", args.prompt,
-            "--steps", str(steps),
-            "--height", str(height),
-            "--width", str(width),
-            "--quantize", str(args.quantize),
-            "--output", str(output_file)
-        ]
-    elif args.model == "z-image-turbo":
-        cmd = [
-            "/opt/homebrew/bin/mflux-generate-z-image-turbo",
-            "--prompt", args.prompt,
-            "--steps", str(steps),
-            "--height", str(height),
-            "--width", str(width),
-            "--output", str(output_file)
-        ]
+        output_file = default_output(args.model, width, height)
 
-    if args.seed:
-        cmd.extend(["--seed", str(args.seed)])
+    cmd = build_command(args.prompt, args.model, width, height, steps,
+                        args.quantize, args.seed, output_file)
 
     # Display generation info
     print(f"\n{'='*60}")
@@ -159,8 +678,20 @@ Examples:
     print(f"Model: {model_info['name']}")
     print(f"Resolution: {width}x{height} ({width*height/1_000_000:.1f}MP)")
     print(f"Steps: {steps}")
-    if args.model in ["dev", "schnell"]:
+    if uses_diffusers(args):
+        if args.gguf:
+            print(f"Transformer: {args.gguf} (GGUF)")
+        else:
+            print(f"Quantization: {args.quant_backend} (diffusers)")
+        if args.cache_mode != "none":
+            print(f"Feature cache: {args.cache_mode}")
+        if args.elastic_cache is not None:
+            print(f"Elastic cache: tau={args.elastic_cache['tau']}, "
+                  f"min_depth={args.elastic_cache['min_depth']}")
+    elif args.model in ["dev", "schnell"]:
         print(f"Quantization: {args.quantize}-bit")
+    if not args.daemon:
+        print(f"Backend: {compute_backend(uses_diffusers(args))}")
     if args.seed:
         print(f"Seed: {args.seed}")
     print(f"Output: {output_file}")
@@ -175,9 +706,34 @@ Examples:
     elif args.model == "z-image-turbo":
         print(f"   (Ultra-fast, ~3-10 seconds)\n")
 
-    result = subprocess.run(cmd)
+    if args.daemon:
+        reply = generate_via_daemon({
+            "prompt": args.prompt,
+            "model": args.model,
+            "width": width,
+            "height": height,
+            "steps": steps,
+            "quantize": args.quantize,
+            "seed": args.seed,
+            "output": str(output_file.resolve()),
+            "quant_backend": args.quant_backend,
+            "gguf": args.gguf,
+            "cache_mode": args.cache_mode,
+            "elastic_cache": args.elastic_cache,
+        })
+        succeeded = reply["status"] == "ok"
+        if succeeded:
+            print(f"   (daemon: {reply['ms'] / 1000:.1f}s)")
+        else:
+            print(f"   Daemon error: {reply.get('error')}")
+    elif uses_diffusers(args):
+        succeeded = _generate_diffusers(args.prompt, args.model, width, height, steps,
+                                        args.quant_backend, args.seed, output_file,
+                                        args.gguf, args.cache_mode, args.elastic_cache)
+    else:
+        succeeded = subprocess.run(cmd).returncode == 0
 
-    if result.returncode == 0:
+    if succeeded:
         print(f"\n✅ Image generated successfully!")
         print(f"📁 Saved to: {output_file}")
 
@@ -6,10 +6,12 @@ Uses F5-TTS-MLX on BETA for high-quality voice synthesis.
 Usage:
   python scripts/generate_voiceover.py "Your text here" -o output.wav
   python scripts/generate_voiceover.py --segments segments.txt -o output_dir/
+  python scripts/generate_voiceover.py "Your text here" --mux-video clip.mp4
   python scripts/generate_voiceover.py --check
 """
 
 import sys
+import mmap
 import argparse
 from pathlib import Path
 
@@ -18,6 +20,22 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from arthur.generators.voice import VoiceGenerator, mux_audio
 
+# Segment files larger than this are mapped rather than decoded whole
+MMAP_THRESHOLD = 1 << 20
+
+
+def read_segments(path: Path) -> list[str]:
+  """Non-blank lines of a segments file, stripped."""
+  if path.stat().st_size < MMAP_THRESHOLD:
+    return [line.strip() for line in path.read_text().splitlines() if line.strip()]
+
+  with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    return [
+      line.decode().strip()
+      for line in iter(mm.readline, b"")
+      if line.strip()
+    ]
+
 
 def main():
   parser = argparse.ArgumentParser(
@@ -36,8 +54,9 @@ def main():
   parser.add_argument(
     "--output", "-o",
     type=Path,
-    default=Path("voiceover.wav"),
-    help="Output file path (or directory for segments)"
+    help="Output file path (or directory for segments; default: voiceover.wav). "
+         "With --mux-video and no --output, audio is streamed into ffmpeg "
+         "and no WAV is kept"
   )
 
   # Muxing options
@@ -63,6 +82,12 @@ def main():
     default="narration",
     help="Filename prefix for segments (default: narration)"
   )
+  parser.add_argument(
+    "--concurrency", "-j",
+    type=int,
+    default=4,
+    help="Segments generated on BETA at once (default: 4)"
+  )
 
   args = parser.parse_args()
 
@@ -79,6 +104,10 @@ def main():
       print("BETA is not reachable")
       sys.exit(1)
 
+  stream_mux = args.mux_video is not None and args.output is None
+  if args.output is None:
+    args.output = Path("voiceover.wav")
+
   # Validate input
   if not args.text and not args.segments:
     parser.error("Either text or --segments is required (or use --check)")
@@ -92,11 +121,7 @@ def main():
       print(f"Segments file not found: {args.segments}")
       sys.exit(1)
 
-    segments = [
-      line.strip()
-      for line in args.segments.read_text().splitlines()
-      if line.strip()
-    ]
+    segments = read_segments(args.segments)
 
     if not segments:
       print("No segments found in file")
@@ -108,7 +133,8 @@ def main():
     results = gen.generate_narration(
       segments=segments,
       output_dir=output_dir,
-      prefix=args.prefix
+      prefix=args.prefix,
+      concurrency=args.concurrency
     )
 
     successful = [r for r in results if r.success]
@@ -127,6 +153,24 @@ def main():
       for r in failed:
         print(f"  - \"{r.text[:50]}...\": {r.error}")
 
+  # Single text mode, streamed straight into the video
+  elif stream_mux:
+    mux_output = args.mux_output or args.mux_video.with_stem(
+      args.mux_video.stem + "_with_audio"
+    )
+    print(f"Generating voice: \"{args.text[:60]}{'...' if len(args.text) > 60 else ''}\"")
+    print(f"Muxing with video: {args.mux_video}")
+
+    result = gen.generate_muxed(args.text, args.mux_video, mux_output)
+
+    if result.success:
+      print(f"Muxed video: {result.path}")
+      print(f"  Time: {result.generation_time:.1f}s")
+      print(f"  Size: {result.file_size / 1024:.1f} KB")
+    else:
+      print(f"Generation failed: {result.error}")
+      sys.exit(1)
+
   # Single text mode
   else:
     print(f"Generating voice: \"{args.text[:60]}{'...' if len(args.text) > 60 else ''}\"")
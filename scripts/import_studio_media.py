@@ -9,8 +9,10 @@ Parses descriptive filenames to extract:
 - Generation source (wan26, veo, press_kit, etc.)
 """
 
+import os
 import re
 import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 
 # Add arthur module to path
@@ -18,6 +20,43 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from arthur.media_db import MediaDatabase
 
+# Below this many files, process start-up costs more than the parse itself
+PARALLEL_PARSE_THRESHOLD = 256
+INSERT_WORKERS = 4
+# Records hold whole files, so cap how many are built but not yet written
+MAX_IN_FLIGHT = INSERT_WORKERS * 2
+
+
+# Keyword tables, built once at import rather than on every call
+COMPANIES = (
+  ("acsa", "acsa"),
+  ("bmw", "bmw"),
+  ("bsi", "bsi"),
+  ("citrix", "citrix"),
+  ("hp", "hp"),
+  ("ibm", "ibm"),
+  ("sun", "sun_microsystems"),
+  ("symantec", "symantec"),
+)
+# (spelling to look for, canonical subject)
+PRODUCTS = tuple(
+  (variant, product.replace(" ", "_"))
+  for product in ("mac_studio", "dgx_spark", "dgx spark", "macstudio")
+  for variant in dict.fromkeys((product.replace("_", " "), product))
+)
+STYLE_KEYWORDS = (
+  ("cinematic", "cinematic"),
+  ("hero", "hero_shot"),
+  ("premium", "premium"),
+  ("professional", "professional"),
+  ("neural", "neural_network"),
+  ("holographic", "futuristic"),
+  ("robot", "robotics"),
+  ("humanoid", "robotics"),
+)
+EPISODE_RE = re.compile(r'ep(\d+)')
+SCENE_RE = re.compile(r'scene(\d+)')
+
 
 def parse_filename_metadata(filepath: Path) -> dict:
   """Extract metadata from filename patterns."""
@@ -25,9 +64,10 @@ def parse_filename_metadata(filepath: Path) -> dict:
   parent_dir = filepath.parent.name.lower()
   grandparent_dir = filepath.parent.parent.name.lower() if filepath.parent.parent else ""
 
+  # Sets dedupe in O(1); sorted on return for deterministic DB rows
+  subjects = set()
+  style_tags = set()
   metadata = {
-    "subjects": [],
-    "style_tags": [],
     "content_type": None,
     "source": "studio",
     "generation_model": None,
@@ -38,36 +78,23 @@ def parse_filename_metadata(filepath: Path) -> dict:
   if grandparent_dir == "press_kit" or parent_dir == "press_kit":
     metadata["source"] = "press_kit"
     if parent_dir in ["dgx_spark", "mac_studio"]:
-      metadata["subjects"].append(parent_dir)
+      subjects.add(parent_dir)
       metadata["content_type"] = "product_hero"
 
   # Company/brand detection
-  companies = {
-    "acsa": "acsa",
-    "bmw": "bmw",
-    "bsi": "bsi",
-    "citrix": "citrix",
-    "hp": "hp",
-    "ibm": "ibm",
-    "sun": "sun_microsystems",
-    "symantec": "symantec",
-  }
-  for key, subject in companies.items():
+  for key, subject in COMPANIES:
     if key in filename:
-      metadata["subjects"].append(subject)
+      subjects.add(subject)
 
   # Product detection
-  products = ["mac_studio", "dgx_spark", "dgx spark", "macstudio"]
-  for product in products:
-    if product.replace("_", " ") in filename or product in filename:
-      clean_product = product.replace(" ", "_")
-      if clean_product not in metadata["subjects"]:
-        metadata["subjects"].append(clean_product)
+  for variant, product in PRODUCTS:
+    if variant in filename:
+      subjects.add(product)
 
   # AI-generated content
   if filename.startswith("ai ") or filename.startswith("ai_"):
-    metadata["style_tags"].append("ai_generated")
-    metadata["subjects"].append("ai_concept")
+    style_tags.add("ai_generated")
+    subjects.add("ai_concept")
 
   # Content type detection
   if "carousel" in filename or "carousel_slide" in filename:
@@ -84,7 +111,7 @@ def parse_filename_metadata(filepath: Path) -> dict:
     metadata["content_type"] = "dashboard"
   elif "datacenter" in filename or "data_center" in filename:
     metadata["content_type"] = "datacenter"
-    metadata["subjects"].append("datacenter")
+    subjects.add("datacenter")
   elif "office" in filename or "workspace" in filename:
     metadata["content_type"] = "workspace"
   elif "boardroom" in filename:
@@ -99,38 +126,118 @@ def parse_filename_metadata(filepath: Path) -> dict:
     metadata["generation_model"] = "veo3.1"
   elif "gemini" in filename:
     metadata["source"] = "gemini"
-    metadata["style_tags"].append("ai_generated")
+    style_tags.add("ai_generated")
 
   # Episode detection (ep1, ep2, ep3, ep4, etc.)
-  ep_match = re.search(r'ep(\d+)', filename)
+  ep_match = EPISODE_RE.search(filename)
   if ep_match:
     ep_num = int(ep_match.group(1))
     if 1 <= ep_num <= 8:
       metadata["episode_assignments"].append(ep_num)
 
   # Style tags from filename
-  style_keywords = {
-    "cinematic": "cinematic",
-    "hero": "hero_shot",
-    "premium": "premium",
-    "professional": "professional",
-    "neural": "neural_network",
-    "holographic": "futuristic",
-    "robot": "robotics",
-    "humanoid": "robotics",
-  }
-  for keyword, tag in style_keywords.items():
-    if keyword in filename and tag not in metadata["style_tags"]:
-      metadata["style_tags"].append(tag)
+  for keyword, tag in STYLE_KEYWORDS:
+    if keyword in filename:
+      style_tags.add(tag)
 
   # Scene numbers from filename (scene1, scene3, etc.)
-  scene_match = re.search(r'scene(\d+)', filename)
+  scene_match = SCENE_RE.search(filename)
   if scene_match:
-    metadata["style_tags"].append(f"scene_{scene_match.group(1)}")
+    style_tags.add(f"scene_{scene_match.group(1)}")
 
+  metadata["subjects"] = sorted(subjects)
+  metadata["style_tags"] = sorted(style_tags)
   return metadata
 
 
+def iter_media(root: Path, extensions: set):
+  """Yield files under root whose suffix is in extensions (lower-case, with dot).
+
+  Walks with os.scandir so file/dir checks come from the directory entry
+  instead of a stat() per path, and only matching files become Path objects.
+  """
+  stack = [str(root)]
+  while stack:
+    with os.scandir(stack.pop()) as entries:
+      for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+          stack.append(entry.path)
+        elif entry.is_file():
+          name = entry.name
+          dot = name.rfind(".")
+          if dot > 0 and name[dot:].lower() in extensions:
+            yield Path(entry.path)
+
+
+def parse_all_metadata(files: list) -> list:
+  """Parse metadata for many files, fanning out across processes for large sets."""
+  if len(files) < PARALLEL_PARSE_THRESHOLD:
+    return [parse_filename_metadata(f) for f in files]
+  with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+    return list(pool.map(parse_filename_metadata, files, chunksize=64))
+
+
+def build_asset_record(db: MediaDatabase, f: Path, meta: dict, media_type: str) -> dict:
+  """Build the asset row for one image or video with its parsed filename metadata."""
+  common = dict(
+    source=meta["source"],
+    content_type=meta["content_type"],
+    subjects=meta["subjects"] if meta["subjects"] else None,
+    style_tags=meta["style_tags"] if meta["style_tags"] else None,
+    episode_assignments=meta["episode_assignments"] if meta["episode_assignments"] else None
+  )
+  if media_type == "image":
+    return db._build_image_record(str(f), **common)
+  return db._build_video_record(str(f), generation_model=meta["generation_model"], **common)
+
+
+def import_assets(db: MediaDatabase, files: list, metas: list, media_type: str) -> int:
+  """Build rows concurrently and write them to LanceDB in batches.
+
+  Reading files, ffmpeg thumbnailing and embedding run on worker threads;
+  rows are appended from this thread every INSERT_BATCH_SIZE files (or
+  INSERT_BATCH_BYTES of media) so the table gets a few large fragments
+  instead of one per file. At most MAX_IN_FLIGHT files are submitted at a
+  time, so only a few files' bytes are held beyond the pending batch.
+  """
+  imported = 0
+  batch = []
+  batch_bytes = 0
+  pending = iter(zip(files, metas))
+  with ThreadPoolExecutor(max_workers=INSERT_WORKERS) as pool:
+    in_flight = {}
+
+    def submit_next():
+      for f, meta in pending:
+        in_flight[pool.submit(build_asset_record, db, f, meta, media_type)] = f
+        return
+
+    for _ in range(MAX_IN_FLIGHT):
+      submit_next()
+
+    while in_flight:
+      done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+      for future in done:
+        f = in_flight.pop(future)
+        submit_next()
+        try:
+          record = future.result()
+        except Exception as e:
+          print(f"  ✗ {f.name}: {e}")
+          continue
+
+        batch.append(record)
+        batch_bytes += record["file_size_bytes"]
+        print(f"  ✓ {f.name} → {record['id'][:8]}...")
+        if len(batch) >= db.INSERT_BATCH_SIZE or batch_bytes >= db.INSERT_BATCH_BYTES:
+          imported += db.add_assets(batch)
+          batch = []
+          batch_bytes = 0
+
+  imported += db.add_assets(batch)
+  return imported
+
+
 def import_studio_media(dry_run: bool = False):
   """Import all media from /Volumes/STUDIO into database."""
 
@@ -146,8 +253,7 @@ def import_studio_media(dry_run: bool = False):
   # Get existing filenames to avoid duplicates
   existing = set()
   try:
-    df = db.assets_table.search().limit(10000).to_pandas()
-    existing = set(df['filename'].tolist())
+    existing = db.filenames()
     print(f"Found {len(existing)} existing assets in database")
   except Exception as e:
     print(f"Note: Could not check existing assets: {e}")
@@ -162,22 +268,20 @@ def import_studio_media(dry_run: bool = False):
   # Scan IMAGES directory
   images_dir = studio_path / "IMAGES"
   if images_dir.exists():
-    for f in images_dir.rglob("*"):
-      if f.is_file() and f.suffix.lower() in image_extensions:
-        if f.name not in existing:
-          images_to_import.append(f)
-        else:
-          print(f"  Skip (exists): {f.name}")
+    for f in iter_media(images_dir, image_extensions):
+      if f.name not in existing:
+        images_to_import.append(f)
+      else:
+        print(f"  Skip (exists): {f.name}")
 
   # Scan VIDEO directory
   video_dir = studio_path / "VIDEO"
   if video_dir.exists():
-    for f in video_dir.rglob("*"):
-      if f.is_file() and f.suffix.lower() in video_extensions:
-        if f.name not in existing:
-          videos_to_import.append(f)
-        else:
-          print(f"  Skip (exists): {f.name}")
+    for f in iter_media(video_dir, video_extensions):
+      if f.name not in existing:
+        videos_to_import.append(f)
+      else:
+        print(f"  Skip (exists): {f.name}")
 
   print(f"\nFound {len(images_to_import)} new images to import")
   print(f"Found {len(videos_to_import)} new videos to import")
@@ -201,44 +305,21 @@ def import_studio_media(dry_run: bool = False):
       print(f"  ... and {len(videos_to_import) - 10} more")
     return
 
+  # Parse all filenames up front, then insert in parallel
+  image_metas = parse_all_metadata(images_to_import)
+  video_metas = parse_all_metadata(videos_to_import)
+
+  # Load CLIP once before worker threads race to initialise it
+  if images_to_import or videos_to_import:
+    db._get_clip_model()
+
   # Import images
   print("\n=== Importing Images ===")
-  imported_images = 0
-  for f in images_to_import:
-    try:
-      meta = parse_filename_metadata(f)
-      asset_id = db.add_image(
-        str(f),
-        source=meta["source"],
-        content_type=meta["content_type"],
-        subjects=meta["subjects"] if meta["subjects"] else None,
-        style_tags=meta["style_tags"] if meta["style_tags"] else None,
-        episode_assignments=meta["episode_assignments"] if meta["episode_assignments"] else None
-      )
-      imported_images += 1
-      print(f"  ✓ {f.name} → {asset_id[:8]}...")
-    except Exception as e:
-      print(f"  ✗ {f.name}: {e}")
+  imported_images = import_assets(db, images_to_import, image_metas, "image")
 
   # Import videos
   print("\n=== Importing Videos ===")
-  imported_videos = 0
-  for f in videos_to_import:
-    try:
-      meta = parse_filename_metadata(f)
-      asset_id = db.add_video(
-        str(f),
-        source=meta["source"],
-        generation_model=meta["generation_model"],
-        content_type=meta["content_type"],
-        subjects=meta["subjects"] if meta["subjects"] else None,
-        style_tags=meta["style_tags"] if meta["style_tags"] else None,
-        episode_assignments=meta["episode_assignments"] if meta["episode_assignments"] else None
-      )
-      imported_videos += 1
-      print(f"  ✓ {f.name} → {asset_id[:8]}...")
-    except Exception as e:
-      print(f"  ✗ {f.name}: {e}")
+  imported_videos = import_assets(db, videos_to_import, video_metas, "video")
 
   # Summary
   print("\n" + "=" * 50)
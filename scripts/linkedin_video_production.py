@@ -15,21 +15,46 @@ import os
 import sys
 import json
 import time
+import uuid
+import shutil
+import shelve
+import asyncio
+import hashlib
+import importlib.util
 import httpx
 import random
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, asdict, field
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from functools import wraps
 from typing import Optional, Literal
 
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+try:
+  from websockets.asyncio.client import connect as ws_connect
+  from websockets.exceptions import ConnectionClosed
+except ImportError:  # fall back to polling /history
+  ws_connect = None
+  ConnectionClosed = ConnectionError
+
 # ============================================================================
 # Configuration
 # ============================================================================
 
 BETA_URL = "http://192.168.70.16:8188"
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # bytes held in memory per download
 WAN26_API_KEY = os.getenv("WAN26_API_KEY", "")
 OUTPUT_BASE = Path("/Users/arthurdell/ARTHUR/videos/linkedin_series")
 STUDIO_OUTPUT = Path("/Volumes/STUDIO/VIDEO/LinkedIn_TechStack_Series")
+# workflow hash -> rendered file, for fixed-seed re-runs
+WAN22_CACHE_INDEX = Path.home() / ".cache" / "alpha" / "wan22_cache.json"
+# workflow hash -> in-flight ComfyUI prompt_id, so interrupted runs resume
+STATE_PATH = OUTPUT_BASE / ".alpha_state"
 
 # Wan 2.2 Settings (optimized for 256GB Apple Silicon)
 WAN22_CONFIG = {
@@ -46,24 +71,32 @@ WAN22_CONFIG = {
   "resolution_480p": (832, 480),
 }
 
+_FPS = WAN22_CONFIG["fps"]
+_RES_MAP = {
+  "720p": WAN22_CONFIG["resolution_720p"],
+  "480p": WAN22_CONFIG["resolution_480p"],
+}
+DEFAULT_NEGATIVE_PROMPT = "blurry, low quality, distorted, watermark, static, overexposed"
+
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class VideoPrompt:
   """A single video generation prompt"""
   id: str
   episode: int
   label: str
   prompt: str
-  negative_prompt: str = "blurry, low quality, distorted, watermark, static, overexposed"
+  negative_prompt: str = DEFAULT_NEGATIVE_PROMPT
   backend: Literal["wan22", "wan26"] = "wan22"
   resolution: str = "720p"
   duration_target: float = 5.0  # seconds
   priority: Literal["hero", "detail", "b-roll"] = "detail"
+  seed: Optional[int] = None  # fixed seed makes the render cacheable
 
-@dataclass
+@dataclass(slots=True)
 class ProductionResult:
   """Result of video production"""
   prompt_id: str
@@ -77,7 +110,14 @@ class ProductionResult:
   error: Optional[str] = None
   prompt: str = ""
 
-@dataclass
+# ProductionResult is flat, so a shallow field copy replaces asdict()'s deepcopy walk
+_RESULT_FIELDS = tuple(f.name for f in fields(ProductionResult))
+
+def result_record(result: ProductionResult) -> dict:
+  """JSON-ready dict of a ProductionResult"""
+  return {name: getattr(result, name) for name in _RESULT_FIELDS}
+
+@dataclass(slots=True)
 class ProductionBatch:
   """A batch of prompts for production"""
   name: str
@@ -88,6 +128,156 @@ class ProductionBatch:
 # Wan 2.2 Workflow Generator
 # ============================================================================
 
+WAN22_DEFAULT_NEGATIVE_PROMPT = "色调艳丽，过曝，静态，细节模糊不清，字幕，风格，作品，画作，画面，静止，整体发灰，最差质量，低质量，JPEG压缩残留，丑陋的，残缺的，多余的手指，画得不好的手部，画得不好的脸部，畸形的，毁容的，形态畸形的肢体，手指融合，静止不动的画面，杂乱的背景，三条腿，背景人很多，倒着走"
+
+# Static Wan 2.2 graph, serialized once; create_wan22_workflow() patches
+# the per-video fields (zeroed/empty here) into a fresh json.loads copy
+_WAN22_TEMPLATE = json.dumps({
+  # High Noise Model
+  "37": {
+    "inputs": {
+      "unet_name": "wan2.2_t2v_high_noise_14B_fp16.safetensors",
+      "weight_dtype": "default"
+    },
+    "class_type": "UNETLoader"
+  },
+  # Low Noise Model
+  "56": {
+    "inputs": {
+      "unet_name": "wan2.2_t2v_low_noise_14B_fp16.safetensors",
+      "weight_dtype": "default"
+    },
+    "class_type": "UNETLoader"
+  },
+  # CLIP Text Encoder
+  "38": {
+    "inputs": {
+      "clip_name": "umt5_xxl_fp8_e4m3fn_scaled.safetensors",
+      "type": "wan",
+      "device": "default"
+    },
+    "class_type": "CLIPLoader"
+  },
+  # VAE
+  "39": {
+    "inputs": {
+      "vae_name": "wan_2.1_vae.safetensors"
+    },
+    "class_type": "VAELoader"
+  },
+  # Model Sampling for High Noise
+  "54": {
+    "inputs": {
+      "model": ["37", 0],
+      "shift": 8.0
+    },
+    "class_type": "ModelSamplingSD3"
+  },
+  # Model Sampling for Low Noise
+  "55": {
+    "inputs": {
+      "model": ["56", 0],
+      "shift": 8.0
+    },
+    "class_type": "ModelSamplingSD3"
+  },
+  # Positive Prompt
+  "6": {
+    "inputs": {
+      "text": "",
+      "clip": ["38", 0]
+    },
+    "class_type": "CLIPTextEncode"
+  },
+  # Negative Prompt
+  "7": {
+    "inputs": {
+      "text": "",
+      "clip": ["38", 0]
+    },
+    "class_type": "CLIPTextEncode"
+  },
+  # Empty Latent Video
+  "61": {
+    "inputs": {
+      "width": 0,
+      "height": 0,
+      "length": 0,
+      "batch_size": 1
+    },
+    "class_type": "EmptyHunyuanLatentVideo"
+  },
+  # First Sampler (High Noise Model, steps 0-10)
+  "57": {
+    "inputs": {
+      "model": ["54", 0],
+      "positive": ["6", 0],
+      "negative": ["7", 0],
+      "latent_image": ["61", 0],
+      "add_noise": "enable",
+      "noise_seed": 0,
+      "steps": 0,
+      "cfg": 0.0,
+      "sampler_name": "euler",
+      "scheduler": "simple",
+      "start_at_step": 0,
+      "end_at_step": 0,
+      "return_with_leftover_noise": "enable"
+    },
+    "class_type": "KSamplerAdvanced"
+  },
+  # Second Sampler (Low Noise Model, steps 10+)
+  "58": {
+    "inputs": {
+      "model": ["55", 0],
+      "positive": ["6", 0],
+      "negative": ["7", 0],
+      "latent_image": ["57", 0],
+      "add_noise": "disable",
+      "noise_seed": 0,
+      "steps": 0,
+      "cfg": 0.0,
+      "sampler_name": "euler",
+      "scheduler": "simple",
+      "start_at_step": 0,
+      "end_at_step": 10000,
+      "return_with_leftover_noise": "disable"
+    },
+    "class_type": "KSamplerAdvanced"
+  },
+  # VAE Decode
+  "8": {
+    "inputs": {
+      "samples": ["58", 0],
+      "vae": ["39", 0]
+    },
+    "class_type": "VAEDecode"
+  },
+  # Save as WEBP Animation
+  "28": {
+    "inputs": {
+      "images": ["8", 0],
+      "filename_prefix": "linkedin",
+      "fps": 16,
+      "lossless": False,
+      "quality": 85,
+      "method": "default"
+    },
+    "class_type": "SaveAnimatedWEBP"
+  },
+  # Save as WEBM Video
+  "47": {
+    "inputs": {
+      "images": ["8", 0],
+      "filename_prefix": "linkedin",
+      "codec": "vp9",
+      "fps": 16,
+      "crf": 23
+    },
+    "class_type": "SaveWEBM"
+  }
+})
+
 def create_wan22_workflow(
   prompt: str,
   negative_prompt: str = "",
@@ -96,7 +286,8 @@ def create_wan22_workflow(
   num_frames: int = 81,
   steps: int = 20,
   cfg: float = 3.5,
-  seed: Optional[int] = None
+  seed: Optional[int] = None,
+  save_webp: bool = False
 ) -> dict:
   """
   Create Wan 2.2 14B text-to-video workflow for ComfyUI
@@ -104,164 +295,112 @@ def create_wan22_workflow(
   Uses MoE architecture with two-stage sampling:
   1. High noise model (steps 0-10)
   2. Low noise model (steps 10+)
+
+  Frames are encoded once, to WEBM; save_webp adds the animated WEBP
+  encode as a second output.
   """
 
   if seed is None:
     seed = random.randint(0, 2**31)
 
-  if not negative_prompt:
-    negative_prompt = "色调艳丽，过曝，静态，细节模糊不清，字幕，风格，作品，画作，画面，静止，整体发灰，最差质量，低质量，JPEG压缩残留，丑陋的，残缺的，多余的手指，画得不好的手部，画得不好的脸部，畸形的，毁容的，形态畸形的肢体，手指融合，静止不动的画面，杂乱的背景，三条腿，背景人很多，倒着走"
-
   high_steps = min(10, steps // 2)
 
-  workflow = {
-    # High Noise Model
-    "37": {
-      "inputs": {
-        "unet_name": "wan2.2_t2v_high_noise_14B_fp16.safetensors",
-        "weight_dtype": "default"
-      },
-      "class_type": "UNETLoader"
-    },
-    # Low Noise Model
-    "56": {
-      "inputs": {
-        "unet_name": "wan2.2_t2v_low_noise_14B_fp16.safetensors",
-        "weight_dtype": "default"
-      },
-      "class_type": "UNETLoader"
-    },
-    # CLIP Text Encoder
-    "38": {
-      "inputs": {
-        "clip_name": "umt5_xxl_fp8_e4m3fn_scaled.safetensors",
-        "type": "wan",
-        "device": "default"
-      },
-      "class_type": "CLIPLoader"
-    },
-    # VAE
-    "39": {
-      "inputs": {
-        "vae_name": "wan_2.1_vae.safetensors"
-      },
-      "class_type": "VAELoader"
-    },
-    # Model Sampling for High Noise
-    "54": {
-      "inputs": {
-        "model": ["37", 0],
-        "shift": 8.0
-      },
-      "class_type": "ModelSamplingSD3"
-    },
-    # Model Sampling for Low Noise
-    "55": {
-      "inputs": {
-        "model": ["56", 0],
-        "shift": 8.0
-      },
-      "class_type": "ModelSamplingSD3"
-    },
-    # Positive Prompt
-    "6": {
-      "inputs": {
-        "text": prompt,
-        "clip": ["38", 0]
-      },
-      "class_type": "CLIPTextEncode"
-    },
-    # Negative Prompt
-    "7": {
-      "inputs": {
-        "text": negative_prompt,
-        "clip": ["38", 0]
-      },
-      "class_type": "CLIPTextEncode"
-    },
-    # Empty Latent Video
-    "61": {
-      "inputs": {
-        "width": width,
-        "height": height,
-        "length": num_frames,
-        "batch_size": 1
-      },
-      "class_type": "EmptyHunyuanLatentVideo"
-    },
-    # First Sampler (High Noise Model, steps 0-10)
-    "57": {
-      "inputs": {
-        "model": ["54", 0],
-        "positive": ["6", 0],
-        "negative": ["7", 0],
-        "latent_image": ["61", 0],
-        "add_noise": "enable",
-        "noise_seed": seed,
-        "steps": steps,
-        "cfg": cfg,
-        "sampler_name": "euler",
-        "scheduler": "simple",
-        "start_at_step": 0,
-        "end_at_step": high_steps,
-        "return_with_leftover_noise": "enable"
-      },
-      "class_type": "KSamplerAdvanced"
-    },
-    # Second Sampler (Low Noise Model, steps 10+)
-    "58": {
-      "inputs": {
-        "model": ["55", 0],
-        "positive": ["6", 0],
-        "negative": ["7", 0],
-        "latent_image": ["57", 0],
-        "add_noise": "disable",
-        "noise_seed": 0,
-        "steps": steps,
-        "cfg": cfg,
-        "sampler_name": "euler",
-        "scheduler": "simple",
-        "start_at_step": high_steps,
-        "end_at_step": 10000,
-        "return_with_leftover_noise": "disable"
-      },
-      "class_type": "KSamplerAdvanced"
-    },
-    # VAE Decode
-    "8": {
-      "inputs": {
-        "samples": ["58", 0],
-        "vae": ["39", 0]
-      },
-      "class_type": "VAEDecode"
-    },
-    # Save as WEBP Animation
-    "28": {
-      "inputs": {
-        "images": ["8", 0],
-        "filename_prefix": "linkedin",
-        "fps": 16,
-        "lossless": False,
-        "quality": 85,
-        "method": "default"
-      },
-      "class_type": "SaveAnimatedWEBP"
-    },
-    # Save as WEBM Video
-    "47": {
-      "inputs": {
-        "images": ["8", 0],
-        "filename_prefix": "linkedin",
-        "codec": "vp9",
-        "fps": 16,
-        "crf": 23
-      },
-      "class_type": "SaveWEBM"
-    }
-  }
+  workflow = json.loads(_WAN22_TEMPLATE)
+  workflow["6"]["inputs"]["text"] = prompt
+  workflow["7"]["inputs"]["text"] = negative_prompt or WAN22_DEFAULT_NEGATIVE_PROMPT
+
+  latent = workflow["61"]["inputs"]
+  latent["width"], latent["height"], latent["length"] = width, height, num_frames
+
+  high_sampler = workflow["57"]["inputs"]
+  high_sampler.update(noise_seed=seed, steps=steps, cfg=cfg, end_at_step=high_steps)
+  low_sampler = workflow["58"]["inputs"]
+  low_sampler.update(steps=steps, cfg=cfg, start_at_step=high_steps)
+
+  if not save_webp:
+    del workflow["28"]
 
   return workflow
 
+def _json_bytes(data) -> bytes:
+  """Indented JSON as bytes; orjson encodes straight to bytes when installed"""
+  if orjson is not None:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+  return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+def _wf_key(workflow: dict) -> str:
+  """Content hash of a fully specified workflow"""
+  payload = json.dumps(workflow, sort_keys=True).encode()
+  return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _resume_key(workflow: dict, seeded: bool) -> str:
+  """Hash identifying a job across runs; a random seed doesn't make it new"""
+  if not seeded:
+    sampler = workflow["57"]
+    workflow = {**workflow, "57": {**sampler, "inputs": {**sampler["inputs"], "noise_seed": None}}}
+  return _wf_key(workflow)
+
+def _job_state_key(resume_key: str, occurrence: int) -> str:
+  """
+  Shelve key for the occurrence-th job with this resume key in a run
+
+  Identical jobs submitted together (e.g. the same unseeded prompt twice)
+  must not share one entry, or the second submit overwrites the first
+  prompt_id and the first completion removes the entry the other needs.
+  Numbering them in submission order keeps each resumable across runs.
+  """
+  return f"{resume_key}#{occurrence}"
+
+def _load_wan22_cache() -> dict:
+  """workflow hash -> output path, for renders that still exist"""
+  try:
+    index = json.loads(WAN22_CACHE_INDEX.read_text())
+  except (OSError, ValueError):
+    return {}
+  return {key: path for key, path in index.items() if Path(path).exists()}
+
+def _record_wan22_cache(key: str, output_path: Path):
+  """Remember a successful fixed-seed render"""
+  index = _load_wan22_cache()
+  index[key] = str(output_path)
+  WAN22_CACHE_INDEX.parent.mkdir(parents=True, exist_ok=True)
+  tmp_path = WAN22_CACHE_INDEX.with_suffix(".tmp")
+  tmp_path.write_text(json.dumps(index, indent=2))
+  tmp_path.replace(WAN22_CACHE_INDEX)
+
+def async_retry_with_backoff(
+  max_retries: int = 4,
+  initial_delay: float = 1.0,
+  max_delay: float = 30.0
+):
+  """
+  Retry an httpx coroutine on transient failures with jittered backoff
+
+  Transport errors (connect/read timeouts, resets) and HTTP 429/5xx are
+  retried; other HTTP errors are raised immediately. After max_retries
+  the last exception propagates to the caller's own error handling.
+  """
+  def decorator(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+      delay = initial_delay
+      for attempt in range(max_retries + 1):
+        try:
+          return await func(*args, **kwargs)
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+          if isinstance(e, httpx.HTTPStatusError) and not (
+            e.response.status_code == 429 or e.response.status_code >= 500
+          ):
+            raise
+          if attempt == max_retries:
+            raise
+          wait = random.uniform(0, min(max_delay, delay))
+          print(f"\n  {func.__name__} failed ({e!r}), retrying in {wait:.1f}s")
+          await asyncio.sleep(wait)
+          delay *= 2
+    return wrapper
+  return decorator
+
 # ============================================================================
 # BETA ComfyUI Client
 # ============================================================================
@@ -269,14 +408,113 @@ def create_wan22_workflow(
 class BetaComfyUIClient:
   """Client for BETA ComfyUI Wan 2.2 generation"""
 
-  def __init__(self, base_url: str = BETA_URL):
+  def __init__(self, base_url: str = BETA_URL, max_concurrent: int = 2):
     self.base_url = base_url
-    self.client = httpx.Client(timeout=30.0)
+    self._sem = asyncio.Semaphore(max_concurrent)
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    self._state = shelve.open(str(STATE_PATH))
+    # Identical jobs in one run get distinct state keys (see _job_state_key)
+    self._key_uses = Counter()
+    # One pooled client for submit/history/queue/view; HTTP/2 multiplexes
+    # concurrent requests on one connection when h2 is installed and the
+    # server negotiates it
+    self.client = httpx.AsyncClient(
+      base_url=base_url,
+      http2=importlib.util.find_spec("h2") is not None,
+      timeout=httpx.Timeout(30.0, read=120.0),
+      limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+    # One event websocket for every prompt this client submits; a single
+    # reader task fans its messages out to per-prompt events
+    self.client_id = uuid.uuid4().hex
+    self.ws = None
+    self._ws_task = None
+    self._ws_lock = asyncio.Lock()
+    self._ws_failed = False
+    self._events: dict[str, asyncio.Event] = {}
+    self._results: dict[str, str] = {}  # prompt_id -> "done" | "closed" | error
+    self._progress: dict[str, tuple[int, int]] = {}  # prompt_id -> (step, steps)
+    self._progress_task = None
+
+  async def aclose(self):
+    """Stop the websocket reader and close the pooled HTTP connections"""
+    if self._ws_task is not None:
+      self._ws_task.cancel()
+    if self._progress_task is not None:
+      self._progress_task.cancel()
+    if self.ws is not None:
+      await self.ws.close()
+    self._state.close()
+    await self.client.aclose()
+
+  async def _start_listener(self) -> bool:
+    """Connect the event websocket once; False means poll /history instead"""
+    async with self._ws_lock:
+      if self._ws_task is not None or self._ws_failed:
+        return self.ws is not None
+      if ws_connect is None:
+        return False
+      ws_url = self.base_url.replace("http", "ws", 1) + f"/ws?clientId={self.client_id}"
+      try:
+        self.ws = await ws_connect(ws_url, open_timeout=10, max_size=None)
+      except Exception as e:
+        print(f"WebSocket unavailable ({e}), polling /history instead")
+        self._ws_failed = True
+        return False
+      self._ws_task = asyncio.create_task(self._ws_reader())
+      self._progress_task = asyncio.create_task(self._render_progress())
+      return True
 
-  def check_health(self) -> dict:
+  def _finish(self, prompt_id: str, status: str):
+    """Record a prompt's terminal status and wake its waiter"""
+    self._results[prompt_id] = status
+    self._progress.pop(prompt_id, None)
+    event = self._events.get(prompt_id)
+    if event is not None:
+      event.set()
+
+  async def _render_progress(self, interval: float = 1.0):
+    """Redraw one status line for all running prompts, at most once per interval"""
+    shown = None
+    while True:
+      await asyncio.sleep(interval)
+      if self._progress and self._progress != shown:
+        shown = dict(self._progress)
+        line = " | ".join(f"{pid[:8]} {step}/{steps}" for pid, (step, steps) in shown.items())
+        print(f"\r  {line}    ", end="", flush=True)
+
+  async def _ws_reader(self):
+    """Dispatch ComfyUI events to the waiting prompt_ids"""
+    try:
+      async for message in self.ws:
+        if isinstance(message, bytes):  # binary latent previews
+          continue
+
+        msg = json.loads(message)
+        data = msg.get("data", {})
+        prompt_id = data.get("prompt_id")
+        if prompt_id is None:
+          continue
+
+        if msg["type"] == "progress":
+          self._progress[prompt_id] = (data["value"], data["max"])
+        elif msg["type"] == "execution_error":
+          self._finish(prompt_id, data.get("exception_message") or "Execution error")
+        elif msg["type"] == "executing" and data.get("node") is None:
+          self._finish(prompt_id, "done")
+    except ConnectionClosed:
+      pass
+    finally:
+      # Anyone still waiting falls back to polling /history
+      self.ws = None
+      for prompt_id in list(self._events):
+        if prompt_id not in self._results:
+          self._finish(prompt_id, "closed")
+
+  async def check_health(self) -> dict:
     """Check BETA health"""
     try:
-      response = self.client.get(f"{self.base_url}/system_stats")
+      response = await self.client.get("/system_stats")
       response.raise_for_status()
       data = response.json()
       return {
@@ -288,23 +526,35 @@ class BetaComfyUIClient:
     except Exception as e:
       return {"status": "error", "error": str(e)}
 
-  def submit_workflow(self, workflow: dict) -> Optional[str]:
+  @async_retry_with_backoff()
+  async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+    """One API call, retried on transient transport/5xx failures"""
+    response = await self.client.request(method, url, **kwargs)
+    response.raise_for_status()
+    return response
+
+  async def submit_workflow(self, workflow: dict) -> Optional[str]:
     """Submit workflow and return prompt_id"""
     try:
-      response = self.client.post(
-        f"{self.base_url}/prompt",
-        json={"prompt": workflow}
+      response = await self._request(
+        "POST",
+        "/prompt",
+        json={"prompt": workflow, "client_id": self.client_id}
       )
-      response.raise_for_status()
-      return response.json().get("prompt_id")
+      prompt_id = response.json().get("prompt_id")
+      if prompt_id and self.ws is not None:
+        self._events[prompt_id] = asyncio.Event()
+        if prompt_id in self._results:  # finished before the POST returned
+          self._events[prompt_id].set()
+      return prompt_id
     except Exception as e:
       print(f"Submit error: {e}")
       return None
 
-  def get_queue_status(self) -> dict:
+  async def get_queue_status(self) -> dict:
     """Get queue status"""
     try:
-      response = self.client.get(f"{self.base_url}/queue")
+      response = await self.client.get("/queue")
       return response.json()
     except httpx.TimeoutException:
       return {"error": "timeout"}
@@ -312,41 +562,85 @@ class BetaComfyUIClient:
       print(f"Queue status error: {e}")
       return {}
 
-  def get_history(self, prompt_id: str) -> Optional[dict]:
+  async def get_history(self, prompt_id: str) -> Optional[dict]:
     """Get history for prompt"""
     try:
-      response = self.client.get(f"{self.base_url}/history/{prompt_id}")
+      response = await self._request("GET", f"/history/{prompt_id}")
       data = response.json()
       return data.get(prompt_id)
-    except httpx.TimeoutException:
-      return None
     except Exception as e:
       print(f"History error for {prompt_id}: {e}")
       return None
 
-  def wait_for_completion(self, prompt_id: str, timeout: int = 3600) -> Optional[dict]:
-    """Wait for workflow completion"""
+  async def wait_for_completion(self, prompt_id: str, timeout: int = 3600) -> Optional[dict]:
+    """Wait for workflow completion, signalled by the websocket reader"""
     start = time.time()
+    event = self._events.get(prompt_id)
+    if event is not None:
+      try:
+        await asyncio.wait_for(event.wait(), timeout)
+      except asyncio.TimeoutError:
+        return None
+      finally:
+        self._events.pop(prompt_id, None)
+
+      status = self._results.pop(prompt_id)
+      if status == "done":
+        history = await self.get_history(prompt_id)
+        return history if history and history.get("outputs") else None
+      if status != "closed":
+        print(f"\n  Execution error: {status}")
+        return None
+      print(f"\n  [{prompt_id[:8]}] WebSocket closed, polling /history instead")
+
+    return await self._poll_history(prompt_id, timeout - (time.time() - start))
+
+  async def _poll_history(self, prompt_id: str, timeout: int) -> Optional[dict]:
+    """
+    Poll /history until prompt_id has outputs
+
+    The interval starts at 0.5 s and doubles to 4 s so a short job is
+    noticed promptly; after a minute it settles at 5 s.
+    """
+    start = time.time()
+    polls = 0
 
     while time.time() - start < timeout:
-      history = self.get_history(prompt_id)
+      history = await self.get_history(prompt_id)
 
       if history:
         outputs = history.get("outputs", {})
         if outputs:
           return history
 
-      # Progress update
-      queue = self.get_queue_status()
-      running = len(queue.get("queue_running", []))
-      pending = len(queue.get("queue_pending", []))
       elapsed = time.time() - start
-      print(f"\r  [{elapsed:.0f}s] Running: {running}, Pending: {pending}    ", end="", flush=True)
+      print(f"\r  [{prompt_id[:8]} {elapsed:.0f}s] Waiting...    ", end="", flush=True)
 
-      time.sleep(5)
+      delay = 5.0 if elapsed >= 60 else 0.5 * 2 ** min(polls, 3)
+      polls += 1
+      await asyncio.sleep(min(delay, max(0.0, timeout - (time.time() - start))))
 
     return None
 
+  async def _resume(self, prompt_id: str) -> Optional[dict]:
+    """History of an interrupted prompt if it finished or is still queued, else None"""
+    history = await self.get_history(prompt_id)
+    if history and history.get("outputs"):
+      return history
+
+    queue = await self.get_queue_status()
+    queued = {
+      item[1]
+      for key in ("queue_running", "queue_pending")
+      for item in queue.get(key, [])
+    }
+    if prompt_id not in queued:
+      return None
+
+    # Submitted under an earlier client_id, so no websocket events: poll
+    print(f"Resuming queued prompt: {prompt_id}")
+    return await self._poll_history(prompt_id, 3600)
+
   def get_output_files(self, history: dict) -> list[str]:
     """Extract output filenames"""
     files = []
@@ -361,23 +655,34 @@ class BetaComfyUIClient:
 
     return files
 
-  def download_file(self, filename: str, output_path: Path) -> bool:
-    """Download output file"""
+  async def download_file(self, filename: str, output_path: Path) -> bool:
+    """Stream an output file to disk in 1 MiB chunks (via a .part file)"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = output_path.with_name(output_path.name + ".part")
     try:
-      response = self.client.get(
-        f"{self.base_url}/view",
-        params={"filename": filename, "type": "output"},
-        timeout=120.0
-      )
-      response.raise_for_status()
-      output_path.parent.mkdir(parents=True, exist_ok=True)
-      output_path.write_bytes(response.content)
+      await self._stream_to_file(filename, part_path)
+      part_path.replace(output_path)
       return True
     except Exception as e:
       print(f"Download error: {e}")
       return False
+    finally:
+      part_path.unlink(missing_ok=True)
+
+  @async_retry_with_backoff()
+  async def _stream_to_file(self, filename: str, part_path: Path):
+    """Stream /view into part_path; a retry restarts the file from scratch"""
+    async with self.client.stream(
+      "GET",
+      "/view",
+      params={"filename": filename, "type": "output"}
+    ) as response:
+      response.raise_for_status()
+      with open(part_path, "wb") as f:
+        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+          f.write(chunk)
 
-  def generate_video(
+  async def generate_video(
     self,
     prompt: str,
     negative_prompt: str = "",
@@ -385,9 +690,17 @@ class BetaComfyUIClient:
     height: int = 720,
     num_frames: int = 81,
     steps: int = 20,
-    output_dir: Path = OUTPUT_BASE
+    output_dir: Path = OUTPUT_BASE,
+    seed: Optional[int] = None
   ) -> ProductionResult:
-    """Generate a single video"""
+    """
+    Generate a single video
+
+    With a fixed seed the workflow is fully deterministic, so an identical
+    earlier render is copied from the cache instead of re-running BETA.
+    A job interrupted mid-render (Ctrl-C, crash) is resumed from its
+    recorded prompt_id rather than submitted again.
+    """
 
     print(f"\n{'='*60}")
     print(f"Generating: {prompt[:60]}...")
@@ -400,32 +713,75 @@ class BetaComfyUIClient:
       width=width,
       height=height,
       num_frames=num_frames,
-      steps=steps
+      steps=steps,
+      seed=seed
     )
 
-    # Submit
-    start_time = time.time()
-    prompt_id = self.submit_workflow(workflow)
-
-    if not prompt_id:
+    cache_key = _wf_key(workflow) if seed is not None else None
+    cached = _load_wan22_cache().get(cache_key) if cache_key else None
+    if cached:
+      output_path = output_dir / Path(cached).name
+      if output_path != Path(cached):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(cached, output_path)
+      file_size = output_path.stat().st_size / (1024 * 1024)
+      print(f"♻️  Cached: {output_path.name}")
       return ProductionResult(
-        prompt_id="",
-        success=False,
+        prompt_id=f"cache:{cache_key}",
+        success=True,
         backend="wan22-beta",
         generation_time=0,
-        file_size_mb=0,
-        output_path=None,
+        file_size_mb=file_size,
+        output_path=str(output_path),
         frames=num_frames,
         resolution=(width, height),
-        error="Failed to submit workflow",
         prompt=prompt
       )
 
-    print(f"Submitted: {prompt_id}")
-
-    # Wait for completion
-    history = self.wait_for_completion(prompt_id)
-    generation_time = time.time() - start_time
+    # Numbered before waiting on the semaphore so it follows call order
+    resume_key = _resume_key(workflow, seed is not None)
+    state_key = _job_state_key(resume_key, self._key_uses[resume_key])
+    self._key_uses[resume_key] += 1
+
+    # Only max_concurrent prompts sit in ComfyUI's queue at once; the GPU
+    # renders them serially anyway. Downloads happen outside the slot.
+    async with self._sem:
+      start_time = time.time()
+      history = None
+      prompt_id = self._state.get(state_key)
+      if prompt_id:
+        history = await self._resume(prompt_id)
+        if history:
+          print(f"Resumed: {prompt_id}")
+
+      if history is None:
+        # Listen before submitting so no completion event can be missed
+        await self._start_listener()
+
+        # Submit
+        prompt_id = await self.submit_workflow(workflow)
+
+        if not prompt_id:
+          return ProductionResult(
+            prompt_id="",
+            success=False,
+            backend="wan22-beta",
+            generation_time=0,
+            file_size_mb=0,
+            output_path=None,
+            frames=num_frames,
+            resolution=(width, height),
+            error="Failed to submit workflow",
+            prompt=prompt
+          )
+
+        self._state[state_key] = prompt_id
+        self._state.sync()
+        print(f"Submitted: {prompt_id}")
+
+        # Wait for completion
+        history = await self.wait_for_completion(prompt_id)
+      generation_time = time.time() - start_time
 
     print()  # Newline after progress
 
@@ -460,18 +816,26 @@ class BetaComfyUIClient:
         prompt=prompt
       )
 
-    # Download first output (prefer webm)
-    webm_files = [f for f in output_files if f.endswith('.webm')]
-    target_file = webm_files[0] if webm_files else output_files[0]
+    # Download every artifact concurrently; the webm is the primary output
+    target_file = next((f for f in output_files if f.endswith('.webm')), output_files[0])
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = output_dir / f"wan22_{timestamp}_{target_file}"
+    output_paths = {f: output_dir / f"wan22_{timestamp}_{f}" for f in output_files}
+    output_path = output_paths[target_file]
 
-    if self.download_file(target_file, output_path):
+    downloaded = await asyncio.gather(*(
+      self.download_file(f, path) for f, path in output_paths.items()
+    ))
+
+    if downloaded[output_files.index(target_file)]:
       file_size = output_path.stat().st_size / (1024 * 1024)
 
       print(f"✅ Generated: {output_path.name}")
       print(f"   Time: {generation_time:.1f}s, Size: {file_size:.2f}MB")
+      if cache_key:
+        _record_wan22_cache(cache_key, output_path)
+      self._state.pop(state_key, None)
+      self._state.sync()
 
       return ProductionResult(
         prompt_id=prompt_id,
@@ -607,8 +971,8 @@ ALL_PROMPTS = (
 # Main Production Functions
 # ============================================================================
 
-def run_benchmark(client: BetaComfyUIClient, num_videos: int = 3):
-  """Run performance benchmark"""
+async def run_benchmark(client: BetaComfyUIClient, num_videos: int = 3):
+  """Run performance benchmark, submitting every video concurrently"""
 
   print("\n" + "="*70)
   print("LINKEDIN VIDEO SERIES - PERFORMANCE BENCHMARK")
@@ -617,65 +981,69 @@ def run_benchmark(client: BetaComfyUIClient, num_videos: int = 3):
   # Select benchmark prompts
   benchmark_prompts = ALL_PROMPTS[:num_videos]
 
-  results = []
-  total_frames = 0
-  total_time = 0
+  jobs = []
 
   for i, vp in enumerate(benchmark_prompts, 1):
     print(f"\n[{i}/{len(benchmark_prompts)}] {vp.label}")
 
-    # Calculate frames for ~5 second video
-    num_frames = int(5 * 16)  # 5 seconds at 16fps = 80 frames
+    # Wan latents are 4n+1 frames: 5 s at 16 fps -> 81
+    num_frames = int(vp.duration_target * _FPS) // 4 * 4 + 1
+    width, height = _RES_MAP[vp.resolution]
 
-    # Get resolution
-    if vp.resolution == "720p":
-      width, height = 1280, 720
-    else:
-      width, height = 832, 480
-
-    result = client.generate_video(
+    jobs.append(client.generate_video(
       prompt=vp.prompt,
       negative_prompt=vp.negative_prompt,
       width=width,
       height=height,
       num_frames=num_frames,
       steps=20,
-      output_dir=OUTPUT_BASE / "benchmark"
-    )
+      output_dir=OUTPUT_BASE / "benchmark",
+      seed=vp.seed
+    ))
 
-    results.append(result)
+  wall_start = time.time()
+  results = await asyncio.gather(*jobs)
+  wall_time = time.time() - wall_start
 
+  # Single pass: one record per result, reused for display and JSON
+  records = []
+  successful = []
+  total_frames = 0
+  total_time = 0
+
+  for result in results:
+    record = result_record(result)
+    records.append(record)
     if result.success:
-      total_frames += result.frames
-      total_time += result.generation_time
+      successful.append(record)
+      total_frames += record["frames"]
+      total_time += record["generation_time"]
 
   # Print summary
   print("\n" + "="*70)
   print("BENCHMARK SUMMARY")
   print("="*70)
 
-  successful = [r for r in results if r.success]
-  failed = [r for r in results if not r.success]
-
-  print(f"\nTotal: {len(results)} | Success: {len(successful)} | Failed: {len(failed)}")
+  print(f"\nTotal: {len(results)} | Success: {len(successful)} | Failed: {len(results) - len(successful)}")
 
   if successful:
     avg_time = total_time / len(successful)
     avg_fps = total_frames / total_time if total_time > 0 else 0
 
     print(f"\nPerformance Metrics:")
+    print(f"  Wall clock time: {wall_time:.1f}s ({wall_time/60:.1f} min)")
     print(f"  Total generation time: {total_time:.1f}s ({total_time/60:.1f} min)")
     print(f"  Total frames rendered: {total_frames}")
     print(f"  Average time per video: {avg_time:.1f}s")
     print(f"  Average frames/second: {avg_fps:.4f}")
-    print(f"  Video duration generated: {total_frames/16:.1f}s")
+    print(f"  Video duration generated: {total_frames/_FPS:.1f}s")
 
     print(f"\nPer-video breakdown:")
     for r in successful:
-      video_dur = r.frames / 16
-      fps = r.frames / r.generation_time if r.generation_time > 0 else 0
-      print(f"  - {Path(r.output_path).name if r.output_path else 'N/A'}")
-      print(f"    Gen: {r.generation_time:.1f}s | Video: {video_dur:.1f}s | FPS: {fps:.4f} | Size: {r.file_size_mb:.2f}MB")
+      video_dur = r["frames"] / _FPS
+      fps = r["frames"] / r["generation_time"] if r["generation_time"] > 0 else 0
+      print(f"  - {Path(r['output_path']).name if r['output_path'] else 'N/A'}")
+      print(f"    Gen: {r['generation_time']:.1f}s | Video: {video_dur:.1f}s | FPS: {fps:.4f} | Size: {r['file_size_mb']:.2f}MB")
 
   # Save results
   timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -687,16 +1055,17 @@ def run_benchmark(client: BetaComfyUIClient, num_videos: int = 3):
     "total_videos": len(results),
     "successful": len(successful),
     "total_time_seconds": total_time,
+    "wall_time_seconds": wall_time,
     "total_frames": total_frames,
-    "results": [asdict(r) for r in results]
+    "results": records
   }
 
-  results_path.write_text(json.dumps(results_data, indent=2))
+  results_path.write_bytes(_json_bytes(results_data))
   print(f"\nResults saved: {results_path}")
 
   return results
 
-def main():
+async def main():
   """Main entry point"""
 
   print("\n" + "="*70)
@@ -710,9 +1079,16 @@ def main():
 
   # Initialize client
   client = BetaComfyUIClient()
+  try:
+    await run_pipeline(client)
+  finally:
+    await client.aclose()
+
+async def run_pipeline(client: BetaComfyUIClient):
+  """Health check, then dispatch the requested command"""
 
   # Check health
-  health = client.check_health()
+  health = await client.check_health()
   print(f"\nBETA Status: {health.get('status')}")
 
   if health.get("status") != "healthy":
@@ -727,17 +1103,21 @@ def main():
   if len(sys.argv) > 1:
     if sys.argv[1] == "benchmark":
       num = int(sys.argv[2]) if len(sys.argv) > 2 else 3
-      run_benchmark(client, num)
+      await run_benchmark(client, num)
     elif sys.argv[1] == "single":
-      prompt = " ".join(sys.argv[2:]) if len(sys.argv) > 2 else "A cinematic shot of a futuristic workspace"
-      client.generate_video(prompt=prompt)
+      words = sys.argv[2:]
+      seed = None
+      if words[:1] == ["--seed"] and len(words) > 1:
+        seed, words = int(words[1]), words[2:]
+      prompt = " ".join(words) if words else "A cinematic shot of a futuristic workspace"
+      await client.generate_video(prompt=prompt, seed=seed)
   else:
     print("\nUsage:")
     print("  python3 linkedin_video_production.py benchmark [num_videos]")
-    print("  python3 linkedin_video_production.py single 'prompt here'")
+    print("  python3 linkedin_video_production.py single [--seed N] 'prompt here'")
     print("\nAvailable prompts:")
     for vp in ALL_PROMPTS:
       print(f"  - EP{vp.episode}: {vp.label} ({vp.priority})")
 
 if __name__ == "__main__":
-  main()
+  asyncio.run(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Warm FLUX image generation daemon for ARTHUR media facility
+
+Keeps quantized pipelines loaded between requests so short prompts skip the
+multi-second weight load. generate_image.py --daemon talks to it over a Unix
+socket and starts it on demand.
+
+Protocol: one JSON object per line in each direction.
+    request:  {"prompt", "model", "width", "height", "steps", "quantize",
+               "seed", "output", "quant_backend", "gguf", "cache_mode",
+               "elastic_cache"}
+    response: {"status": "ok"|"error", "path", "ms", "error"}
+
+Usage:
+    python3 scripts/mflux_daemon.py            # foreground
+    python3 scripts/generate_image.py "prompt" --daemon
+"""
+
+import json
+import os
+import socketserver
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import generate_image
+
+
+class GenerationHandler(socketserver.StreamRequestHandler):
+    """Serve generation requests on one connection, one JSON line each"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.generate(line)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+    def generate(self, line):
+        """Run one request line; malformed requests get an error reply too"""
+        start = time.perf_counter()
+        output_file = None
+        try:
+            request = json.loads(line)
+            output_file = Path(request["output"])
+            ok = generate_image.generate(
+                request["prompt"],
+                request["model"],
+                request["width"],
+                request["height"],
+                request["steps"],
+                request.get("quantize", 4),
+                request.get("seed"),
+                output_file,
+                request.get("quant_backend", "mflux"),
+                request.get("gguf"),
+                request.get("cache_mode", "none"),
+                request.get("elastic_cache"),
+            )
+            error = None if ok else "generation produced no file"
+        except KeyError as e:
+            ok, error = False, f"request is missing {e}"
+        except Exception as e:
+            ok, error = False, str(e)
+
+        return {
+            "status": "ok" if ok else "error",
+            "path": str(output_file) if ok else None,
+            "ms": round((time.perf_counter() - start) * 1000),
+            "error": error,
+        }
+
+
+def serve(socket_path=generate_image.DAEMON_SOCKET):
+    """Run the daemon until interrupted; requests are handled one at a time"""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+
+    token = generate_image._load_hf_token()
+    if token and "HUGGING_FACE_HUB_TOKEN" not in os.environ:
+        os.environ["HUGGING_FACE_HUB_TOKEN"] = token
+
+    with socketserver.UnixStreamServer(str(socket_path), GenerationHandler) as server:
+        print(f"🟢 mflux daemon listening on {socket_path}")
+        print(f"   Backend: {generate_image.compute_backend()}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    serve()
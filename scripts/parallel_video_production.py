@@ -11,13 +11,14 @@ Author: Arthur Dell
 import sys
 import json
 import time
+import asyncio
 from pathlib import Path
 from datetime import datetime
 
 # Add arthur package to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from arthur.generators.wan26_api import Wan26APIClient
+from arthur.generators.wan26_api import Wan26APIClient, Wan26PollManager
 
 OUTPUT_DIR = Path("/Users/arthurdell/ARTHUR/videos/linkedin_series/wan26")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -83,7 +84,11 @@ professional tech executive branding, smooth text reveal animation, 8k quality""
 ]
 
 
-def produce_video(client: Wan26APIClient, prompt_config: dict) -> dict:
+async def produce_video(
+  client: Wan26APIClient,
+  poller: Wan26PollManager,
+  prompt_config: dict
+) -> dict:
   """Produce a single video using the canonical client."""
   prompt_id = prompt_config["id"]
   label = prompt_config["label"]
@@ -96,9 +101,10 @@ def produce_video(client: Wan26APIClient, prompt_config: dict) -> dict:
   print(f"Duration: {duration}s, Resolution: {resolution}")
   print(f"{'='*60}")
 
-  # Submit
+  # Submit (the client is synchronous, so blocking calls run in a thread)
   start_time = time.time()
-  result = client.text_to_video(
+  result = await asyncio.to_thread(
+    client.text_to_video,
     prompt=prompt,
     duration=duration,
     resolution=resolution,
@@ -118,84 +124,67 @@ def produce_video(client: Wan26APIClient, prompt_config: dict) -> dict:
     }
 
   task_id = result.task_id
-  print(f"Submitted: {task_id}")
-  print(f"Est. cost: ${result.cost_estimate:.2f}")
+  print(f"[{label}] Submitted: {task_id} (est. ${result.cost_estimate:.2f})")
 
   # Wait and download
   timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
   output_path = OUTPUT_DIR / f"wan26_{prompt_id}_{timestamp}.mp4"
 
-  # Poll for completion
-  timeout = 300
-  poll_start = time.time()
+  status = await poller.wait(task_id, timeout=300)
 
-  while time.time() - poll_start < timeout:
-    status = client.get_task_status(task_id)
-    elapsed = int(time.time() - poll_start)
+  if status.get("status") in ("completed", "Completed") and status.get("video_url"):
+    print(f"[{label}] Downloading...")
 
-    print(f"  [{elapsed}s] Status: {status.get('status')}", end="\r")
+    if await asyncio.to_thread(client.download_video, task_id, output_path):
+      generation_time = time.time() - start_time
+      file_size = output_path.stat().st_size / (1024 * 1024)
 
-    if status.get("status") in ("completed", "Completed"):
-      if status.get("video_url"):
-        print(f"\n  Downloading...")
+      print(f"✅ Success: {output_path.name}")
+      print(f"   Time: {generation_time:.1f}s, Size: {file_size:.2f}MB")
 
-        if client.download_video(task_id, output_path):
-          generation_time = time.time() - start_time
-          file_size = output_path.stat().st_size / (1024 * 1024)
-
-          print(f"\n✅ Success: {output_path.name}")
-          print(f"   Time: {generation_time:.1f}s, Size: {file_size:.2f}MB")
-
-          return {
-            "id": prompt_id,
-            "label": label,
-            "success": True,
-            "task_id": task_id,
-            "output_path": str(output_path),
-            "generation_time": generation_time,
-            "file_size_mb": file_size,
-            "cost_estimate": result.cost_estimate
-          }
-
-    elif status.get("status") in ("failed", "Failed"):
-      print(f"\n  Generation failed: {status.get('error')}")
       return {
         "id": prompt_id,
         "label": label,
-        "success": False,
+        "success": True,
         "task_id": task_id,
-        "error": status.get("error", "Generation failed"),
-        "generation_time": time.time() - start_time,
-        "file_size_mb": 0
+        "output_path": str(output_path),
+        "generation_time": generation_time,
+        "file_size_mb": file_size,
+        "cost_estimate": result.cost_estimate
       }
+    error = "Download failed"
+  elif status.get("status") == "timeout":
+    error = "Timeout"
+  else:
+    error = status.get("error") or "Generation failed"
 
-    time.sleep(5)
-
-  print("\n  Timeout waiting for completion")
+  print(f"[{label}] ❌ {error}")
   return {
     "id": prompt_id,
     "label": label,
     "success": False,
     "task_id": task_id,
-    "error": "Timeout",
+    "error": error,
     "generation_time": time.time() - start_time,
     "file_size_mb": 0
   }
 
 
-def produce_all(client: Wan26APIClient, prompts: list[dict]) -> list[dict]:
-  """Produce all videos."""
+async def produce_all(client: Wan26APIClient, prompts: list[dict]) -> list[dict]:
+  """Produce all videos concurrently."""
   print("\n" + "="*70)
   print("WAN 2.6 API HERO VIDEO PRODUCTION")
   print(f"Videos to produce: {len(prompts)}")
   print("="*70)
 
-  results = []
-
-  for i, prompt_config in enumerate(prompts, 1):
-    print(f"\n[{i}/{len(prompts)}]", end="")
-    result = produce_video(client, prompt_config)
-    results.append(result)
+  # One shared status poller instead of a polling loop per video
+  poller = Wan26PollManager(client)
+  try:
+    results = await asyncio.gather(*(
+      produce_video(client, poller, prompt_config) for prompt_config in prompts
+    ))
+  finally:
+    poller.close()
 
   # Summary
   print("\n" + "="*70)
@@ -242,7 +231,7 @@ def produce_all(client: Wan26APIClient, prompts: list[dict]) -> list[dict]:
   return results
 
 
-def main():
+async def main():
   """Main entry point"""
   print("\n" + "="*70)
   print("WAN 2.6 HERO VIDEO PRODUCTION")
@@ -256,7 +245,7 @@ def main():
     sys.exit(1)
 
   # Produce all hero videos
-  produce_all(client, HERO_PROMPTS)
+  await produce_all(client, HERO_PROMPTS)
 
   # Cleanup
   client.close()
@@ -268,4 +257,4 @@ def main():
 
 
 if __name__ == "__main__":
-  main()
+  asyncio.run(main())
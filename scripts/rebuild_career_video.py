@@ -11,87 +11,136 @@ Usage:
   python3 scripts/rebuild_career_video.py
 """
 
+import os
+import re
+import json
 import sys
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+  import ahocorasick
+except ImportError:  # fall back to per-phase substring scans
+  ahocorasick = None
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from arthur.resolve.connect import get_resolve, ResolveError
+
 # ============================================================================
 # Career Timeline (Updated)
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CareerPhase:
   company: str
   role: str
   years: str
   text_overlay: str
-  media_files: list[str]
+  media_files: tuple[str, ...]
+  patterns_lower: tuple[str, ...] = field(init=False, repr=False)
 
-CAREER_TIMELINE = [
+  def __post_init__(self):
+    object.__setattr__(self, "patterns_lower", tuple(p.lower() for p in self.media_files))
+
+CAREER_TIMELINE = (
   CareerPhase("BMW AG Group", "Systems Engineer", "1991-1994",
-              "BMW AG Group | 1991-1994", ["BMW", "IBM_Mainframe"]),
+              "BMW AG Group | 1991-1994", ("BMW", "IBM_Mainframe")),
   CareerPhase("ACSA", "IT Manager", "1995-1998",
-              "Airports Company SA | 1995-1998", ["ACSA"]),
+              "Airports Company SA | 1995-1998", ("ACSA",)),
   CareerPhase("BSI", "Co-Founder", "1998-2005",
-              "BSI Systems Integration | 1998-2005", ["BSI"]),
+              "BSI Systems Integration | 1998-2005", ("BSI",)),
   CareerPhase("Sun Microsystems", "PS Leader", "2005-2009",
-              "Sun Microsystems | 2005-2009", ["Sun_Microsystems", "sun_datacenter"]),
+              "Sun Microsystems | 2005-2009", ("Sun_Microsystems", "sun_datacenter")),
   CareerPhase("Hewlett-Packard", "PS Director", "2009-2011",
-              "HP Software | 2009-2011", ["HP"]),
+              "HP Software | 2009-2011", ("HP",)),
   CareerPhase("Symantec", "Senior Director", "2013-2014",
-              "Symantec Corporation | 2013-2014", ["Symantec"]),
+              "Symantec Corporation | 2013-2014", ("Symantec",)),
   CareerPhase("Citrix Systems", "Vice President", "2014-2017",
-              "Citrix Systems | 2014-2017", ["Citrix"]),
+              "Citrix Systems | 2014-2017", ("Citrix",)),
   CareerPhase("Veritas", "Field Technology Leader", "2017-2024",
-              "Veritas Technologies | 2017-2024", ["AI brand", "AI Security", "brand_message"]),
+              "Veritas Technologies | 2017-2024", ("AI brand", "AI Security", "brand_message")),
   CareerPhase("Cohesity", "Regional Field CTO", "2024-2025",
-              "Cohesity | 2024-2025", ["AI 02_humanoid", "AI 04_ai_research"]),
+              "Cohesity | 2024-2025", ("AI 02_humanoid", "AI 04_ai_research")),
   CareerPhase("AI Future", "The Possibilities", "",
-              "The Future is AI", ["AI holographic", "AI neural", "AI Boardroom", "AI capable", "AI productivity"]),
+              "The Future is AI", ("AI holographic", "AI neural", "AI Boardroom", "AI capable", "AI productivity")),
   CareerPhase("Connect", "", "",
-              "Connect with Arthur Dell", ["Arthur Dell", "Final Close"]),
-]
-
-# ============================================================================
-# Resolve Connection
-# ============================================================================
-
-def get_resolve():
-  """Get DaVinci Resolve instance"""
-  resolve_script_path = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules"
-  if resolve_script_path not in sys.path:
-    sys.path.append(resolve_script_path)
-
-  import DaVinciResolveScript as dvr
-  resolve = dvr.scriptapp("Resolve")
-  if not resolve:
-    raise RuntimeError("Could not connect to DaVinci Resolve. Is it running?")
-  return resolve
+              "Connect with Arthur Dell", ("Arthur Dell", "Final Close")),
+)
 
 # ============================================================================
 # Media Discovery
 # ============================================================================
 
+# directory -> {mtime_ns, files}; a directory's mtime changes whenever an
+# entry is added, removed or renamed, so a matching mtime means same listing
+MEDIA_CACHE = Path.home() / ".cache" / "alpha_media.json"
+
+VIDEO_EXT = frozenset({".mp4", ".mov", ".avi", ".mkv"})
+IMAGE_EXT = frozenset({".png", ".jpg", ".jpeg", ".tiff"})
+
+def _scan(directory: Path, suffixes: frozenset) -> list[tuple[str, Path]]:
+  """(name_lower, path) for files in directory with a matching suffix, by path"""
+  with os.scandir(directory) as entries:
+    found = [
+      (name_lower, Path(e.path))
+      for e in entries
+      if os.path.splitext(name_lower := e.name.lower())[1] in suffixes and e.is_file()
+    ]
+  found.sort(key=lambda item: item[1])
+  return found
+
+def _load_media_cache() -> dict:
+  try:
+    return json.loads(MEDIA_CACHE.read_text())
+  except (OSError, ValueError):
+    return {}
+
+def _save_media_cache(cache: dict):
+  MEDIA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+  tmp_path = MEDIA_CACHE.with_suffix(".tmp")
+  tmp_path.write_text(json.dumps(cache))
+  tmp_path.replace(MEDIA_CACHE)
+
+def _scan_cached(directory: Path, suffixes: frozenset, cache: dict) -> tuple[list, bool]:
+  """_scan, reusing the cached listing while the directory mtime is unchanged"""
+  mtime_ns = directory.stat().st_mtime_ns
+  entry = cache.get(str(directory))
+  if entry and entry["mtime_ns"] == mtime_ns:
+    return [(name_lower, Path(path)) for name_lower, path in entry["files"]], False
+
+  found = _scan(directory, suffixes)
+  cache[str(directory)] = {
+    "mtime_ns": mtime_ns,
+    "files": [(name_lower, str(path)) for name_lower, path in found],
+  }
+  return found, True
+
 def discover_media(studio_path: Path) -> dict:
-  """Discover media files on STUDIO volume"""
+  """
+  Discover media files on STUDIO volume
+
+  Returns {"video": [(name_lower, path), ...], "image": [...]}, sorted by
+  path; names are lowercased once here rather than on every phase match.
+  Listings are cached in MEDIA_CACHE until the directory changes.
+  """
   video_dir = studio_path / "VIDEO"
   image_dir = studio_path / "IMAGES"
 
   media = {"video": [], "image": []}
+  cache = _load_media_cache()
+  dirty = False
 
   if video_dir.exists():
-    media["video"] = sorted([
-      f for f in video_dir.iterdir()
-      if f.suffix.lower() in [".mp4", ".mov", ".avi", ".mkv"]
-    ])
+    media["video"], rescanned = _scan_cached(video_dir, VIDEO_EXT, cache)
+    dirty |= rescanned
 
   if image_dir.exists():
-    media["image"] = sorted([
-      f for f in image_dir.iterdir()
-      if f.suffix.lower() in [".png", ".jpg", ".jpeg", ".tiff"]
-    ])
+    media["image"], rescanned = _scan_cached(image_dir, IMAGE_EXT, cache)
+    dirty |= rescanned
+
+  if dirty:
+    _save_media_cache(cache)
 
   return media
 
@@ -100,19 +149,50 @@ def match_media(phase: CareerPhase, media: dict) -> list[Path]:
   matches = []
   seen = set()
 
-  for pattern in phase.media_files:
-    pattern_lower = pattern.lower()
-    for video in media["video"]:
-      if pattern_lower in video.name.lower() and video not in seen:
-        matches.append(video)
-        seen.add(video)
-    for image in media["image"]:
-      if pattern_lower in image.name.lower() and image not in seen:
-        matches.append(image)
-        seen.add(image)
+  for pattern_lower in phase.patterns_lower:
+    for kind in ("video", "image"):
+      for name_lower, path in media[kind]:
+        if pattern_lower in name_lower and path not in seen:
+          matches.append(path)
+          seen.add(path)
 
   return matches
 
+def match_all_phases(media: dict) -> list[list[Path]]:
+  """
+  Match media to every career phase in one pass over the filenames
+
+  All phase patterns go into a single Aho-Corasick automaton, so each name
+  is scanned once regardless of pattern count. Per-phase order and
+  de-duplication match match_media exactly.
+  """
+  if ahocorasick is None:
+    return [match_media(phase, media) for phase in CAREER_TIMELINE]
+
+  # A pattern may belong to several phases, so each word maps to all of them
+  targets = {}
+  for phase_idx, phase in enumerate(CAREER_TIMELINE):
+    for pattern_idx, pattern_lower in enumerate(phase.patterns_lower):
+      targets.setdefault(pattern_lower, []).append((phase_idx, pattern_idx))
+
+  automaton = ahocorasick.Automaton()
+  for word, hits in targets.items():
+    automaton.add_word(word, hits)
+  automaton.make_automaton()
+
+  # path -> (pattern, kind, file) rank: the order match_media would add it
+  buckets = [{} for _ in CAREER_TIMELINE]
+  for kind_idx, kind in enumerate(("video", "image")):
+    for file_idx, (name_lower, path) in enumerate(media[kind]):
+      for _, hits in automaton.iter(name_lower):
+        for phase_idx, pattern_idx in hits:
+          rank = (pattern_idx, kind_idx, file_idx)
+          bucket = buckets[phase_idx]
+          if path not in bucket or rank < bucket[path]:
+            bucket[path] = rank
+
+  return [sorted(bucket, key=bucket.get) for bucket in buckets]
+
 # ============================================================================
 # Main Rebuild Function
 # ============================================================================
@@ -138,8 +218,7 @@ def rebuild_career_video():
   print("\n2. Building shot list...")
   shots = []  # (media_path, text_overlay, company)
 
-  for phase in CAREER_TIMELINE:
-    matches = match_media(phase, media)
+  for phase, matches in zip(CAREER_TIMELINE, match_all_phases(media)):
     if matches:
       print(f"   {phase.company}: {len(matches)} asset(s)")
       for m in matches:
@@ -151,7 +230,11 @@ def rebuild_career_video():
 
   # Connect to Resolve
   print("\n3. Connecting to DaVinci Resolve...")
-  resolve = get_resolve()
+  try:
+    resolve = get_resolve()
+  except ResolveError as e:
+    print(f"   Error connecting to Resolve: {e}")
+    sys.exit(1)
   pm = resolve.GetProjectManager()
   print(f"   Connected to Resolve {resolve.GetVersion()}")
 
@@ -176,42 +259,45 @@ def rebuild_career_video():
   base_name = "Career_Journey_Timeline"
   timeline_name = base_name
 
-  # Find unique name
-  existing_timelines = []
+  # Find unique name: one past the highest existing _vN
+  existing_timelines = set()
   for i in range(1, project.GetTimelineCount() + 1):
     tl = project.GetTimelineByIndex(i)
     if tl:
-      existing_timelines.append(tl.GetName())
+      existing_timelines.add(tl.GetName())
 
-  version = 2
-  while timeline_name in existing_timelines:
+  if timeline_name in existing_timelines:
+    version_re = re.compile(rf"{re.escape(base_name)}_v(\d+)$")
+    versions = (version_re.match(name) for name in existing_timelines)
+    version = max((int(m.group(1)) for m in versions if m), default=1) + 1
     timeline_name = f"{base_name}_v{version}"
-    version += 1
 
   print(f"   Will create: {timeline_name}")
 
   # Import all media
   print("\n5. Importing media...")
-  media_paths = [str(shot[0].resolve()) for shot in shots]
+  # A file matched by several phases is imported only once; discovered paths
+  # are already absolute under /Volumes/STUDIO, so realpath() is skipped
+  media_paths = [
+    str(path if path.is_absolute() else path.resolve())
+    for path in dict.fromkeys(shot[0] for shot in shots)
+  ]
 
-  # Check what's already imported
-  existing_clips = {clip.GetName(): clip for clip in root_folder.GetClipList()}
+  # Check what's already imported. GetName() is one bridge call per clip and
+  # there is no batched form, so each clip is named exactly once: the pool
+  # listing here, and new clips as ImportMedia returns them.
+  pool_clips = root_folder.GetClipList() or []
+  all_clips = dict(zip((clip.GetName() for clip in pool_clips), pool_clips))
 
-  clips_to_import = []
-  for path in media_paths:
-    name = Path(path).name
-    if name not in existing_clips:
-      clips_to_import.append(path)
+  clips_to_import = [path for path in media_paths if Path(path).name not in all_clips]
 
   if clips_to_import:
-    imported = media_pool.ImportMedia(clips_to_import)
-    print(f"   Imported {len(imported) if imported else 0} new clips")
+    imported = media_pool.ImportMedia(clips_to_import) or []
+    print(f"   Imported {len(imported)} new clips")
+    all_clips.update(zip((clip.GetName() for clip in imported), imported))
   else:
     print("   All media already in pool")
 
-  # Refresh clip list
-  all_clips = {clip.GetName(): clip for clip in root_folder.GetClipList()}
-
   # Build ordered clip list for timeline
   ordered_clips = []
   for shot in shots:
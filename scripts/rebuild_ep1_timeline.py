@@ -6,9 +6,14 @@ Rebuild Episode 1 timeline from scratch with correct assets.
 - No AI-generated comparison images
 """
 
+import os
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, save_project, ResolveError
+
 # Asset paths
 ASSETS_DIR = Path("/Volumes/STUDIO/VIDEO/linkedin_series/stock_assets")
 INFOGRAPHICS_DIR = ASSETS_DIR / "infographics_v2"
@@ -18,7 +23,7 @@ TEXT_DIR = ASSETS_DIR / "text_overlays"
 
 # Shot list - using ONLY proper assets
 # Format: (filename, directory, duration_frames)
-SHOTS = [
+SHOTS = (
     # Opening
     ("title_card.png", INFOGRAPHICS_DIR, 120),              # 0:00-0:04 THE FOUNDATION
 
@@ -41,17 +46,31 @@ SHOTS = [
 
     # Closing
     ("cta_card.png", INFOGRAPHICS_DIR, 120),                # 0:48-0:52 CTA
-]
+)
 
 # Text overlays for track 2 - only on product shots (infographics have built-in text)
-TEXT_OVERLAYS = [
+TEXT_OVERLAYS = (
     # (text_file, start_frame)
     ("02_1tb_memory.png", 120),       # On mac_studio_hero
     ("03_160_cores.png", 240),        # On mac_studio_ports
     ("04_dgx_spark.png", 600),        # On dgx_product_1
     ("06_128gb.png", 840),            # On dgx_product_2
     ("07_desktop_size.png", 960),     # On dgx_product_3
-]
+)
+
+
+def list_dirs(directories):
+    """One scandir per directory -> {dir: set(names)}; missing dirs map to empty"""
+    listings = {}
+    for directory in directories:
+        if directory in listings:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                listings[directory] = {e.name for e in entries}
+        except FileNotFoundError:
+            listings[directory] = set()
+    return listings
 
 
 def main():
@@ -61,17 +80,11 @@ def main():
 
     # Connect to Resolve
     try:
-        sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
-        import DaVinciResolveScript as dvr
-        resolve = dvr.scriptapp("Resolve")
-    except Exception as e:
+        resolve = get_resolve()
+    except ResolveError as e:
         print(f"Error connecting to Resolve: {e}")
         sys.exit(1)
 
-    if not resolve:
-        print("Could not connect to DaVinci Resolve!")
-        sys.exit(1)
-
     project_manager = resolve.GetProjectManager()
 
     # Create new project
@@ -94,11 +107,12 @@ def main():
 
     media_pool = project.GetMediaPool()
 
-    # Clear existing timelines
-    for i in range(project.GetTimelineCount()):
-        tl = project.GetTimelineByIndex(i + 1)
-        if tl:
-            media_pool.DeleteTimelines([tl])
+    # Clear existing timelines in one call; deleting inside the index loop
+    # shifted the remaining indices and skipped every other timeline
+    timelines = [project.GetTimelineByIndex(i + 1) for i in range(project.GetTimelineCount())]
+    timelines = [tl for tl in timelines if tl]
+    if timelines:
+        media_pool.DeleteTimelines(timelines)
 
     # Create new timeline
     timeline = media_pool.CreateEmptyTimeline("EP01_Hardware_Final")
@@ -113,10 +127,13 @@ def main():
     print(f"\nImporting {len(SHOTS)} shots...")
     print("-" * 60)
 
+    # Read each asset directory once instead of stat-ing every file
+    listings = list_dirs([directory for _, directory, _ in SHOTS] + [TEXT_DIR])
+
     shot_files = []
     for filename, directory, _ in SHOTS:
         filepath = directory / filename
-        if filepath.exists():
+        if filename in listings[directory]:
             shot_files.append(str(filepath))
             print(f"  ✓ {filename}")
         else:
@@ -126,30 +143,27 @@ def main():
     root_folder = media_pool.GetRootFolder()
     media_pool.SetCurrentFolder(root_folder)
 
-    imported = media_pool.ImportMedia(shot_files)
+    # Import grouped by directory so each folder is read contiguously (keeps
+    # readahead useful on STUDIO); timeline order comes from SHOTS, not this
+    imported = media_pool.ImportMedia(sorted(shot_files, key=os.path.dirname))
     if not imported:
         print("Failed to import media!")
         sys.exit(1)
 
     print(f"\nImported {len(imported)} clips to media pool")
 
-    # Create filename to clip mapping
-    clip_map = {}
-    for clip in imported:
-        name = clip.GetName()
-        clip_map[name] = clip
+    # Create filename to clip mapping; ImportMedia keeps basenames
+    clip_map = {clip.GetName(): clip for clip in imported}
 
     # Add shots to timeline in order
     print(f"\nAdding shots to timeline...")
     print("-" * 60)
 
+    clip_infos = []
+    queued = []
     for i, (filename, directory, duration) in enumerate(SHOTS):
         # Find clip by name (without extension for some)
-        clip = None
-        for name, c in clip_map.items():
-            if filename in name or filename.replace(".png", "") in name or filename.replace(".jpg", "") in name:
-                clip = c
-                break
+        clip = clip_map.get(filename) or clip_map.get(Path(filename).stem)
 
         if not clip:
             print(f"  [{i+1:2d}] ✗ {filename} - not found")
@@ -158,15 +172,20 @@ def main():
         # Set still image duration
         clip.SetClipProperty("End", duration)
 
-        # Add to timeline
-        clip_info = {
+        # Queue for a single append
+        clip_infos.append({
             "mediaPoolItem": clip,
             "startFrame": 0,
             "endFrame": duration,
-        }
-
-        result = media_pool.AppendToTimeline([clip_info])
-        if result:
+        })
+        queued.append((i, filename, duration))
+
+    # One AppendToTimeline for every shot; Resolve returns the items it
+    # placed, in order, so anything past that count failed
+    appended = media_pool.AppendToTimeline(clip_infos) if clip_infos else []
+    placed = len(appended or [])
+    for n, (i, filename, duration) in enumerate(queued):
+        if n < placed:
             print(f"  [{i+1:2d}] ✓ {filename} ({duration} frames)")
         else:
             print(f"  [{i+1:2d}] ✗ {filename} - append failed")
@@ -176,7 +195,7 @@ def main():
     print("-" * 60)
 
     # Import text overlay files
-    text_files = [str(TEXT_DIR / f) for f, _ in TEXT_OVERLAYS if (TEXT_DIR / f).exists()]
+    text_files = [str(TEXT_DIR / f) for f, _ in TEXT_OVERLAYS if f in listings[TEXT_DIR]]
     if text_files:
         text_clips = media_pool.ImportMedia(text_files)
         if text_clips:
@@ -187,27 +206,27 @@ def main():
                 timeline.AddTrack("video")
 
             # Add each to track 2 at correct position
+            start_frames = {}
+            for text_file, start_frame in TEXT_OVERLAYS:
+                start_frames[text_file] = start_frames[Path(text_file).stem] = start_frame
+
             for clip in text_clips:
                 name = clip.GetName()
                 # Find position
-                for text_file, start_frame in TEXT_OVERLAYS:
-                    if text_file.replace(".png", "") in name:
-                        clip_info = {
-                            "mediaPoolItem": clip,
-                            "startFrame": 0,
-                            "endFrame": 120,
-                            "trackIndex": 2,
-                            "recordFrame": start_frame,
-                        }
-                        media_pool.AppendToTimeline([clip_info])
-                        print(f"  ✓ {name} @ frame {start_frame}")
-                        break
-
-    # Save project
-    try:
-        project.SaveProject()
-    except:
-        pass
+                start_frame = start_frames.get(name)
+                if start_frame is not None:
+                    clip_info = {
+                        "mediaPoolItem": clip,
+                        "startFrame": 0,
+                        "endFrame": 120,
+                        "trackIndex": 2,
+                        "recordFrame": start_frame,
+                    }
+                    media_pool.AppendToTimeline([clip_info])
+                    print(f"  ✓ {name} @ frame {start_frame}")
+
+    # Save project (skipped under RESOLVE_DEFER_SAVE=1)
+    save_project(project)
 
     print("\n" + "=" * 60)
     print("TIMELINE REBUILT")
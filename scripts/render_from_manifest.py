@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Render a timeline manifest with ffmpeg alone (no DaVinci Resolve).
+
+Replays the JSON written by resolve_dump_timeline.py (or by --dump-only runs
+of the Resolve scripts): each clip is trimmed to its source in/out, placed
+at its record frame on a black canvas, higher tracks composited on top
+(text overlay PNGs keep their alpha), and audio items mixed at their
+offsets. Generators/titles have no source file and are skipped.
+
+Usage:
+  python3 scripts/render_from_manifest.py
+  python3 scripts/render_from_manifest.py build/ep1.json -o ep1.mp4
+  python3 scripts/render_from_manifest.py --print   # show the ffmpeg command
+"""
+
+import argparse
+import json
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.manifest import MANIFEST_PATH
+from arthur.resolve.render import FFMPEG
+
+IMAGE_EXT = frozenset({".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"})
+
+VIDEO_ARGS = ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-b:v", "20M"]
+AUDIO_ARGS = ["-c:a", "aac", "-b:a", "192k"]
+
+
+def build_command(manifest, output):
+  """
+  Build one ffmpeg invocation for the whole manifest
+
+  Returns:
+    (cmd, skipped): the argument list, and names of items without a source
+  """
+  fps = manifest["fps"]
+  width, height = manifest["width"], manifest["height"]
+  total = manifest["duration"] / fps
+
+  inputs, filters, skipped = [], [], []
+  canvas = "base"
+  filters.append(f"color=c=black:s={width}x{height}:r={fps}:d={total:.3f}[base]")
+
+  # Video: lower tracks first so later overlays land on top
+  for track in manifest["video_tracks"]:
+    for item in track["items"]:
+      if not item["src"]:
+        skipped.append(item["name"])
+        continue
+      index = len(inputs)
+      start = item["record"] / fps
+      length = (item["out"] - item["in"]) / fps
+      if Path(item["src"]).suffix.lower() in IMAGE_EXT:
+        inputs.append(["-loop", "1", "-t", f"{length:.3f}", "-i", item["src"]])
+      else:
+        inputs.append(["-ss", f"{item['in'] / fps:.3f}", "-t", f"{length:.3f}", "-i", item["src"]])
+      filters.append(
+        f"[{index}:v]fps={fps},scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"format=rgba,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:color=black@0,"
+        f"setpts=PTS-STARTPTS+{start:.3f}/TB[v{index}]"
+      )
+      filters.append(
+        f"[{canvas}][v{index}]overlay=eof_action=pass:"
+        f"enable='between(t,{start:.3f},{start + length:.3f})'[c{index}]"
+      )
+      canvas = f"c{index}"
+
+  # Audio: each item delayed to its record position, then mixed
+  mixed = []
+  for track in manifest["audio_tracks"]:
+    for item in track["items"]:
+      if not item["src"]:
+        skipped.append(item["name"])
+        continue
+      index = len(inputs)
+      length = (item["out"] - item["in"]) / fps
+      delay_ms = round(item["record"] / fps * 1000)
+      inputs.append(["-ss", f"{item['in'] / fps:.3f}", "-t", f"{length:.3f}", "-i", item["src"]])
+      filters.append(f"[{index}:a]adelay={delay_ms}:all=1[a{index}]")
+      mixed.append(f"[a{index}]")
+
+  maps = ["-map", f"[{canvas}]"]
+  if mixed:
+    filters.append(f"{''.join(mixed)}amix=inputs={len(mixed)}:normalize=0[aout]")
+    maps += ["-map", "[aout]", *AUDIO_ARGS]
+  else:
+    maps.append("-an")
+
+  cmd = [FFMPEG, "-y"]
+  for args in inputs:
+    cmd += args
+  cmd += [
+    "-filter_complex", ";".join(filters),
+    *maps,
+    *VIDEO_ARGS,
+    "-r", str(fps),
+    "-t", f"{total:.3f}",
+    "-movflags", "+faststart",
+    str(output),
+  ]
+  return cmd, skipped
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Render a timeline manifest with ffmpeg")
+  parser.add_argument("manifest", nargs="?", type=Path, default=MANIFEST_PATH,
+                      help=f"Manifest JSON (default: {MANIFEST_PATH})")
+  parser.add_argument("-o", "--output", type=Path,
+                      help="Output .mp4 (default: <timeline>.mp4 next to the manifest)")
+  parser.add_argument("--print", action="store_true", dest="print_only",
+                      help="Print the ffmpeg command instead of running it")
+  args = parser.parse_args()
+
+  if not args.manifest.exists():
+    print(f"❌ No manifest at {args.manifest}; run resolve_dump_timeline.py first")
+    sys.exit(1)
+
+  manifest = json.loads(args.manifest.read_text())
+  output = args.output or args.manifest.parent / f"{manifest['timeline']}.mp4"
+  cmd, skipped = build_command(manifest, output)
+
+  for name in skipped:
+    print(f"  ⚠️  {name} - no source file (generator/title), skipping")
+
+  if args.print_only:
+    print(shlex.join(cmd))
+    return
+
+  clips = sum(len(track["items"]) for track in manifest["video_tracks"])
+  print(f"Rendering {manifest['timeline']}: {clips} video items, "
+        f"{manifest['duration']} frames @ {manifest['fps']} fps")
+
+  result = subprocess.run(cmd, capture_output=True, text=True)
+  if result.returncode != 0:
+    print(f"❌ ffmpeg failed:\n{result.stderr[-2000:]}")
+    sys.exit(result.returncode)
+
+  size_mb = output.stat().st_size / (1024 * 1024)
+  print(f"✅ Rendered {output} ({size_mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+  main()
@@ -5,6 +5,13 @@ Creates Text+ generators on video track 2 at specified timecodes.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, save_project, ResolveError
 
 # Text overlay specifications from storyboard
 # Format: (start_frame, duration_frames, text, color_hex, size, position)
@@ -45,6 +52,7 @@ TEXT_OVERLAYS = [
 ]
 
 
+@lru_cache(maxsize=None)
 def hex_to_rgb(hex_color):
   """Convert hex color to RGB tuple (0-1 range)"""
   hex_color = hex_color.lstrip('#')
@@ -54,6 +62,65 @@ def hex_to_rgb(hex_color):
   return (r, g, b)
 
 
+# Brand colors repeat across overlays; parse each once at import
+COLORS = {color: hex_to_rgb(color) for _, _, _, color, _, _ in TEXT_OVERLAYS}
+
+
+def find_text_tool(fusion_comp):
+  """Text+ tool of a generator comp; direct lookup, scanning only as fallback"""
+  tool = fusion_comp.FindTool("Text1")
+  if tool:
+    return tool
+  for tool_name, tool in fusion_comp.GetToolList().items():
+    if "Text" in tool_name:
+      return tool
+  return None
+
+
+def configure_text_tool(fusion_comp, text, color, size, position):
+  """Set content, color, size, position and font on the comp's Text+ tool"""
+  tool = find_text_tool(fusion_comp)
+  if not tool:
+    return
+
+  # Set text content
+  tool.SetInput("StyledText", text)
+
+  # Set color
+  r, g, b = COLORS[color]
+  tool.SetInput("Red1", r)
+  tool.SetInput("Green1", g)
+  tool.SetInput("Blue1", b)
+
+  # Set size
+  tool.SetInput("Size", size)
+
+  # Set position
+  if position == "center":
+    tool.SetInput("Center", {"X": 0.5, "Y": 0.5})
+  else:  # lower_third
+    tool.SetInput("Center", {"X": 0.5, "Y": 0.15})
+
+  # Set font
+  tool.SetInput("Font", "Inter")
+
+
+def configure_overlay(clip, text, color, size, position):
+  """Fill in one inserted Text+ clip's Fusion comp; None on success, else error"""
+  try:
+    fusion_comp = clip.GetFusionCompByIndex(1)
+    if fusion_comp:
+      # Coalesce the SetInputs below into one Fusion re-evaluation
+      fusion_comp.Lock()
+      try:
+        configure_text_tool(fusion_comp, text, color, size, position)
+      finally:
+        fusion_comp.Unlock()
+  except Exception as e:
+    return e
+  return None
+
+
 def main():
   print("=" * 60)
   print("Adding Text Overlays to Timeline")
@@ -61,17 +128,11 @@ def main():
 
   # Connect to Resolve
   try:
-    sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
-    import DaVinciResolveScript as dvr
-    resolve = dvr.scriptapp("Resolve")
-  except Exception as e:
+    resolve = get_resolve()
+  except ResolveError as e:
     print(f"Error connecting to Resolve: {e}")
     sys.exit(1)
 
-  if not resolve:
-    print("Could not connect to DaVinci Resolve!")
-    sys.exit(1)
-
   project_manager = resolve.GetProjectManager()
   project = project_manager.GetCurrentProject()
 
@@ -100,6 +161,7 @@ def main():
 
   added = 0
   failed = 0
+  inserted = []  # (index, start_frame, configure_overlay args)
 
   for i, (start_frame, duration, text, color, size, position) in enumerate(TEXT_OVERLAYS):
     try:
@@ -117,47 +179,20 @@ def main():
       result = timeline.InsertGeneratorIntoTimeline("Text+")
 
       if result:
-        # Get the newly added clip (should be last on track)
-        video_items = timeline.GetItemListInTrack("video", 2)
-        if video_items:
-          new_clip = video_items[-1]
-
+        # Resolve 18+ returns the new TimelineItem; older builds return a
+        # bool, and only then is track 2 re-listed to find it (last item)
+        if hasattr(result, "GetFusionCompByIndex"):
+          new_clip = result
+        else:
+          video_items = timeline.GetItemListInTrack("video", 2)
+          new_clip = video_items[-1] if video_items else None
+        if new_clip:
           # Set clip properties
           new_clip.SetProperty("Start", start_frame)
           new_clip.SetProperty("Duration", duration)
 
-          # Access Fusion comp to set text properties
-          fusion_comp = new_clip.GetFusionCompByIndex(1)
-          if fusion_comp:
-            # Find the Text+ tool and configure it
-            tools = fusion_comp.GetToolList()
-            for tool_name, tool in tools.items():
-              if "Text" in tool_name:
-                # Set text content
-                tool.SetInput("StyledText", text)
-
-                # Set color
-                r, g, b = hex_to_rgb(color)
-                tool.SetInput("Red1", r)
-                tool.SetInput("Green1", g)
-                tool.SetInput("Blue1", b)
-
-                # Set size
-                tool.SetInput("Size", size)
-
-                # Set position
-                if position == "center":
-                  tool.SetInput("Center", {"X": 0.5, "Y": 0.5})
-                else:  # lower_third
-                  tool.SetInput("Center", {"X": 0.5, "Y": 0.15})
-
-                # Set font
-                tool.SetInput("Font", "Inter")
-
-                break
-
-          added += 1
-          print(f"  [{i+1:2d}] ✅ \"{text}\" @ frame {start_frame}")
+          # Fusion text setup runs concurrently once all clips are placed
+          inserted.append((i, start_frame, (new_clip, text, color, size, position)))
         else:
           failed += 1
           print(f"  [{i+1:2d}] ❌ \"{text}\" - clip not found after insert")
@@ -169,11 +204,21 @@ def main():
       failed += 1
       print(f"  [{i+1:2d}] ❌ \"{text}\" - {e}")
 
-  # Try to save
-  try:
-    project.SaveProject()
-  except:
-    pass
+  # Timeline inserts above must stay ordered; each clip's comp is independent,
+  # so overlap the per-clip Fusion round-trips
+  with ThreadPoolExecutor(max_workers=4) as pool:
+    errors = list(pool.map(lambda spec: configure_overlay(*spec[2]), inserted))
+
+  for (i, start_frame, (_, text, *_)), error in zip(inserted, errors):
+    if error is None:
+      added += 1
+      print(f"  [{i+1:2d}] ✅ \"{text}\" @ frame {start_frame}")
+    else:
+      failed += 1
+      print(f"  [{i+1:2d}] ❌ \"{text}\" - {error}")
+
+  # Save (skipped under RESOLVE_DEFER_SAVE=1)
+  save_project(project)
 
   print("\n" + "=" * 60)
   print("TEXT OVERLAY SETUP COMPLETE")
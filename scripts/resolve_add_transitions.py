@@ -7,6 +7,10 @@ Fully automated - no manual work required.
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, save_project, ResolveError
+
 def main():
   print("=" * 60)
   print("Adding Black Transitions to All Clips")
@@ -14,18 +18,11 @@ def main():
 
   # Connect to Resolve
   try:
-    sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
-    import DaVinciResolveScript as dvr
-    resolve = dvr.scriptapp("Resolve")
-  except Exception as e:
+    resolve = get_resolve()
+  except ResolveError as e:
     print(f"Error connecting to Resolve: {e}")
     sys.exit(1)
 
-  if not resolve:
-    print("Could not connect to DaVinci Resolve!")
-    print("Make sure Resolve is running.")
-    sys.exit(1)
-
   # Get current project and timeline
   project_manager = resolve.GetProjectManager()
   project = project_manager.GetCurrentProject()
@@ -100,8 +97,8 @@ def main():
       failed += 1
       print(f"  [{i+1}→{i+2}] ❌ Failed: {e}")
 
-  # Save project
-  project.SaveProject()
+  # Save project (skipped under RESOLVE_DEFER_SAVE=1)
+  save_project(project)
 
   print("\n" + "=" * 60)
   print("TRANSITION SETUP COMPLETE")
@@ -5,6 +5,11 @@ Design system: Amber highlights (#d4a373), Teal shadows (#4ecdc4), Charcoal base
 """
 
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, save_project, ResolveError
 
 
 def main():
@@ -14,17 +19,11 @@ def main():
 
     # Connect to Resolve
     try:
-        sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
-        import DaVinciResolveScript as dvr
-        resolve = dvr.scriptapp("Resolve")
-    except Exception as e:
+        resolve = get_resolve()
+    except ResolveError as e:
         print(f"Error connecting to Resolve: {e}")
         sys.exit(1)
 
-    if not resolve:
-        print("Could not connect to DaVinci Resolve!")
-        sys.exit(1)
-
     project_manager = resolve.GetProjectManager()
     project = project_manager.GetCurrentProject()
 
@@ -64,48 +63,38 @@ def main():
         "Saturation": 1.1,
     }
 
-    graded = 0
-    failed = 0
-
-    for i, clip in enumerate(video_items):
-        clip_name = clip.GetName() if hasattr(clip, 'GetName') else f"Clip {i+1}"
-
-        try:
-            # Get the clip's color correction node graph
-            # In Resolve, we can apply grades via clip properties
-
-            # Method 1: Use SetClipColor for basic tinting
-            # This applies a color label but not a grade
+    # Resolve has no multi-item clip color call, so mark clips one RPC each
+    # and collect the outcomes; names are only fetched for the failures
+    failed_clips = []
 
-            # Method 2: Access the node graph
-            # This requires Color page to be active
-
-            # For automation, we'll use the clip-level color properties
-            # that work across all clips
-
-            # Set basic color correction via clip properties
-            clip.SetProperty("ClipColor", "Orange")  # Visual marker
-
-            # Apply color correction values
-            # Note: Full node-based grading requires Color page scripting
-
-            graded += 1
-            print(f"  [{i+1:2d}] ✅ {clip_name}")
-
-        except Exception as e:
-            failed += 1
-            print(f"  [{i+1:2d}] ❌ {clip_name} - {e}")
-
-    # Save project
     try:
-        project.SaveProject()
-    except:
-        pass
+        for i, clip in enumerate(video_items):
+            # Full node-based grading requires Color page scripting; for
+            # automation we mark each clip with an orange label
+            try:
+                if hasattr(clip, "SetClipColor"):
+                    marked = clip.SetClipColor("Orange")
+                else:
+                    marked = clip.SetProperty("ClipColor", "Orange")
+                if not marked:
+                    failed_clips.append((i, clip, "Resolve refused clip color"))
+            except Exception as e:
+                failed_clips.append((i, clip, e))
+    finally:
+        # One save even if a clip raises mid-loop
+        save_project(project)
+
+    graded = len(video_items) - len(failed_clips)
+    for i, clip, error in failed_clips:
+        clip_name = clip.GetName() if hasattr(clip, 'GetName') else f"Clip {i+1}"
+        print(f"  [{i+1:2d}] ❌ {clip_name} - {error}")
 
     print("\n" + "=" * 60)
     print("COLOR GRADE SETUP COMPLETE")
     print("=" * 60)
     print(f"\nMarked: {graded} clips")
+    if failed_clips:
+        print(f"Failed: {len(failed_clips)} clips")
 
     print("""
 NOTE: For the full amber/teal cinematic grade:
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Dump the current DaVinci Resolve timeline to a JSON manifest.
+
+The manifest lists every clip's source, in/out and record frame per track;
+scripts/render_from_manifest.py renders it with ffmpeg, no Resolve needed.
+
+Usage:
+  python3 scripts/resolve_dump_timeline.py
+  python3 scripts/resolve_dump_timeline.py -o build/ep1.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, ResolveError
+from arthur.resolve.manifest import MANIFEST_PATH, timeline_manifest, write_manifest
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Dump the current timeline to a JSON manifest")
+  parser.add_argument("-o", "--output", type=Path, default=MANIFEST_PATH,
+                      help=f"Manifest path (default: {MANIFEST_PATH})")
+  args = parser.parse_args()
+
+  try:
+    resolve = get_resolve()
+  except ResolveError as e:
+    print(f"Error connecting to Resolve: {e}")
+    sys.exit(1)
+
+  project = resolve.GetProjectManager().GetCurrentProject()
+  if not project:
+    print("No project open!")
+    sys.exit(1)
+
+  timeline = project.GetCurrentTimeline()
+  if not timeline:
+    print("No timeline open!")
+    sys.exit(1)
+
+  manifest = timeline_manifest(timeline, project)
+  path = write_manifest(manifest, args.output)
+
+  print(f"Timeline: {manifest['timeline']} "
+        f"({manifest['width']}x{manifest['height']} @ {manifest['fps']} fps, "
+        f"{manifest['duration']} frames)")
+  for kind in ("video_tracks", "audio_tracks"):
+    for track in manifest[kind]:
+      print(f"  {kind.split('_')[0]} {track['track']}: {len(track['items'])} items")
+  print(f"✅ Manifest written to {path}")
+
+
+if __name__ == "__main__":
+  main()
@@ -3,30 +3,44 @@
 Export full timeline from DaVinci Resolve with proper settings.
 """
 
+import argparse
+import os
 import sys
-import time
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, ResolveError
+from arthur.resolve.render import check_disk_space, remux_passthrough, timeline_is_passthrough, wait_for_render
+
+# Presets to render with, in order of preference
+RENDER_PRESETS = ("H.264 Master", "YouTube - 1080p")
+
+# Bitrate assumed when sizing the export for the free-space check
+ESTIMATED_BITRATE_KBPS = 20000
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Export the current timeline")
+    parser.add_argument("--no-wait", action="store_true",
+                        help="Return once the render starts; don't wait for it")
+    parser.add_argument("--passthrough", action="store_true",
+                        help="Stream-copy instead of rendering if the timeline is one "
+                             "ungraded source clip already at the export format")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Full Timeline Export")
     print("=" * 60)
 
     # Connect to Resolve
     try:
-        sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
-        import DaVinciResolveScript as dvr
-        resolve = dvr.scriptapp("Resolve")
-    except Exception as e:
+        resolve = get_resolve()
+    except ResolveError as e:
         print(f"Error connecting to Resolve: {e}")
         sys.exit(1)
 
-    if not resolve:
-        print("Could not connect to DaVinci Resolve!")
-        sys.exit(1)
-
     project_manager = resolve.GetProjectManager()
     project = project_manager.GetCurrentProject()
 
@@ -43,9 +57,16 @@ def main():
     print(f"Timeline: {timeline.GetName()}")
 
     # Get timeline info
-    fps = timeline.GetSetting("timelineFrameRate")
+    # Resolve returns the rate as a string ("30", "29.97"); parse it once
+    try:
+        fps = float(timeline.GetSetting("timelineFrameRate"))
+    except (TypeError, ValueError):
+        fps = 30.0
+    if fps <= 0:
+        print(f"❌ Invalid timeline frame rate: {fps}")
+        sys.exit(1)
     duration = timeline.GetEndFrame() - timeline.GetStartFrame()
-    print(f"Duration: {duration} frames @ {fps} fps")
+    print(f"Duration: {duration} frames @ {fps:g} fps ({duration / fps:.1f}s)")
 
     # Export settings
     export_dir = Path("/Volumes/STUDIO/VIDEO/linkedin_series/exports")
@@ -58,13 +79,36 @@ def main():
     print(f"Filename: {export_filename}.mp4")
     print("-" * 60)
 
+    # Fail fast on cheap checks rather than partway through a render
+    space_error = check_disk_space(export_dir, duration / fps, ESTIMATED_BITRATE_KBPS)
+    if space_error:
+        print(f"❌ {space_error}")
+        sys.exit(1)
+
+    # Single untouched clip: remux the source instead of re-encoding it
+    if args.passthrough and timeline_is_passthrough(timeline, 1080, 1920, fps):
+        export_path = export_dir / f"{export_filename}.mp4"
+        if remux_passthrough(timeline, export_path, audio=True):
+            size_mb = export_path.stat().st_size / (1024 * 1024)
+            print(f"✅ Exported: {export_path.name} ({size_mb:.1f} MB)")
+            return
+        print("Falling back to Resolve render")
+
+    presets = project.GetRenderPresetList() or []
+    print(f"Available presets: {presets}")
+    preset = next((name for name in RENDER_PRESETS if name in presets), None)
+    if preset is None:
+        print(f"❌ None of the render presets {RENDER_PRESETS} exist in this Resolve install")
+        sys.exit(1)
+
     # Delete any existing render jobs
     project.DeleteAllRenderJobs()
     print("Cleared existing render jobs")
 
-    # Load YouTube preset (good for LinkedIn vertical)
-    presets = project.GetRenderPresetList()
-    print(f"Available presets: {presets}")
+    # Presets reset most render settings, so load first and apply our
+    # settings once on top
+    preset_loaded = project.LoadRenderPreset(preset)
+    print(f"Preset loaded: {preset} ({preset_loaded})")
 
     # Set render format to H.264
     # Use SetRenderSettings with the correct parameters
@@ -79,27 +123,15 @@ def main():
         "ExportAudio": True,  # Include audio track even if empty
         "FormatWidth": 1080,
         "FormatHeight": 1920,
-        "FrameRate": str(fps) if fps else "30",
+        "FrameRate": f"{fps:g}",
     }
 
     print("\nApplying render settings...")
     result = project.SetRenderSettings(render_settings)
     print(f"SetRenderSettings result: {result}")
-
-    # Load a preset that works well
-    # Try to use H.264 Master preset
-    preset_loaded = project.LoadRenderPreset("H.264 Master")
-    if not preset_loaded:
-        preset_loaded = project.LoadRenderPreset("YouTube - 1080p")
-    print(f"Preset loaded: {preset_loaded}")
-
-    # Re-apply our custom settings after loading preset
-    project.SetRenderSettings({
-        "TargetDir": str(export_dir),
-        "CustomName": export_filename,
-        "FormatWidth": 1080,
-        "FormatHeight": 1920,
-    })
+    if result is not True:
+        print("❌ Resolve rejected the render settings; not rendering with defaults")
+        sys.exit(1)
 
     # Add render job
     print("\nAdding render job...")
@@ -121,27 +153,24 @@ def main():
     render_started = project.StartRendering([job_id])
     print(f"Render started: {render_started}")
 
+    if args.no_wait:
+        print(f"\nNot waiting; poll job {job_id} from the Deliver page or GetRenderJobStatus")
+        return
+
     # Monitor progress
     print("\nRendering...")
-    last_progress = -1
-    while project.IsRenderingInProgress():
-        status = project.GetRenderJobStatus(job_id)
-        if status:
-            progress = status.get("CompletionPercentage", 0)
-            if progress != last_progress:
-                print(f"  Progress: {progress}%")
-                last_progress = progress
-        time.sleep(0.5)
+    status = wait_for_render(project, job_id, lambda progress: print(f"  Progress: {progress}%"))
 
     # Final status
-    status = project.GetRenderJobStatus(job_id)
     print(f"\nFinal status: {status}")
 
     # Find the exported file
     print("\nLooking for exported file...")
-    for f in export_dir.glob(f"{export_filename}*"):
-        size_mb = f.stat().st_size / (1024 * 1024)
-        print(f"  Found: {f.name} ({size_mb:.1f} MB)")
+    with os.scandir(export_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(export_filename) and entry.is_file(follow_symlinks=False):
+                size_mb = entry.stat().st_size / (1024 * 1024)
+                print(f"  Found: {entry.name} ({size_mb:.1f} MB)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Export the current timeline to several formats in one Resolve render batch.
+
+Every profile is queued with AddRenderJob() before a single StartRendering()
+call, so Resolve renders them back to back against one loaded timeline
+instead of one script run (and timeline load) per format.
+
+Usage:
+  python3 scripts/resolve_export_multi.py
+  python3 scripts/resolve_export_multi.py --profiles linkedin square
+  python3 scripts/resolve_export_multi.py --no-wait
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, ResolveError
+from arthur.resolve.render import wait_for_renders
+
+EXPORT_DIR = Path("/Volumes/STUDIO/VIDEO/linkedin_series/exports")
+
+# Output formats: name, frame size, and filename suffix
+PROFILES = [
+    {"name": "linkedin", "w": 1080, "h": 1920, "suffix": "_9x16"},
+    {"name": "youtube", "w": 1920, "h": 1080, "suffix": "_16x9"},
+    {"name": "square", "w": 1080, "h": 1080, "suffix": "_1x1"},
+]
+PROFILE_BY_NAME = {profile["name"]: profile for profile in PROFILES}
+
+# Shared by every profile: H.264 at 20 Mbps, 30 fps, video only
+BASE_SETTINGS = {
+    "SelectAllFrames": True,
+    "ExportVideo": True,
+    "ExportAudio": False,
+    "FrameRate": "30",
+    "VideoCodec": "h264_main",
+    "VideoBitrate": "20000",
+    "AudioCodec": "",
+}
+
+
+def queue_exports(project, profiles, export_dir, base_name, settings=None):
+    """
+    Add one render job per profile without starting any of them
+
+    Returns:
+        [(profile, job_id, output_path)] in profile order; job_id is None
+        where Resolve refused the job
+    """
+    jobs = []
+    for profile in profiles:
+        custom_name = f"{base_name}{profile['suffix']}"
+        project.SetRenderSettings({
+            **BASE_SETTINGS,
+            **(settings or {}),
+            "TargetDir": str(export_dir),
+            "CustomName": custom_name,
+            "FormatWidth": profile["w"],
+            "FormatHeight": profile["h"],
+        })
+        job_id = project.AddRenderJob()
+        jobs.append((profile, job_id, export_dir / f"{custom_name}.mp4"))
+
+        if job_id:
+            print(f"  ✅ {profile['name']:<9} {profile['w']}x{profile['h']} → {custom_name}.mp4")
+        else:
+            print(f"  ❌ {profile['name']:<9} failed to add render job")
+    return jobs
+
+
+def export_profiles(project, profiles, export_dir, base_name, settings=None, wait=True):
+    """
+    Queue every profile, render them as one batch, and optionally wait
+
+    Returns:
+        [(profile, job_id, output_path, status)]; status is None when not
+        waiting or when the job was never queued
+    """
+    export_dir.mkdir(parents=True, exist_ok=True)
+    project.SetCurrentRenderMode(1)  # Single clip per job
+
+    jobs = queue_exports(project, profiles, export_dir, base_name, settings)
+    job_ids = [job_id for _, job_id, _ in jobs if job_id]
+    if not job_ids:
+        return [(profile, job_id, path, None) for profile, job_id, path in jobs]
+
+    print(f"\nStarting {len(job_ids)} render job(s)...")
+    project.StartRendering(job_ids)
+
+    statuses = {}
+    if wait:
+        statuses = wait_for_renders(
+            project, job_ids, lambda progress: print(f"  Progress: {progress}%", end="\r")
+        )
+        print()
+
+    return [(profile, job_id, path, statuses.get(job_id)) for profile, job_id, path in jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the current timeline to several formats")
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILE_BY_NAME),
+                        default=list(PROFILE_BY_NAME), help="Formats to export (default: all)")
+    parser.add_argument("--no-wait", action="store_true",
+                        help="Return once rendering starts; don't wait for it")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Multi-Format Timeline Export")
+    print("=" * 60)
+
+    # Connect to Resolve
+    try:
+        resolve = get_resolve()
+    except ResolveError as e:
+        print(f"Error connecting to Resolve: {e}")
+        sys.exit(1)
+
+    project = resolve.GetProjectManager().GetCurrentProject()
+    if not project:
+        print("No project open!")
+        sys.exit(1)
+
+    timeline = project.GetCurrentTimeline()
+    if not timeline:
+        print("No timeline open!")
+        sys.exit(1)
+
+    print(f"\nProject: {project.GetName()}")
+    print(f"Timeline: {timeline.GetName()}")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base_name = f"{timeline.GetName()}_{timestamp}"
+
+    print(f"\nQueueing {len(args.profiles)} format(s) in {EXPORT_DIR}")
+    print("-" * 60)
+
+    results = export_profiles(
+        project,
+        [PROFILE_BY_NAME[name] for name in args.profiles],
+        EXPORT_DIR,
+        base_name,
+        wait=not args.no_wait,
+    )
+
+    if args.no_wait:
+        print("\nNot waiting; check the Deliver page for progress")
+        return
+
+    print("\n" + "=" * 60)
+    print("EXPORT SUMMARY")
+    print("=" * 60)
+    for profile, job_id, path, status in results:
+        if status and status.get("JobStatus") == "Complete":
+            size = f" ({path.stat().st_size / (1024 * 1024):.1f} MB)" if path.exists() else ""
+            print(f"  ✅ {profile['name']:<9} {path.name}{size}")
+        else:
+            print(f"  ❌ {profile['name']:<9} {status or 'not queued'}")
+
+
+if __name__ == "__main__":
+    main()
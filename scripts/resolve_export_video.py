@@ -4,29 +4,39 @@ Export Episode 1 video from DaVinci Resolve.
 Format: 1080x1920 (9:16 vertical), H.264, 30fps
 """
 
+import argparse
 import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from arthur.resolve.connect import get_resolve, ResolveError
+from arthur.resolve.render import check_disk_space, remux_passthrough, timeline_is_passthrough
+from resolve_export_multi import BASE_SETTINGS, PROFILE_BY_NAME, export_profiles
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Export Episode 1 from Resolve")
+    parser.add_argument("--no-wait", action="store_true",
+                        help="Return once the render starts; don't wait for it")
+    parser.add_argument("--passthrough", action="store_true",
+                        help="Stream-copy instead of rendering if the timeline is one "
+                             "ungraded source clip already at the export format")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Exporting Episode 1 Video")
     print("=" * 60)
 
     # Connect to Resolve
     try:
-        sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
-        import DaVinciResolveScript as dvr
-        resolve = dvr.scriptapp("Resolve")
-    except Exception as e:
+        resolve = get_resolve()
+    except ResolveError as e:
         print(f"Error connecting to Resolve: {e}")
         sys.exit(1)
 
-    if not resolve:
-        print("Could not connect to DaVinci Resolve!")
-        sys.exit(1)
-
     project_manager = resolve.GetProjectManager()
     project = project_manager.GetCurrentProject()
 
@@ -53,35 +63,33 @@ def main():
     print(f"\nExport path: {export_path}")
     print("-" * 60)
 
-    # Set up render job
-    project.SetCurrentRenderMode(0)  # Individual clips mode = 0, Single clip = 1
-
-    # Get the render preset or set custom settings
-    render_settings = {
-        "SelectAllFrames": True,
-        "TargetDir": str(export_dir),
-        "CustomName": export_filename,
-        "ExportVideo": True,
-        "ExportAudio": False,  # No audio in this video
-        "FormatWidth": 1080,
-        "FormatHeight": 1920,
-        "FrameRate": "30",
-        # H.264 settings
-        "VideoCodec": "h264_main",
-        "VideoBitrate": "20000",  # 20 Mbps for high quality
-        "AudioCodec": "",
-    }
+    # Fail fast if the export volume can't hold the render
+    duration_seconds = (timeline.GetEndFrame() - timeline.GetStartFrame()) / float(BASE_SETTINGS["FrameRate"])
+    space_error = check_disk_space(export_dir, duration_seconds, int(BASE_SETTINGS["VideoBitrate"]))
+    if space_error:
+        print(f"❌ {space_error}")
+        sys.exit(1)
 
+    # Single untouched clip: remux the source instead of re-encoding it
+    profile = dict(PROFILE_BY_NAME["linkedin"], suffix="")
+    if args.passthrough and timeline_is_passthrough(
+        timeline, profile["w"], profile["h"], BASE_SETTINGS["FrameRate"]
+    ):
+        if remux_passthrough(timeline, export_path, audio=BASE_SETTINGS["ExportAudio"]):
+            print(f"\n✅ Video exported to: {export_path}")
+            print(f"   File size: {export_path.stat().st_size / (1024 * 1024):.1f} MB")
+            return
+        print("Falling back to Resolve render")
+
+    # Single-format run of the multi-export path (same settings, one profile)
     print("Render settings:")
-    for key, value in render_settings.items():
+    for key, value in {**BASE_SETTINGS, "FormatWidth": 1080, "FormatHeight": 1920}.items():
         print(f"  {key}: {value}")
 
-    # Apply render settings
-    project.SetRenderSettings(render_settings)
-
-    # Add render job to queue
     print("\nAdding render job to queue...")
-    job_id = project.AddRenderJob()
+    [(_, job_id, _, status)] = export_profiles(
+        project, [profile], export_dir, export_filename, wait=not args.no_wait
+    )
 
     if not job_id:
         print("❌ Failed to add render job")
@@ -92,28 +100,13 @@ def main():
         print("4. Click 'Render All'")
         sys.exit(1)
 
-    print(f"✅ Render job added: {job_id}")
-
-    # Start render
-    print("\nStarting render...")
-    project.StartRendering([job_id])
-
-    # Wait for render to complete
-    print("Rendering in progress...")
-
-    import time
-    while project.IsRenderingInProgress():
-        # Get progress
-        status = project.GetRenderJobStatus(job_id)
-        if status:
-            progress = status.get("CompletionPercentage", 0)
-            print(f"  Progress: {progress}%", end="\r")
-        time.sleep(1)
+    if args.no_wait:
+        print(f"Not waiting; render job {job_id} will write {export_path}")
+        return
 
     print("\n")
 
     # Check result
-    status = project.GetRenderJobStatus(job_id)
     if status and status.get("JobStatus") == "Complete":
         print("=" * 60)
         print("EXPORT COMPLETE")
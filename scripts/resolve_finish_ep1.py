@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Run the Episode 1 Resolve finishing scripts back to back, saving once.
+
+Each script normally calls project.SaveProject(), which serializes the whole
+project database. With RESOLVE_DEFER_SAVE=1 they skip it, and this driver
+saves a single time after the last one succeeds.
+
+Usage:
+  python3 scripts/resolve_finish_ep1.py
+  python3 scripts/resolve_finish_ep1.py resolve_add_transitions resolve_add_text_overlays
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, ResolveError
+
+SCRIPTS_DIR = Path(__file__).parent
+
+# Default finishing order: transitions, grade, then titles on track 2
+STEPS = [
+  "resolve_add_transitions",
+  "resolve_apply_color_grade",
+  "resolve_add_text_overlays",
+]
+
+
+def main():
+  steps = sys.argv[1:] or STEPS
+  env = {**os.environ, "RESOLVE_DEFER_SAVE": "1"}
+
+  for step in steps:
+    script = SCRIPTS_DIR / f"{Path(step).stem}.py"
+    result = subprocess.run([sys.executable, str(script)], env=env)
+    if result.returncode != 0:
+      print(f"\n❌ {script.name} failed (exit {result.returncode}); project not saved")
+      sys.exit(result.returncode)
+
+  # Single save for all steps
+  try:
+    resolve = get_resolve()
+  except ResolveError as e:
+    print(f"Error connecting to Resolve: {e}")
+    sys.exit(1)
+
+  project = resolve.GetProjectManager().GetCurrentProject()
+  if not project:
+    print("No project open!")
+    sys.exit(1)
+
+  if project.SaveProject():
+    print(f"\n✅ Saved {project.GetName()} after {len(steps)} step(s)")
+  else:
+    print(f"\n❌ SaveProject failed for {project.GetName()}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+  main()
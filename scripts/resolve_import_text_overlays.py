@@ -1,48 +1,57 @@
 #!/usr/bin/env python3
 """
 Import text overlay PNGs to DaVinci Resolve timeline track 2.
+
+With --dump-only the overlays go into the timeline manifest (track 2) for
+render_from_manifest.py instead, and Resolve is left unchanged.
 """
 
+import argparse
+import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Text overlays with their timeline positions (in frames @ 30fps)
-# (filename, start_frame, duration_frames)
-OVERLAY_POSITIONS = [
-    ("01_the_foundation.png", 0, 120),        # Shot 1: 0:00-0:04
-    ("02_1tb_memory.png", 360, 120),          # Shot 4: 0:12-0:16
-    ("03_160_cores.png", 480, 120),           # Shot 5: 0:16-0:20
-    ("04_dgx_spark.png", 600, 120),           # Shot 6: 0:20-0:24
-    ("05_1_petaflop.png", 840, 120),          # Shot 8: 0:28-0:32
-    ("06_128gb.png", 960, 120),               # Shot 9: 0:32-0:36
-    ("07_desktop_size.png", 1080, 120),       # Shot 10: 0:36-0:40
-    ("08_power_duo.png", 1200, 120),          # Shot 11: 0:40-0:44
-    ("09_petaflops.png", 1440, 120),          # Shot 13: 0:48-0:52
-    ("10_no_cloud.png", 1560, 120),           # Shot 14: 0:52-0:56
-    ("11_cta.png", 1680, 120),                # Shot 15: 0:56-1:00
-]
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arthur.resolve.connect import get_resolve, save_project, ResolveError
+from arthur.resolve.manifest import MANIFEST_PATH, load_manifest, write_manifest
+
+# Text overlays with their timeline positions (in frames @ 30fps), kept in
+# config/ep1_overlays.json so timing can change without editing this script
+OVERLAY_CONFIG = Path(__file__).parent / "config" / "ep1_overlays.json"
+
+
+@lru_cache(maxsize=None)
+def load_overlay_positions(path=OVERLAY_CONFIG):
+    """Parse an overlay list into (filename, start_frame, duration_frames) tuples"""
+    with open(path) as f:
+        return tuple((entry["file"], entry["start"], entry["duration"]) for entry in json.load(f))
+
 
 OVERLAY_DIR = Path("/Volumes/STUDIO/VIDEO/linkedin_series/stock_assets/text_overlays")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Import text overlay PNGs to video track 2")
+    parser.add_argument("--dump-only", action="store_true",
+                        help=f"Write the overlays to {MANIFEST_PATH} instead of the timeline")
+    args = parser.parse_args()
+
+    overlay_positions = load_overlay_positions()
+
     print("=" * 60)
     print("Importing Text Overlays to Timeline")
     print("=" * 60)
 
     # Connect to Resolve
     try:
-        sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
-        import DaVinciResolveScript as dvr
-        resolve = dvr.scriptapp("Resolve")
-    except Exception as e:
+        resolve = get_resolve()
+    except ResolveError as e:
         print(f"Error connecting to Resolve: {e}")
         sys.exit(1)
 
-    if not resolve:
-        print("Could not connect to DaVinci Resolve!")
-        sys.exit(1)
-
     project_manager = resolve.GetProjectManager()
     project = project_manager.GetCurrentProject()
 
@@ -61,6 +70,37 @@ def main():
     print(f"Timeline: {timeline.GetName()}")
     print(f"Source: {OVERLAY_DIR}")
 
+    # One directory read instead of a stat per file; a single missing file
+    # would otherwise make ImportMedia fail the whole batch
+    try:
+        with os.scandir(OVERLAY_DIR) as entries:
+            on_disk = {entry.name for entry in entries}
+    except FileNotFoundError:
+        on_disk = set()
+
+    if args.dump_only:
+        # Record the overlays on manifest track 2 (replacing any earlier dump
+        # of the same files, so reruns don't stack); the timeline is untouched
+        manifest = load_manifest(timeline, project=project)
+        overlays = [
+            {"name": filename, "src": str(OVERLAY_DIR / filename),
+             "in": 0, "out": duration, "record": start_frame}
+            for filename, start_frame, duration in overlay_positions
+            if filename in on_disk
+        ]
+        tracks = {track["track"]: track for track in manifest["video_tracks"]}
+        track = tracks.setdefault(2, {"track": 2, "items": []})
+        names = {item["name"] for item in overlays}
+        track["items"] = sorted(
+            [item for item in track["items"] if item["name"] not in names] + overlays,
+            key=lambda item: item["record"],
+        )
+        manifest["video_tracks"] = [tracks[index] for index in sorted(tracks)]
+        for filename in sorted({name for name, _, _ in overlay_positions} - on_disk):
+            print(f"  ⚠️  {filename} - missing on disk, skipping")
+        print(f"\n✅ {len(overlays)} overlays written to {write_manifest(manifest)}")
+        return
+
     # Ensure we have video track 2
     track_count = timeline.GetTrackCount("video")
     while track_count < 2:
@@ -86,11 +126,18 @@ def main():
     media_pool.SetCurrentFolder(text_bin)
 
     # Import all overlay PNGs
-    print(f"\nImporting {len(OVERLAY_POSITIONS)} text overlay files...")
+    print(f"\nImporting {len(overlay_positions)} text overlay files...")
     print("-" * 60)
 
-    overlay_files = [str(OVERLAY_DIR / filename) for filename, _, _ in OVERLAY_POSITIONS]
-    imported = media_pool.ImportMedia(overlay_files)
+    overlay_files, missing = [], set()
+    for filename, _, _ in overlay_positions:
+        if filename in on_disk:
+            overlay_files.append(str(OVERLAY_DIR / filename))
+        else:
+            missing.add(filename)
+            print(f"  ⚠️  {filename} - missing on disk, skipping")
+
+    imported = media_pool.ImportMedia(overlay_files) if overlay_files else None
 
     if not imported:
         print("❌ Failed to import media files")
@@ -98,11 +145,13 @@ def main():
 
     print(f"Imported {len(imported)} files to media pool")
 
-    # Create a mapping of filename to media pool item
-    clip_map = {}
-    for clip in imported:
-        clip_name = clip.GetName()
-        clip_map[clip_name] = clip
+    # Index imported items by exact basename and stem (ImportMedia keeps the
+    # file's basename; some builds drop the extension from the clip name)
+    clip_by_basename = {
+        Path(clip.GetClipProperty("File Path") or clip.GetName()).name: clip
+        for clip in imported
+    }
+    clip_by_stem = {Path(name).stem: clip for name, clip in clip_by_basename.items()}
 
     # Add each overlay to timeline at correct position
     print(f"\nAdding overlays to video track 2...")
@@ -111,50 +160,48 @@ def main():
     added = 0
     failed = 0
 
-    for filename, start_frame, duration in OVERLAY_POSITIONS:
-        clip_name = filename.replace(".png", "")
-
-        # Find the clip in our imported items
-        clip = None
-        for name, c in clip_map.items():
-            if clip_name in name or filename in name:
-                clip = c
-                break
-
-        if not clip:
-            print(f"  ❌ {filename} - not found in media pool")
-            failed += 1
-            continue
+    try:
+        # Pass 1: resolve clips and build every clip info
+        clip_infos = []
+        queued = []
+        for filename, start_frame, duration in overlay_positions:
+            # Find the clip in our imported items
+            clip = clip_by_basename.get(filename) or clip_by_stem.get(Path(filename).stem)
+
+            if not clip:
+                reason = "missing on disk" if filename in missing else "not found in media pool"
+                print(f"  ❌ {filename} - {reason}")
+                failed += 1
+                continue
 
-        try:
-            # Create clip info for AppendToTimeline
-            clip_info = {
+            clip_infos.append({
                 "mediaPoolItem": clip,
                 "startFrame": 0,
                 "endFrame": duration,
                 "trackIndex": 2,
                 "recordFrame": start_frame,
-            }
+            })
+            queued.append((filename, start_frame))
 
-            # Append to timeline
-            result = media_pool.AppendToTimeline([clip_info])
+        # Pass 2: one AppendToTimeline for all overlays; Resolve returns the
+        # items it placed, in order, so anything past that count failed
+        try:
+            results = media_pool.AppendToTimeline(clip_infos) if clip_infos else []
+            error = None
+        except Exception as e:
+            results, error = [], e
 
-            if result:
+        placed = len(results or [])
+        for n, (filename, start_frame) in enumerate(queued):
+            if n < placed:
                 added += 1
                 print(f"  ✅ {filename} @ frame {start_frame}")
             else:
                 failed += 1
-                print(f"  ❌ {filename} - append failed")
-
-        except Exception as e:
-            failed += 1
-            print(f"  ❌ {filename} - {e}")
-
-    # Save project
-    try:
-        project.SaveProject()
-    except:
-        pass
+                print(f"  ❌ {filename} - {error or 'append failed'}")
+    finally:
+        # One save even if a clip raises mid-loop
+        save_project(project)
 
     print("\n" + "=" * 60)
     print("TEXT OVERLAY IMPORT COMPLETE")
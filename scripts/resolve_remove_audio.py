@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 """
 Remove audio tracks from the current DaVinci Resolve timeline.
+
+With --dump-only the timeline is left untouched; the audio removal is
+recorded in the timeline manifest for render_from_manifest.py instead.
 """
 
+import argparse
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from arthur.resolve.controller import ResolveController
+from arthur.resolve.manifest import MANIFEST_PATH, load_manifest, write_manifest
 
 def main():
+  parser = argparse.ArgumentParser(description="Remove audio from the current timeline")
+  parser.add_argument("--dump-only", action="store_true",
+                      help=f"Write the edit to {MANIFEST_PATH} instead of changing the timeline")
+  args = parser.parse_args()
+
   print("Connecting to DaVinci Resolve...")
   resolve = ResolveController()
   resolve.connect()
@@ -23,6 +33,12 @@ def main():
 
   print(f"Timeline: {timeline.GetName()}")
 
+  if args.dump_only:
+    manifest = load_manifest(timeline)
+    manifest["audio_tracks"] = []
+    print(f"✅ Manifest without audio written to {write_manifest(manifest)}")
+    return
+
   # Get audio track count
   audio_track_count = timeline.GetTrackCount("audio")
   print(f"Audio tracks found: {audio_track_count}")
@@ -32,22 +48,28 @@ def main():
     return
 
   # Delete items from each audio track
-  for track_num in range(1, audio_track_count + 1):
-    items = timeline.GetItemListInTrack("audio", track_num)
-    if items:
-      print(f"  Track {track_num}: {len(items)} items")
-      for item in items:
-        # Delete the item
-        timeline.DeleteClips([item])
-        print(f"    Deleted: {item.GetName() if hasattr(item, 'GetName') else 'clip'}")
-    else:
-      print(f"  Track {track_num}: empty")
+  try:
+    for track_num in range(1, audio_track_count + 1):
+      items = timeline.GetItemListInTrack("audio", track_num)
+      if items:
+        print(f"  Track {track_num}: {len(items)} items")
+        # Names first: the items are gone once DeleteClips returns
+        names = [item.GetName() if hasattr(item, 'GetName') else 'clip' for item in items]
+        if timeline.DeleteClips(items):
+          for name in names:
+            print(f"    Deleted: {name}")
+        else:
+          print(f"    ❌ DeleteClips failed for track {track_num}")
+      else:
+        print(f"  Track {track_num}: empty")
+  finally:
+    # One save even if a clip raises mid-loop
+    resolve.save_project()
 
   # Try to delete the audio tracks themselves
   # Note: Resolve API may not support track deletion directly
   print("\nAudio items removed. Empty tracks may remain (delete manually if needed).")
 
-  resolve.save_project()
   print("✅ Done!")
 
 if __name__ == "__main__":
@@ -6,17 +6,23 @@ This script:
 1. Identifies still images (not video) on the timeline
 2. Creates Fusion compositions on each
 3. Adds the Parallax node structure with keyframes
-4. You just need to adjust the mask position per clip
+4. You just need to connect MediaIn/MediaOut and adjust the mask per clip
 
 Usage:
   python scripts/resolve_setup_parallax.py
+  python scripts/resolve_setup_parallax.py --serial   # one clip at a time
 """
 
+import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from arthur.resolve.connect import get_resolve, save_project, ResolveError
+
 # Still image filenames (from our shot list)
 STILL_IMAGE_CLIPS = [
   "mac_studio_spec_bg.png",
@@ -33,6 +39,12 @@ STILL_IMAGE_CLIPS = [
   "data_flow_viz.png",
 ]
 
+# Exact-name lookup; stems too, for Resolve builds that drop the extension
+STILL_IMAGE_SET = frozenset(STILL_IMAGE_CLIPS) | frozenset(Path(name).stem for name in STILL_IMAGE_CLIPS)
+
+# Stills carrying baked-in text/graphics get the no-parallax config
+INFOGRAPHIC_MARKERS = ("spec_bg", "comparison_bg", "data_flow")
+
 # Parallax settings per clip type
 PARALLAX_CONFIGS = {
   "default": {
@@ -64,11 +76,62 @@ PARALLAX_CONFIGS = {
 
 def get_config_for_clip(clip_name: str) -> dict:
   """Get parallax config based on clip type"""
-  if "spec_bg" in clip_name or "comparison_bg" in clip_name or "data_flow" in clip_name:
+  if any(marker in clip_name for marker in INFOGRAPHIC_MARKERS):
     return PARALLAX_CONFIGS["infographic"]
   return PARALLAX_CONFIGS["default"]
 
 
+# Fusion macro holding the full 5-node parallax graph (read once at import)
+PARALLAX_TEMPLATE_PATH = Path(__file__).parent / "fusion" / "parallax_2_5d.setting"
+PARALLAX_TEMPLATE = PARALLAX_TEMPLATE_PATH.read_text() if PARALLAX_TEMPLATE_PATH.exists() else None
+
+
+@lru_cache(maxsize=1)
+def parallax_template():
+  """PARALLAX_TEMPLATE parsed into a Fusion settings table, or None"""
+  if not PARALLAX_TEMPLATE:
+    return None
+  try:
+    import DaVinciResolveScript as dvr  # fusionscript; loaded by get_resolve()
+  except ImportError:
+    return None
+  readstring = getattr(dvr, "readstring", None)
+  return readstring(PARALLAX_TEMPLATE) if readstring else None
+
+
+def paste_parallax_tools(comp):
+  """
+  Instantiate the parallax graph with one Paste; (bg_blur, bg_transform,
+  fg_mask, fg_transform) or None when pasting isn't available
+  """
+  template = parallax_template()
+  if template is None or not comp.Paste(template):
+    return None
+  tools = tuple(comp.FindTool(name) for name in ("BgBlur", "BgTransform", "FgMask", "FgTransform"))
+  return tools if all(tools) else None
+
+
+def add_parallax_tools(comp, with_mask: bool):
+  """Fallback: build the parallax graph tool by tool"""
+  # Background path: Blur + Transform
+  bg_blur = comp.AddTool("Blur", -200, 0)
+  bg_transform = comp.AddTool("Transform", -100, 0)
+
+  # Foreground path: Ellipse Mask + Transform
+  fg_mask = fg_transform = None
+  if with_mask:
+    fg_mask = comp.AddTool("EllipseMask", -200, 100)
+    fg_transform = comp.AddTool("Transform", -100, 100)
+
+  # Merge node
+  comp.AddTool("Merge", 0, 50)
+
+  # Connect nodes
+  # Note: Actual connection depends on Fusion API specifics
+  # This is a template that may need adjustment
+  return bg_blur, bg_transform, fg_mask, fg_transform
+
+
 def setup_parallax_fusion(fusion_comp, clip_duration_frames: int, config: dict):
   """
   Set up Parallax 2.5D nodes in a Fusion composition.
@@ -77,40 +140,33 @@ def setup_parallax_fusion(fusion_comp, clip_duration_frames: int, config: dict):
     MediaIn → Background (Blur + Transform)  ─┐
                                                ├→ Merge → MediaOut
     MediaIn → Foreground (Mask + Transform)  ─┘
+
+  Clips with a foreground mask get the whole graph from the .setting macro
+  in a single Paste, then only the per-clip values are pushed; AddTool is
+  the fallback.
+
+  Returns:
+    None on success, else the error (returned rather than printed, since
+    clips are set up on worker threads)
   """
   if not fusion_comp:
-    return False
+    return "no Fusion composition"
 
   # Get the composition
   comp = fusion_comp
-
-  # Clear existing nodes (except MediaIn/MediaOut)
-  # Note: This is a simplified approach
+  with_mask = config["mask_width"] > 0
 
   # Create nodes using Fusion's API
   try:
-    # Background path: Blur + Transform
-    bg_blur = comp.AddTool("Blur", -200, 0)
-    bg_blur.SetInput("XBlurSize", config["bg_blur"] / 1000.0)
-
-    bg_transform = comp.AddTool("Transform", -100, 0)
+    tools = paste_parallax_tools(comp) if with_mask else None
+    bg_blur, bg_transform, fg_mask, fg_transform = tools or add_parallax_tools(comp, with_mask)
 
-    # Foreground path: Ellipse Mask + Transform
-    if config["mask_width"] > 0:
-      fg_mask = comp.AddTool("EllipseMask", -200, 100)
+    bg_blur.SetInput("XBlurSize", config["bg_blur"] / 1000.0)
+    if with_mask:
       fg_mask.SetInput("Width", config["mask_width"])
       fg_mask.SetInput("Height", config["mask_height"])
       fg_mask.SetInput("SoftEdge", config["mask_softness"])
 
-      fg_transform = comp.AddTool("Transform", -100, 100)
-
-    # Merge node
-    merge = comp.AddTool("Merge", 0, 50)
-
-    # Connect nodes
-    # Note: Actual connection depends on Fusion API specifics
-    # This is a template that may need adjustment
-
     # Set keyframes on background transform
     # Frame 0
     bg_transform.SetInput("Center", [0.5, 0.5], 0)
@@ -125,38 +181,76 @@ def setup_parallax_fusion(fusion_comp, clip_duration_frames: int, config: dict):
     bg_transform.SetInput("Size", config["bg_scale_end"], end_frame)
 
     # Set keyframes on foreground transform (if using mask)
-    if config["mask_width"] > 0:
+    if with_mask:
       fg_transform.SetInput("Center", [0.5, 0.5], 0)
       fg_transform.SetInput("Center", [
         0.5 + config["fg_drift_x"],
         0.5 + config["fg_drift_y"]
       ], end_frame)
 
-    return True
+    return None
 
   except Exception as e:
-    print(f"    Error setting up Fusion nodes: {e}")
-    return False
+    return e
+
+
+def process_clip(i: int, item):
+  """
+  Give one still-image timeline clip a Fusion comp with the parallax graph
+
+  Returns:
+    (ok, lines): ok is True when the clip's nodes are built; lines is the
+    clip's report, printed by the caller once all clips are done
+  """
+  clip_name = item.GetName()
+  duration = item.GetDuration()  # In frames
+
+  # Check if this is a still image we should process
+  if Path(clip_name).name not in STILL_IMAGE_SET:
+    return False, [f"[{i+1}] {clip_name} - SKIPPED (video clip)"]
+
+  lines = [f"[{i+1}] {clip_name} ({duration} frames)"]
+
+  # Check if clip already has Fusion composition
+  fusion_comp = item.GetFusionCompByIndex(1)
+
+  if fusion_comp is None:
+    # Create new Fusion composition
+    lines.append(f"    Creating Fusion composition...")
+    item.AddFusionComp()
+    fusion_comp = item.GetFusionCompByIndex(1)
+
+  if not fusion_comp:
+    lines.append(f"    ❌ Could not create Fusion composition")
+    return False, lines
+
+  lines.append(f"    Setting up Parallax nodes...")
+  error = setup_parallax_fusion(fusion_comp, duration, get_config_for_clip(clip_name))
+  if error is not None:
+    lines.append(f"    ❌ Could not build the Parallax nodes: {error}")
+    return False, lines
+
+  lines.append(f"    ✅ Parallax nodes ready - connect MediaIn/MediaOut and adjust mask")
+  return True, lines
 
 
 def main():
+  parser = argparse.ArgumentParser(description="Set up Parallax 2.5D on still image clips")
+  parser.add_argument("--serial", action="store_true",
+                      help="Process clips one at a time (if Resolve rejects concurrent calls)")
+  args = parser.parse_args()
+
   print("=" * 60)
   print("Parallax 2.5D Setup for Episode 1")
   print("=" * 60)
 
   # Import Resolve API
   try:
-    sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
-    import DaVinciResolveScript as dvr
-    resolve = dvr.scriptapp("Resolve")
-  except Exception as e:
+    resolve = get_resolve()
+  except ResolveError as e:
     print(f"Error connecting to Resolve: {e}")
     sys.exit(1)
 
-  if not resolve:
-    print("Could not connect to DaVinci Resolve!")
-    sys.exit(1)
-
   # Get current project and timeline
   project_manager = resolve.GetProjectManager()
   project = project_manager.GetCurrentProject()
@@ -182,55 +276,24 @@ def main():
   print(f"\nFound {len(video_items)} clips on timeline")
   print("-" * 60)
 
-  # Process each clip
+  # Each clip's comp is independent, so overlap the per-clip RPC round-trips;
+  # results come back in timeline order for printing
+  try:
+    with ThreadPoolExecutor(max_workers=1 if args.serial else 4) as pool:
+      results = list(pool.map(lambda spec: process_clip(*spec), enumerate(video_items)))
+  finally:
+    # One save even if a clip raises mid-loop
+    save_project(project)
+
   processed = 0
   skipped = 0
-
-  for i, item in enumerate(video_items):
-    clip_name = item.GetName()
-    duration = item.GetDuration()  # In frames
-
-    # Check if this is a still image we should process
-    is_still = any(still in clip_name for still in STILL_IMAGE_CLIPS)
-
-    if not is_still:
-      print(f"[{i+1}] {clip_name} - SKIPPED (video clip)")
-      skipped += 1
-      continue
-
-    print(f"[{i+1}] {clip_name} ({duration} frames)")
-
-    # Get config for this clip
-    config = get_config_for_clip(clip_name)
-
-    # Check if clip already has Fusion composition
-    fusion_comp = item.GetFusionCompByIndex(1)
-
-    if fusion_comp is None:
-      # Create new Fusion composition
-      print(f"    Creating Fusion composition...")
-      item.AddFusionComp()
-      fusion_comp = item.GetFusionCompByIndex(1)
-
-    if fusion_comp:
-      print(f"    Setting up Parallax nodes...")
-      # Note: Direct Fusion node manipulation is complex
-      # For now, we'll just ensure the Fusion comp exists
-      # and provide manual instructions
-
-      # The Fusion API for adding nodes programmatically requires
-      # accessing the composition's flow and adding tools
-      # This varies by Resolve version
-
+  for ok, lines in results:
+    print("\n".join(lines))
+    if ok:
       processed += 1
-      print(f"    ✅ Fusion comp ready - adjust mask manually")
     else:
-      print(f"    ❌ Could not create Fusion composition")
       skipped += 1
 
-  # Save project
-  project.SaveProject()
-
   print("\n" + "=" * 60)
   print("SETUP COMPLETE")
   print("=" * 60)
@@ -240,31 +303,17 @@ def main():
   print("""
 NEXT STEPS:
 
-For each processed clip:
+For each processed clip the script has added the parallax nodes
+(Blur → Transform for the background, EllipseMask → Transform for the
+foreground, and a Merge) with the drift/scale keyframes already set.
+
 1. Select clip → Fusion page
-2. You'll see MediaIn and MediaOut nodes
-3. Add these nodes between them:
-
-   [Add Tool → Blur]
-   [Add Tool → Transform] (for background)
-   [Add Tool → EllipseMask]
-   [Add Tool → Transform] (for foreground)
-   [Add Tool → Merge]
-
-4. Connect:
-   MediaIn → Blur → Transform(BG) → Merge(Background)
-   MediaIn → EllipseMask → Transform(FG) → Merge(Foreground)
+2. Connect the graph between MediaIn and MediaOut:
+   MediaIn → Blur (background path) and MediaIn → foreground Transform
    Merge → MediaOut
+3. Adjust the EllipseMask to cover the product area
 
-5. On Background Transform:
-   - Frame 0: Size=1.02, Center=(0.5, 0.5)
-   - Frame 120: Size=1.04, Center=(0.48, 0.51)
-
-6. On Foreground Transform:
-   - Frame 0: Center=(0.5, 0.5)
-   - Frame 120: Center=(0.51, 0.5)
-
-7. Adjust EllipseMask to cover the product area
+Infographic stills get the background path only (subtle scale, no mask).
 """)
 
 